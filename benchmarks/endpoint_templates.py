@@ -0,0 +1,53 @@
+"""
+Microbenchmark of the URL preparation done on every request.
+
+Compares the previous path (lowercase + re.sub of :workspaceid, then urljoin in
+BaseURLSession) with the precompiled endpoint templates.
+
+    python -m benchmarks.endpoint_templates
+"""
+
+import timeit
+from urllib.parse import urljoin
+
+from santander_sdk.api_client.client import SantanderApiClient, prepare_url
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import PIX, RECEIPTS
+
+BASE_URL = "https://trust-open.api.santander.com.br"
+WORKSPACE_ID = "8e33d56c-204f-461e-aebe-08baaab6479e"
+ENDPOINTS = {
+    "pix": f"{PIX.path}/b8e2c7b8-2e8e-4e2c-8e6e-2e8e4e2c8e6e",
+    "receipt": RECEIPTS.format("VXB123456789ABCFEF", "file_requests", "123456"),
+}
+NUMBER = 200_000
+
+
+def legacy_url(endpoint: str) -> str:
+    return urljoin(BASE_URL, prepare_url(endpoint, WORKSPACE_ID))
+
+
+def main():
+    client = SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="benchmark",
+            client_secret="secret",
+            cert="",
+            base_url=BASE_URL,
+            workspace_id=WORKSPACE_ID,
+        )
+    )
+    for name, endpoint in ENDPOINTS.items():
+        assert legacy_url(endpoint) == client._prepare_url(endpoint)
+        legacy = timeit.timeit(lambda: legacy_url(endpoint), number=NUMBER)
+        templates = timeit.timeit(lambda: client._prepare_url(endpoint), number=NUMBER)
+        print(
+            f"{name:8} legacy {legacy / NUMBER * 1e6:6.2f}us"
+            f"  templates {templates / NUMBER * 1e6:6.2f}us"
+            f"  ({legacy / templates:.1f}x faster)"
+        )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
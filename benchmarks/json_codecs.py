@@ -0,0 +1,95 @@
+"""
+Benchmark of the JSON codecs on realistic ListPaymentsResponse pages.
+
+Pages have the shape returned by the payment receipts listing, with 1000
+payments (the page size used by payment_list), 100 and 10.
+
+    python -m benchmarks.json_codecs
+"""
+
+import timeit
+
+from santander_sdk.api_client.json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+)
+from santander_sdk.typing.receipts_types import ListPaymentsResponse
+
+RECEIPTS_URL = "https://trust-open.api.santander.com.br/consult_payment_receipts/v1/payment_receipts"
+PAGE_SIZES = (1000, 100, 10)
+
+
+def payment_receipt(i: int) -> dict:
+    return {
+        "payment": {
+            "paymentId": f"VXB{i:015d}",
+            "commitmentNumber": f"{i:012d}",
+            "payer": {
+                "person": {
+                    "document": {
+                        "documentTypeCode": "CNPJ",
+                        "documentNumber": "12345678901234",
+                    }
+                }
+            },
+            "payee": {"name": f"BENEFICIÁRIO {i} LTDA"},
+            "paymentAmountInfo": {
+                "direct": {"amount": f"{i % 9000 + 10}.{i % 100:02d}"}
+            },
+            "requestValueDate": "2025-02-07T17:26:57-03:00",
+        },
+        "category": {"code": "PIX" if i % 3 else "BOLETOS"},
+        "channel": {"code": "GATEWAY DE PAGAMENTOS - VX"},
+    }
+
+
+def list_payments_page(size: int) -> ListPaymentsResponse:
+    return {
+        "paymentsReceipts": [payment_receipt(i) for i in range(size)],
+        "links": {
+            "_first": {"href": f"{RECEIPTS_URL}?_offset=0&_limit={size}"},
+            "_prev": None,
+            "_next": {"href": f"{RECEIPTS_URL}?_offset={size}&_limit={size}"},
+        },
+    }
+
+
+def available_codecs() -> list[JsonCodec]:
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    for codec_class in (OrjsonCodec, MsgspecJsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.__name__} not installed, skipping")
+    return codecs
+
+
+def bench(func, number: int) -> float:
+    """Best per-call time, in microseconds, of 5 runs."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    codecs = available_codecs()
+    stdlib = codecs[0]
+    for size in PAGE_SIZES:
+        page = list_payments_page(size)
+        body = stdlib.dumps(page)
+        number = max(20_000 // size, 10)
+        print(f"\nListPaymentsResponse with {size} payments ({len(body):,} bytes)")
+        baseline = None
+        for codec in codecs:
+            assert codec.loads(body) == page
+            decode = bench(lambda: codec.loads(body), number)
+            encode = bench(lambda: codec.dumps(page), number)
+            baseline = baseline or decode
+            print(
+                f"  {codec.name:8} decode {decode:9.1f}us  encode {encode:9.1f}us"
+                f"  ({baseline / decode:.1f}x decode vs json)"
+            )
+
+
+if __name__ == "__main__":
+    main()
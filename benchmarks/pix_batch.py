@@ -0,0 +1,117 @@
+"""
+Throughput of PIX payouts: a transfer_pix loop against transfer_pix_batch.
+
+Runs against the in-process fake server of the tests, answering each request
+after LATENCY seconds. Payments are created PENDING_VALIDATION and get
+READY_TO_PAY VALIDATION seconds later; once confirmed they stay
+PENDING_CONFIRMATION for SETTLEMENT seconds before PAYED. The polling interval
+is shortened to POLL_INTERVAL seconds.
+
+    python -m benchmarks.pix_batch
+"""
+
+import threading
+from decimal import Decimal as D
+from time import monotonic
+
+from santander_sdk import pix_batch, transfer_flow
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.pix import transfer_pix
+from santander_sdk.pix_batch import transfer_pix_batch
+from tests.mock.fake_server import fake_santander_server
+
+LATENCY = 0.02
+VALIDATION = 0.3
+SETTLEMENT = 0.3
+POLL_INTERVAL = 0.1
+SEQUENTIAL_ITEMS = 20
+BATCH_ITEMS = 500
+WORKERS = (8, 32, 128)
+WORKSPACE_ID = "8e33d56c-204f-461e-aebe-08baaab6479e"
+
+
+class PixRoute:
+    """Payments validated and settled after a while, like the clearing houses."""
+
+    def __init__(self):
+        self.payments: dict[str, tuple[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, body):
+        if path.endswith("/token"):
+            return 200, {}, {"access_token": "TOKEN", "expires_in": 900}
+        with self.lock:
+            if method == "POST":
+                pix_id = f"PIX{len(self.payments)}"
+                self.payments[pix_id] = ("PENDING_VALIDATION", monotonic())
+            else:
+                pix_id = path.rsplit("/", 1)[1]
+                if method == "PATCH":
+                    self.payments[pix_id] = ("PENDING_CONFIRMATION", monotonic())
+            return 200, {}, {"id": pix_id, "status": self.status(pix_id)}
+
+    def status(self, pix_id: str) -> str:
+        status, since = self.payments[pix_id]
+        elapsed = monotonic() - since
+        if status == "PENDING_VALIDATION" and elapsed >= VALIDATION:
+            return "READY_TO_PAY"
+        if status == "PENDING_CONFIRMATION" and elapsed >= SETTLEMENT:
+            return "PAYED"
+        return status
+
+
+def new_client(base_url: str, pool_maxsize: int) -> SantanderApiClient:
+    return SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="benchmark",
+            client_secret="secret",
+            cert="",
+            base_url=base_url,
+            workspace_id=WORKSPACE_ID,
+            log_request_response_level="NONE",
+            pool_maxsize=pool_maxsize,
+        )
+    )
+
+
+def pix_items(count: int) -> list:
+    return [
+        {"pix_key": "12345678909", "value": D("10.00"), "description": f"Payout {i}"}
+        for i in range(count)
+    ]
+
+
+def report(name: str, count: int, elapsed: float):
+    print(f"{name:26} {count:5} payouts in {elapsed:6.2f}s  {count / elapsed:7.1f}/s")
+
+
+def main():
+    transfer_flow.UPDATE_STATUS_INTERVAL_TIME = POLL_INTERVAL
+    pix_batch.UPDATE_STATUS_INTERVAL_TIME = POLL_INTERVAL
+    with fake_santander_server(PixRoute(), delay=LATENCY) as server:
+        client = new_client(server.url, 1)
+        start = monotonic()
+        for item in pix_items(SEQUENTIAL_ITEMS):
+            assert transfer_pix(client, **item)["success"]
+        report("transfer_pix loop", SEQUENTIAL_ITEMS, monotonic() - start)
+        client.close()
+
+        for pipelined in (False, True):
+            for workers in WORKERS:
+                client = new_client(server.url, workers)
+                summary = transfer_pix_batch(
+                    client, pix_items(BATCH_ITEMS), workers, pipelined=pipelined
+                ).wait()
+                assert summary["succeeded"] == BATCH_ITEMS
+                mode = "pipelined" if pipelined else "batch"
+                report(
+                    f"{mode}, {workers} workers",
+                    BATCH_ITEMS,
+                    summary["elapsed_seconds"],
+                )
+                client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.async_client import AsyncSantanderApiClient
+from santander_sdk.api_client.client_pool import SantanderClientPool
 from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
 from santander_sdk.api_client.helpers import (
     get_pix_key_type,
     document_type,
 )
 
-from santander_sdk.pix import transfer_pix, get_transfer
+from santander_sdk.pix import transfer_pix, submit_transfer_pix, get_transfer
+from santander_sdk.pix_handle import PixTransferHandle
+from santander_sdk.pix_batch import transfer_pix_batch
 from santander_sdk.types import SantanderBeneficiary
 from santander_sdk.typing.receipts_types import (
     ListPaymentParams,
@@ -27,12 +31,17 @@ from santander_sdk.api_client.exceptions import (
 
 __all__ = [
     "SantanderApiClient",
+    "AsyncSantanderApiClient",
+    "SantanderClientPool",
     "SantanderClientConfiguration",
     # Pix
     "SantanderBeneficiary",
     "get_pix_key_type",
     "document_type",
     "transfer_pix",
+    "submit_transfer_pix",
+    "PixTransferHandle",
+    "transfer_pix_batch",
     "get_transfer",
     # payment_receipts
     "payment_list",
@@ -0,0 +1,282 @@
+import asyncio
+import json
+import logging
+import ssl
+from datetime import datetime, timedelta
+
+from santander_sdk.api_client.auth import SantanderAuth
+from santander_sdk.api_client.client import prepare_url
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.exceptions import (
+    SantanderClientError,
+    SantanderRequestError,
+)
+from santander_sdk.api_client.helpers import try_parse_response_to_json
+from santander_sdk.api_client.request_logging import (
+    log_request_error,
+    log_request_success,
+)
+from santander_sdk.api_client.single_flight import AsyncSingleFlight, request_key
+from santander_sdk.api_client.workspaces import (
+    WORKSPACES_ENDPOINT,
+    first_workspace_id_of_type,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncSantanderAuth:
+    """Token management of SantanderAuth for the asyncio client.
+
+    Renewal is single-flight per event loop: one task posts to the token endpoint
+    while the others wait for it, or keep using a token inside the
+    BEFORE_EXPIRE_TOKEN grace window.
+    """
+
+    TOKEN_ENDPOINT = SantanderAuth.TOKEN_ENDPOINT
+    TIMEOUT_SECS = SantanderAuth.TIMEOUT_SECS
+    BEFORE_EXPIRE_TOKEN = SantanderAuth.BEFORE_EXPIRE_TOKEN
+
+    def __init__(self, client_id: str, client_secret: str):
+        self.client_id = client_id
+        self.client_secret = client_secret
+
+        self._token = None
+        self.expires_at = None
+        self._renew_lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config: SantanderClientConfiguration):
+        return cls(client_id=config.client_id, client_secret=config.client_secret)
+
+    @property
+    def is_expired(self):
+        if not self.expires_at:
+            return True
+
+        return datetime.now() > self.expires_at - self.BEFORE_EXPIRE_TOKEN
+
+    @property
+    def is_in_grace_window(self):
+        if not self.expires_at:
+            return False
+
+        return self.is_expired and datetime.now() < self.expires_at
+
+    async def auth_headers(self, http: "httpx.AsyncClient") -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {await self.get_token(http)}",
+            "X-Application-Key": self.client_id,
+        }
+
+    async def get_token(self, http: "httpx.AsyncClient") -> str | None:
+        if self.is_expired:
+            if self.is_in_grace_window and self._renew_lock.locked():
+                return self._token
+
+            async with self._renew_lock:
+                if self.is_expired:
+                    await self.renew(http)
+
+        return self._token
+
+    async def renew(self, http: "httpx.AsyncClient"):
+        response = await http.post(
+            self.TOKEN_ENDPOINT,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "grant_type": "client_credentials",
+            },
+            timeout=self.TIMEOUT_SECS,
+        )
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            error_data = _try_parse_json(response) or {}
+            raise SantanderRequestError(
+                error_data.get("error_description", str(e)),
+                status_code=response.status_code,
+                content=error_data,
+            ) from e
+
+        data = response.json()
+        self._token = data["access_token"]
+        self.expires_at = datetime.now() + timedelta(seconds=data["expires_in"])
+
+
+class AsyncSantanderApiClient:
+    """
+    Cliente asyncio para a API do Santander, equivalente ao SantanderApiClient.
+
+    Requer o extra "async" (pip install santander-python-sdk[async]), que instala o httpx.
+
+    - Os métodos get, post, put, patch e delete são coroutines e aceitam os mesmos
+      endpoints do cliente síncrono, inclusive o slug :workspaceid.
+    - Sem workspace_id na configuração, o workspace é obtido na primeira requisição
+      que usar o slug :workspaceid e guardado no workspace_cache da configuração.
+    - Com coalesce_gets=True (padrão), GETs idênticos feitos por várias tasks ao mesmo
+      tempo viram uma só requisição, como no cliente síncrono.
+    - Os timeouts de conexão e leitura são os da configuração (connect_timeout e
+      read_timeout), como no cliente síncrono.
+    - Erros HTTP e de conexão são lançados como SantanderRequestError.
+    - Um transport do httpx pode ser informado (ex.: testes); nesse caso o certificado
+      da configuração não é carregado pelo cliente.
+    - Use aclose() (ou "async with") para liberar as conexões.
+    """
+
+    def __init__(
+        self,
+        config: SantanderClientConfiguration,
+        transport: "httpx.AsyncBaseTransport | None" = None,
+    ):
+        if httpx is None:
+            raise SantanderClientError(
+                "httpx não instalado, use pip install santander-python-sdk[async]"
+            )
+
+        self.config = config
+        self.logger = config.logger or logging.getLogger(__name__)
+        self.auth = AsyncSantanderAuth.from_config(config)
+        self._workspace_lock = asyncio.Lock()
+        self.single_flight = AsyncSingleFlight() if config.coalesce_gets else None
+        self.http = httpx.AsyncClient(
+            base_url=config.base_url,
+            transport=transport or self._build_transport(config),
+            timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+        )
+
+    @staticmethod
+    def _build_transport(config: SantanderClientConfiguration):
+        ssl_context = ssl.create_default_context()
+        ssl_context.load_cert_chain(config.cert)
+        limits = httpx.Limits(
+            max_connections=config.pool_maxsize if config.pool_block else None,
+            max_keepalive_connections=config.pool_maxsize,
+        )
+        return httpx.AsyncHTTPTransport(verify=ssl_context, limits=limits)
+
+    async def aclose(self):
+        await self.http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def get(self, endpoint: str, params: dict | None = None) -> dict:
+        if self.single_flight is None:
+            return await self._request("GET", endpoint, params=params)
+
+        url = await self._prepare_url(endpoint)
+        return await self.single_flight.do(
+            request_key("GET", url, params),
+            lambda: self._request("GET", url, params=params),
+        )
+
+    async def post(self, endpoint: str, data: dict | None) -> dict:
+        return await self._request("POST", endpoint, data=data)
+
+    async def put(self, endpoint: str, data: dict) -> dict:
+        return await self._request("PUT", endpoint, data=data)
+
+    async def delete(self, endpoint: str) -> dict:
+        return await self._request("DELETE", endpoint)
+
+    async def patch(self, endpoint: str, data: dict) -> dict:
+        return await self._request("PATCH", endpoint, data=data)
+
+    async def _prepare_url(self, endpoint: str) -> str:
+        if ":workspaceid" in endpoint.lower():
+            return prepare_url(endpoint, await self.workspace_id())
+        return endpoint
+
+    async def workspace_id(self) -> str:
+        """The configured workspace ID or, without one, the discovered one."""
+        return self.config.workspace_id or await self._discover_workspace_id()
+
+    async def _discover_workspace_id(self) -> str:
+        cache = self.config.workspace_cache
+        key = self.config.workspace_cache_key
+        workspace_id = cache.get(key)
+        if workspace_id:
+            return workspace_id
+
+        async with self._workspace_lock:
+            workspace_id = cache.get(key)
+            if workspace_id:
+                return workspace_id
+
+            response = await self.get(WORKSPACES_ENDPOINT)
+            workspace_id = first_workspace_id_of_type(
+                response.get("_content", None), "PAYMENTS"
+            )
+            if not workspace_id:
+                raise SantanderClientError(
+                    "Conta sem configuração de workspace na configuração e na conta."
+                )
+
+            self.logger.info(f"Workspace obtido com sucesso: {workspace_id}")
+            cache.set(key, workspace_id)
+            return workspace_id
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | None = None,
+        params: dict | None = None,
+    ) -> dict:
+        url = await self._prepare_url(endpoint)
+        try:
+            headers = await self.auth.auth_headers(self.http)
+            if data is not None:
+                headers["Content-Type"] = "application/json"
+            response = await self.http.request(
+                method,
+                url,
+                content=None if data is None else self.config.json_codec.dumps(data),
+                params=params,
+                headers=headers,
+            )
+            response.raise_for_status()
+            result = self.config.json_codec.loads(response.content)
+            log_request_success(
+                self.config, self.logger, method, url, params, data, response, result
+            )
+
+            return result
+        except httpx.HTTPStatusError as e:
+            error_content = try_parse_response_to_json(
+                e.response, self.config.json_codec
+            )
+            log_request_error(
+                self.config,
+                self.logger,
+                method,
+                url,
+                params,
+                data,
+                e,
+                e.response,
+                error_content,
+            )
+            raise SantanderRequestError(
+                "Not successful code", e.response.status_code, error_content
+            )
+        except SantanderRequestError:
+            raise
+        except Exception as e:
+            log_request_error(self.config, self.logger, method, url, params, data, e)
+            raise SantanderRequestError("Error in request: %s" % str(e), 0, None) from e
+
+
+def _try_parse_json(response: "httpx.Response") -> dict | None:
+    try:
+        return response.json()
+    except json.JSONDecodeError:
+        return None
@@ -1,66 +1,177 @@
+import logging
+import random
+import threading
 from datetime import datetime, timedelta
 
-from requests import HTTPError, JSONDecodeError
+from requests import HTTPError, JSONDecodeError, Session
 from requests.auth import AuthBase
 
 from santander_sdk.api_client.base import BaseURLSession
 from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import TOKEN_ENDPOINT
 from santander_sdk.api_client.exceptions import SantanderRequestError
+from santander_sdk.api_client.rate_limit import RateLimiter
+from santander_sdk.api_client.timing import (
+    RequestTiming,
+    TimingHook,
+    measure_phase,
+    measure_transport,
+    timing_scope,
+)
+from santander_sdk.api_client.token_store import TokenStore
+
+logger = logging.getLogger(__name__)
 
 
 class SantanderAuth(AuthBase):
-    TOKEN_ENDPOINT = "/auth/oauth/v2/token"
+    TOKEN_ENDPOINT = TOKEN_ENDPOINT
     TIMEOUT_SECS = 60
     BEFORE_EXPIRE_TOKEN = timedelta(seconds=60)
 
-    def __init__(self, base_url, client_id, client_secret, cert_path):
+    def __init__(
+        self,
+        base_url,
+        client_id,
+        client_secret,
+        cert_path,
+        token_store: TokenStore | None = None,
+        session: Session | None = None,
+        rate_limiter: RateLimiter | None = None,
+        timing_hooks: list[TimingHook] | None = None,
+    ):
         self.base_url = base_url
         self.client_id = client_id
         self.client_secret = client_secret
         self.cert_path = cert_path
+        self.token_store = token_store
+        self._session = session
+        self.rate_limiter = rate_limiter
+        self.timing_hooks = timing_hooks or []
 
         self._token = None
         self.expires_at = None
+        self._renew_lock = threading.Lock()
 
     @classmethod
-    def from_config(cls, config: SantanderClientConfiguration):
+    def from_config(
+        cls, config: SantanderClientConfiguration, session: Session | None = None
+    ):
         return cls(
             base_url=config.base_url,
             client_id=config.client_id,
             client_secret=config.client_secret,
             cert_path=config.cert,
+            token_store=config.token_store,
+            session=session,
+            rate_limiter=config.rate_limiter,
+            timing_hooks=config.timing_hooks,
         )
 
     def __call__(self, r):
-        r.headers["Authorization"] = f"Bearer {self.token}"
+        with measure_phase("token"):
+            token = self.token
+        r.headers["Authorization"] = f"Bearer {token}"
         r.headers["X-Application-Key"] = self.client_id
         return r
 
     @property
     def token(self):
-        if self.is_expired:
-            self.renew()
-
+        self.ensure_token()
         return self._token
 
+    def ensure_token(self):
+        """Renews the token if it is expired, e.g. ahead of a request."""
+        if self.is_expired:
+            self._renew_once()
+
     @token.setter
     def token(self, values):
         self._token, self.expires_at = values
 
+    def _renew_once(self, force: bool = False):
+        """Single-flight renewal: only one thread hits the token endpoint.
+
+        While another thread is renewing, callers holding a token that is only
+        inside the BEFORE_EXPIRE_TOKEN grace window keep using it. The others
+        wait on the lock and reuse the token renewed by the first thread.
+        """
+        if not self._renew_lock.acquire(blocking=force or not self.is_in_grace_window):
+            return
+
+        try:
+            if not (force or self.is_expired):
+                return
+            if self.token_store is None:
+                self.renew()
+                return
+            with self.token_store.lock(self.token_store_key):
+                if not self._load_from_store(force):
+                    self.renew()
+                    self.token_store.set(
+                        self.token_store_key, self._token, self.expires_at
+                    )
+        finally:
+            self._renew_lock.release()
+
+    @property
+    def token_store_key(self) -> str:
+        return f"{self.base_url}|{self.client_id}"
+
+    def _load_from_store(self, force: bool) -> bool:
+        """Adopt the token from the store if another process already renewed it."""
+        assert self.token_store is not None
+        stored = self.token_store.get(self.token_store_key)
+        if stored is None:
+            return False
+
+        token, expires_at = stored
+        if datetime.now() > expires_at - self.BEFORE_EXPIRE_TOKEN:
+            return False
+        if force and self.expires_at and expires_at <= self.expires_at:
+            return False
+
+        self.token = token, expires_at
+        return True
+
+    @property
+    def session(self) -> Session:
+        """Long-lived session used for renewals, keeping the mTLS connection open.
+
+        SantanderApiClient shares its own session, so renewals reuse its pool.
+        """
+        if self._session is None:
+            self._session = BaseURLSession(base_url=self.base_url)
+            self._session.cert = self.cert_path
+        return self._session
+
     def renew(self):
-        session = BaseURLSession(base_url=self.base_url)
-        session.cert = self.cert_path
-
-        response = session.post(
-            self.TOKEN_ENDPOINT,
-            data={
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "grant_type": "client_credentials",
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=self.TIMEOUT_SECS,
-        )
+        timing = None
+        if self.timing_hooks:
+            timing = RequestTiming("token", "POST", self.TOKEN_ENDPOINT, TOKEN_ENDPOINT)
+        with timing_scope(timing, self.timing_hooks, logger):
+            self._renew(timing)
+
+    def _renew(self, timing: RequestTiming | None):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire("auth")
+        with measure_transport():
+            response = self.session.post(
+                self.TOKEN_ENDPOINT,
+                data={
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "grant_type": "client_credentials",
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=self.TIMEOUT_SECS,
+                auth=_without_auth,
+            )
+        if timing is not None:
+            timing.record_response(
+                response.request.body, response.status_code, response.content
+            )
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_response("auth", response)
         try:
             response.raise_for_status()
         except HTTPError as e:
@@ -75,7 +186,8 @@ class SantanderAuth(AuthBase):
                 content=error_data,
             ) from e
 
-        data = response.json()
+        with measure_phase("parse"):
+            data = response.json()
         self.token = (
             data["access_token"],
             datetime.now() + timedelta(seconds=data["expires_in"]),
@@ -87,3 +199,82 @@ class SantanderAuth(AuthBase):
             return True
 
         return datetime.now() > self.expires_at - self.BEFORE_EXPIRE_TOKEN
+
+    @property
+    def is_in_grace_window(self):
+        """The token is about to expire but the API still accepts it."""
+        if not self.expires_at:
+            return False
+
+        return self.is_expired and datetime.now() < self.expires_at
+
+
+def _without_auth(r):
+    """Overrides the session auth, which is this SantanderAuth itself."""
+    return r
+
+
+class SantanderTokenRefresher:
+    """Renews the token of a SantanderAuth in a background thread.
+
+    The renewal is scheduled a random (jittered) time before the token enters
+    the BEFORE_EXPIRE_TOKEN window, so requests never block on the token
+    endpoint while the refresher is running. If a renewal fails the refresher
+    tries again after RETRY_INTERVAL; requests still renew inline as a fallback
+    if the token actually expires.
+    """
+
+    MAX_JITTER = timedelta(seconds=30)
+    RETRY_INTERVAL = timedelta(seconds=5)
+
+    def __init__(self, auth: SantanderAuth, logger: logging.Logger | None = None):
+        self.auth = auth
+        self.logger = logger or logging.getLogger(__name__)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="santander-token-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        # A finalizer may call stop() from the refresher thread itself.
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def seconds_until_refresh(self) -> float:
+        if not self.auth.expires_at:
+            return 0
+
+        refresh_at = (
+            self.auth.expires_at
+            - self.auth.BEFORE_EXPIRE_TOKEN
+            - random.uniform(0, 1) * self.MAX_JITTER
+        )
+        return max((refresh_at - datetime.now()).total_seconds(), 0)
+
+    def _run(self):
+        wait_secs = self.seconds_until_refresh()
+        while not self._stop_event.wait(wait_secs):
+            try:
+                self.auth._renew_once(force=True)
+            except Exception as e:
+                self.logger.error(f"Background token renewal failed: {e}")
+                wait_secs = self.RETRY_INTERVAL.total_seconds()
+                continue
+
+            wait_secs = max(
+                self.seconds_until_refresh(), self.RETRY_INTERVAL.total_seconds()
+            )
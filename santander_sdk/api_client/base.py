@@ -1,6 +1,14 @@
+import socket
+import threading
+from typing import Any
 from urllib.parse import urljoin
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from santander_sdk.api_client.timing import measure_phase
 
 
 class BaseURLSession(Session):
@@ -9,5 +17,114 @@ class BaseURLSession(Session):
         super().__init__()
 
     def prepare_request(self, request):
-        request.url = urljoin(self.base_url, request.url)
+        if not request.url.startswith(("https://", "http://")):
+            request.url = urljoin(self.base_url, request.url)
         return super().prepare_request(request)
+
+
+class PoolStats:
+    """Live counters of the connections of a SantanderHTTPAdapter."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.created = 0
+        self.discarded = 0
+        self.in_use = 0
+
+    def increment(self, counter: str, value: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + value)
+
+
+class _StatsConnectionPoolMixin:
+    stats: PoolStats
+    pool: Any
+
+    def _new_conn(self):
+        self.stats.increment("created")
+        return super()._new_conn()  # type: ignore[misc]
+
+    def _get_conn(self, timeout=None):
+        with measure_phase("pool_wait"):
+            conn = super()._get_conn(timeout)  # type: ignore[misc]
+        self.stats.increment("in_use")
+        return conn
+
+    def _validate_conn(self, conn):
+        with measure_phase("connect"):
+            super()._validate_conn(conn)  # type: ignore[misc]
+
+    def _put_conn(self, conn):
+        self.stats.increment("in_use", -1)
+        pool = self.pool
+        if conn is None or pool is None or pool.full():
+            self.stats.increment("discarded")
+        super()._put_conn(conn)  # type: ignore[misc]
+
+    @property
+    def idle_connections(self) -> int:
+        if self.pool is None:
+            return 0
+        return sum(1 for conn in list(self.pool.queue) if conn is not None)
+
+
+class SantanderHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with configurable keep-alive and live pool statistics.
+
+    - pool_connections: how many hosts have a connection pool cached.
+    - pool_maxsize: how many connections are kept for each host.
+    - pool_block: wait for a free connection instead of opening throwaway ones
+      when all pool_maxsize connections of the host are in use.
+    - keep_alive: reuse connections (enabling TCP keep-alive on the sockets, so
+      idle pooled connections are not silently dropped). When False every request
+      is sent with "Connection: close".
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        self.stats = PoolStats()
+        self.keep_alive = keep_alive
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.keep_alive:
+            pool_kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options
+                + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            )
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": self._stats_pool_class(HTTPConnectionPool),
+            "https": self._stats_pool_class(HTTPSConnectionPool),
+        }
+
+    def add_headers(self, request, **kwargs):
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+
+    def pool_stats(self) -> dict[str, int]:
+        pools = self.poolmanager.pools
+        idle_by_pool = (pools.get(key) for key in pools.keys())
+        return {
+            "in_use": self.stats.in_use,
+            "idle": sum(pool.idle_connections for pool in idle_by_pool if pool),
+            "created": self.stats.created,
+            "discarded": self.stats.discarded,
+        }
+
+    def _stats_pool_class(self, pool_class: type) -> type:
+        return type(
+            f"Stats{pool_class.__name__}",
+            (_StatsConnectionPoolMixin, pool_class),
+            {"stats": self.stats},
+        )
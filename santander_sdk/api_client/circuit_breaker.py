@@ -0,0 +1,131 @@
+"""
+Circuit breaker for the requests to the Santander API.
+
+Each endpoint family (see endpoints.endpoint_family) has its own circuit:
+
+- closed: calls go through while the recent error rate stays below the threshold.
+  Calls that fail with a connection error/timeout or a 5xx, and calls slower than
+  slow_call_secs, count as failures.
+- open: once the failure rate over the last `window_size` calls (with at least
+  `min_calls`) reaches `failure_rate_threshold`, calls are rejected right away with
+  SantanderCircuitOpenError for `open_secs`.
+- half_open: after that, up to `half_open_calls` trial calls are let through. If
+  they all succeed the circuit closes, if any fails it opens again.
+"""
+
+import threading
+from collections import deque
+from time import monotonic
+from typing import Literal
+
+from santander_sdk.api_client.endpoints import EndpointFamily
+from santander_sdk.api_client.exceptions import SantanderCircuitOpenError
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_secs: float = 10,
+        window_size: int = 20,
+        min_calls: int = 10,
+        open_secs: float = 30,
+        half_open_calls: int = 1,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_secs = slow_call_secs
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.open_secs = open_secs
+        self.half_open_calls = half_open_calls
+        self._circuits: dict[EndpointFamily, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, family: EndpointFamily):
+        """Raises SantanderCircuitOpenError if the family circuit rejects the call."""
+        if not self._circuit(family).allow():
+            raise SantanderCircuitOpenError(
+                f"Circuit open for {family} requests", family=family
+            )
+
+    def record(self, family: EndpointFamily, failed: bool, duration: float):
+        self._circuit(family).record(failed or duration > self.slow_call_secs)
+
+    def state(self) -> dict[EndpointFamily, CircuitState]:
+        with self._lock:
+            circuits = dict(self._circuits)
+        return {family: circuit.state for family, circuit in circuits.items()}
+
+    def _circuit(self, family: EndpointFamily) -> "_Circuit":
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.setdefault(family, _Circuit(self))
+        return circuit
+
+
+class _Circuit:
+    def __init__(self, breaker: CircuitBreaker):
+        self.breaker = breaker
+        self.outcomes: deque[bool] = deque(maxlen=breaker.window_size)
+        self.opened_at = 0.0
+        self.trial_calls = 0
+        self.trial_successes = 0
+        self._state: CircuitState = "closed"
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return True
+            if state == "open" or self.trial_calls >= self.breaker.half_open_calls:
+                return False
+            self.trial_calls += 1
+            return True
+
+    def record(self, failed: bool):
+        with self._lock:
+            if self._state == "open":
+                return
+            if self._state == "half_open":
+                self._record_trial(failed)
+                return
+
+            self.outcomes.append(failed)
+            if len(self.outcomes) < self.breaker.min_calls:
+                return
+            failure_rate = sum(self.outcomes) / len(self.outcomes)
+            if failure_rate >= self.breaker.failure_rate_threshold:
+                self._open()
+
+    def _record_trial(self, failed: bool):
+        if failed:
+            self._open()
+            return
+
+        self.trial_successes += 1
+        if self.trial_successes >= self.breaker.half_open_calls:
+            self._state = "closed"
+            self.outcomes.clear()
+
+    def _open(self):
+        self._state = "open"
+        self.opened_at = monotonic()
+        self.outcomes.clear()
+
+    def _current_state(self) -> CircuitState:
+        if self._state == "open" and monotonic() - self.opened_at >= (
+            self.breaker.open_secs
+        ):
+            self._state = "half_open"
+            self.trial_calls = 0
+            self.trial_successes = 0
+        return self._state
@@ -1,22 +1,59 @@
 import logging
+from contextlib import nullcontext
 from datetime import timedelta
 import re
+import threading
+import weakref
+from time import monotonic, sleep
 
 import requests
 
-from santander_sdk.api_client.auth import SantanderAuth
+from santander_sdk.api_client.auth import SantanderAuth, SantanderTokenRefresher
 from santander_sdk.api_client.base import BaseURLSession
+from santander_sdk.api_client.deadline import Deadline, Timeout
+from santander_sdk.api_client.endpoints import (
+    TOKEN,
+    EndpointRegistry,
+    endpoint_family,
+    endpoint_label,
+)
+from santander_sdk.api_client.request_logging import (
+    log_request_error,
+    log_request_success,
+)
+from santander_sdk.api_client.single_flight import SingleFlight, request_key
+from santander_sdk.api_client.timing import (
+    RequestTiming,
+    measure_phase,
+    measure_transport,
+    timing_scope,
+)
+from santander_sdk.api_client.transport import SantanderTransport
 from santander_sdk.api_client.workspaces import get_first_workspace_id_of_type
 
 from .client_configuration import SantanderClientConfiguration
 from .exceptions import (
+    SantanderCircuitOpenError,
     SantanderClientError,
+    SantanderDeadlineExceededError,
+    SantanderRateLimitError,
     SantanderRequestError,
 )
 from .helpers import try_parse_response_to_json
 
 BEFORE_EXPIRE_TOKEN_SECONDS = timedelta(seconds=60)
-TOKEN_ENDPOINT = "/auth/oauth/v2/token"
+JSON_HEADERS = {"Content-Type": "application/json"}
+TOKEN_ENDPOINT = TOKEN.path
+
+
+def prepare_url(endpoint: str, workspace_id: str) -> str:
+    """Replaces the :workspaceid slug of the endpoint with the workspace ID."""
+    if ":workspaceid" in endpoint.lower():
+        if not workspace_id:
+            raise SantanderClientError("ID da workspace não configurado")
+        endpoint = re.sub(":workspaceid", workspace_id, endpoint, flags=re.IGNORECASE)
+
+    return endpoint
 
 
 class SantanderApiClient:
@@ -30,7 +67,10 @@ class SantanderApiClient:
     #### Endpoints dos métodos HTTPS (get, post, put, delete, patch):
      - Deve ser informado o endpoint relativo, sem a URL base.
      - Poderá ser informado o slug :workspaceid no endpoint, que será substituído pelo ID da workspace configurada.
-     - Caso o slug :workspaceid seja informado e não haja ID de workspace configurado, será lançada uma exceção.
+     - Sem ID de workspace configurado, o primeiro workspace PAYMENTS ativo da conta é obtido
+       na primeira chamada com o slug :workspaceid e guardado no workspace_cache da
+       configuração (em memória, ou FileWorkspaceCache para compartilhar entre processos).
+     - Caso a conta não tenha workspace, será lançada uma exceção.
 
 
     #### Exceções:
@@ -38,52 +78,269 @@ class SantanderApiClient:
     - SantanderRequestException: Lançado em caso de códigos de retorno HTTP diferentes de 2xx.
     - SantanderClientError: Há um erro a nível de configuração do cliente Santander.
 
+    #### Pool de conexões:
+    - O tamanho do pool, o bloqueio quando esgotado e o keep-alive são definidos na
+      configuração (pool_connections, pool_maxsize, pool_block, pool_keep_alive).
+    - pool_stats() retorna as conexões em uso, ociosas, criadas e descartadas.
+
+    #### Retentativas:
+    - Com retry_policy (RetryPolicy) na configuração, GETs e POSTs com "id" são
+      repetidos em erros 429/5xx e de conexão, com backoff exponencial e Retry-After.
+
+    #### Limite de requisições:
+    - Com rate_limiter (RateLimiter) na configuração, as requisições de cada família de
+      endpoints (pix, payment_receipts, workspaces, auth) são limitadas no cliente,
+      aguardando capacidade ou falhando com SantanderRateLimitError.
+
+    #### Circuit breaker:
+    - Com circuit_breaker (CircuitBreaker) na configuração, as requisições de uma família
+      de endpoints degradada (erros 5xx/conexão ou lentidão) são rejeitadas na hora com
+      SantanderCircuitOpenError. circuit_breaker_state() expõe o estado para health checks.
+
+    #### Timeouts e prazos:
+    - connect_timeout e read_timeout da configuração valem para todas as chamadas, e cada
+      método aceita timeout (segundos ou (conexão, leitura)) e deadline (Deadline).
+    - Com um Deadline, cada chamada usa só o que resta do prazo total e, esgotado o prazo,
+      é lançado SantanderDeadlineExceededError.
+
+    #### Cache de respostas:
+    - Com response_cache (ResponseCache) na configuração, as respostas de get são
+      reutilizadas conforme as regras de TTL por endpoint (pagamentos PIX em status final
+      para sempre, em andamento por pouco tempo). Outros métodos invalidam o cache da
+      própria URL, e invalidate_cache() e response_cache_stats() expõem o controle e os
+      contadores.
+
+    #### Requisições simultâneas:
+    - Com coalesce_gets=True (padrão), GETs idênticos (mesma URL e parâmetros) feitos
+      por várias threads ao mesmo tempo viram uma só requisição, e cada chamada recebe
+      uma cópia do resultado (ou a mesma exceção).
+
+    #### Tempos das requisições:
+    - Com timing_hooks na configuração, cada requisição e cada renovação de token gera
+      um RequestTiming (token, espera do pool, conexão/TLS, servidor, parse do JSON e
+      logs, além do template do endpoint, status e bytes) entregue a cada hook.
+
+    #### Métricas:
+    - Com metrics (SantanderMetrics) na configuração, o cliente registra latência por
+      template e classe de status, renovações de token, retentativas, tentativas de
+      polling, transições de status de comprovantes e uso do pool. expose() gera o
+      formato texto do Prometheus.
+
+    #### Transporte compartilhado:
+    - Com transport_registry (TransportRegistry) na configuração, clientes com a mesma
+      base_url e certificado compartilham o pool de conexões e o contexto SSL (com o
+      certificado carregado uma vez). Tokens e workspaces continuam por cliente, e o
+      transporte é fechado quando o último cliente é fechado.
+
+    #### Limite de concorrência:
+    - Com concurrency_limiter (ConcurrencyLimiter) na configuração, cada tentativa ocupa
+      uma vaga do limitador (e dos limitadores pais) enquanto está em andamento. O
+      SantanderClientPool usa um por tenant, com um limitador total compartilhado.
+
+    #### Logs:
+    - log_request_response_level define o que é registrado (ALL, ERROR ou NONE). O resumo
+      da requisição só é montado se o nível e o logger o aceitarem.
+    - Corpos maiores que log_body_max_size são truncados, e log_sample_rates define a
+      fração das requisições bem-sucedidas registradas por família de endpoints.
+
+    #### Renovação do token em segundo plano:
+    - Com refresh_token_in_background=True na configuração, o token é renovado por uma
+      thread antes de expirar. Use close() (ou o cliente como context manager) para parar;
+      a thread também para quando o cliente é coletado pelo garbage collector.
+
     """
 
     def __init__(self, config: SantanderClientConfiguration):
         self.config = config
         self.session = BaseURLSession(base_url=config.base_url)
-        self.session.cert = config.cert
-        self.session.auth = SantanderAuth.from_config(config)
+        registry = config.transport_registry
+        if registry is not None:
+            self.transport = registry.acquire(config)
+            self._release_transport = weakref.finalize(
+                self, registry.release, self.transport
+            )
+        else:
+            self.transport = SantanderTransport.from_config(config)
+            self._release_transport = None
+        self.http_adapter = self.transport.adapter
+        self.transport.mount(self.session, config.cert)
+        if config.metrics is not None:
+            config.metrics.track_pool(
+                config.client_id, self.http_adapter, config.pool_maxsize
+            )
+        self.auth = SantanderAuth.from_config(config, session=self.session)
+        self.session.auth = self.auth
+        self.endpoints = EndpointRegistry(config.base_url)
         self.logger = config.logger or logging.getLogger(__name__)
-        self._set_default_workspace_id()
+        self._workspace_lock = threading.Lock()
+        self.single_flight = SingleFlight() if config.coalesce_gets else None
+        self.token_refresher = None
+        self._stop_token_refresher = None
+        if config.refresh_token_in_background:
+            self.token_refresher = SantanderTokenRefresher(
+                self.auth, self.logger
+            )
+            self.token_refresher.start()
+            # Also stopped when the client is garbage collected without close().
+            self._stop_token_refresher = weakref.finalize(
+                self, self.token_refresher.stop
+            )
+
+    def pool_stats(self) -> dict[str, int]:
+        """Connections in use, idle, created and discarded by the HTTP pool."""
+        return self.http_adapter.pool_stats()
+
+    def close(self):
+        if self._stop_token_refresher is not None:
+            self._stop_token_refresher()
+        if self._release_transport is not None:
+            self._release_transport()
+        else:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def workspace_id(self) -> str:
+        """The configured workspace ID or, without one, the discovered one."""
+        return self.config.workspace_id or self._discover_workspace_id()
+
+    def _discover_workspace_id(self) -> str:
+        cache = self.config.workspace_cache
+        key = self.config.workspace_cache_key
+        workspace_id = cache.get(key)
+        if workspace_id:
+            return workspace_id
+
+        with self._workspace_lock:
+            workspace_id = cache.get(key)
+            if workspace_id:
+                return workspace_id
 
-    def _set_default_workspace_id(self):
-        if not self.config.workspace_id:
             workspace_id = get_first_workspace_id_of_type(self, "PAYMENTS")
             if not workspace_id:
                 raise SantanderClientError(
                     "Conta sem configuração de workspace na configuração e na conta."
                 )
 
-            self.logger.info(
-                f"Workspace obtido e configurado com sucesso: {workspace_id}"
-            )
-            self.config.set_workspace_id(workspace_id)
+            self.logger.info(f"Workspace obtido com sucesso: {workspace_id}")
+            cache.set(key, workspace_id)
+            return workspace_id
 
-    def get(self, endpoint: str, params: dict | None = None) -> dict:
-        return self._request("GET", endpoint, params=params)
+    def get(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict:
+        url = self._prepare_url(endpoint)
+        cache = self.config.response_cache
+        rule = cache.rule_for(url) if cache is not None else None
+        if rule is not None:
+            key = cache.key(url, params)
+            response = cache.get(key)
+            if response is not None:
+                return response
 
-    def post(self, endpoint: str, data: dict | None) -> dict:
-        return self._request("POST", endpoint, data=data)
+        response = self._coalesced_get(url, params, timeout, deadline)
+        if rule is not None:
+            cache.set(key, response, rule)
+        return response
 
-    def put(self, endpoint: str, data: dict) -> dict:
-        return self._request("PUT", endpoint, data=data)
+    def post(
+        self,
+        endpoint: str,
+        data: dict | None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict:
+        return self._request(
+            "POST", endpoint, data=data, timeout=timeout, deadline=deadline
+        )
 
-    def delete(self, endpoint: str) -> dict:
-        return self._request("DELETE", endpoint)
+    def put(
+        self,
+        endpoint: str,
+        data: dict,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict:
+        return self._request(
+            "PUT", endpoint, data=data, timeout=timeout, deadline=deadline
+        )
 
-    def patch(self, endpoint: str, data: dict) -> dict:
-        return self._request("PATCH", endpoint, data=data)
+    def delete(
+        self,
+        endpoint: str,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict:
+        return self._request("DELETE", endpoint, timeout=timeout, deadline=deadline)
 
-    def _prepare_url(self, endpoint: str) -> str:
-        if ":workspaceid" in endpoint.lower():
-            if not self.config.workspace_id:
-                raise SantanderClientError("ID da workspace não configurado")
-            endpoint = re.sub(
-                ":workspaceid", self.config.workspace_id, endpoint, flags=re.IGNORECASE
+    def patch(
+        self,
+        endpoint: str,
+        data: dict,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict:
+        return self._request(
+            "PATCH", endpoint, data=data, timeout=timeout, deadline=deadline
+        )
+
+    def invalidate_cache(self, endpoint: str | None = None):
+        """Drops the cached GET responses under the endpoint, or all of them."""
+        cache = self.config.response_cache
+        if cache is not None:
+            cache.invalidate(self._prepare_url(endpoint) if endpoint else None)
+
+    def response_cache_stats(self) -> dict[str, int]:
+        """Hits, misses, evictions and size of the response cache."""
+        cache = self.config.response_cache
+        return cache.stats() if cache is not None else {}
+
+    def _coalesced_get(
+        self,
+        url: str,
+        params: dict | None,
+        timeout: Timeout | None,
+        deadline: Deadline | None,
+    ) -> dict:
+        def request():
+            return self._request(
+                "GET", url, params=params, timeout=timeout, deadline=deadline
             )
 
+        if self.single_flight is None:
+            return request()
+
+        # Calls with another explicit timeout are not coalesced, and the leader's
+        # deadline running out doesn't fail the waiters: they send their own GET.
+        key = (request_key("GET", url, params), timeout)
+        wait = deadline.remaining() if deadline is not None else None
+        try:
+            return self.single_flight.do(
+                key, request, wait, rerun_on=(SantanderDeadlineExceededError,)
+            )
+        except TimeoutError as e:
+            raise SantanderDeadlineExceededError(
+                f"{deadline.seconds}s budget spent waiting for GET {url}"
+            ) from e
+
+    def _prepare_url(self, endpoint: str) -> str:
+        match = self.endpoints.match(endpoint)
+        if match is not None:
+            template, rest = match
+            workspace_id = self.workspace_id if template.needs_workspace else ""
+            return self.endpoints.url(template, rest, workspace_id)
+
+        if ":workspaceid" in endpoint.lower():
+            return prepare_url(endpoint, self.workspace_id)
         return endpoint
 
     def _request(
@@ -92,83 +349,186 @@ class SantanderApiClient:
         endpoint: str,
         data: dict | None = None,
         params: dict | None = None,
+        timeout: Timeout | None = None,
+        deadline: Deadline | None = None,
     ) -> dict:
         url = self._prepare_url(endpoint)
+        hooks = self.config.timing_hooks
+        timing = (
+            RequestTiming("request", method, url, endpoint_label(url))
+            if hooks
+            else None
+        )
+        with timing_scope(timing, hooks, self.logger):
+            return self._request_url(method, url, data, params, timeout, deadline)
+
+    def _request_url(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        params: dict | None,
+        timeout: Timeout | None,
+        deadline: Deadline | None,
+    ) -> dict:
+        if timeout is None:
+            timeout = (self.config.connect_timeout, self.config.read_timeout)
+        if method != "GET" and self.config.response_cache is not None:
+            self.config.response_cache.discard(url)
         response = None
         try:
-            response = self.session.request(
-                method, url, json=data, params=params, timeout=60
-            )
+            response = self._send(method, url, data, params, timeout, deadline)
             response.raise_for_status()
-            self._log_request_success_if_needed(method, url, params, data, response)
+            with measure_phase("parse"):
+                result = self.config.json_codec.loads(response.content)
+            with measure_phase("logging"):
+                log_request_success(
+                    self.config,
+                    self.logger,
+                    method,
+                    url,
+                    params,
+                    data,
+                    response,
+                    result,
+                )
 
-            return response.json()
+            return result
         except requests.exceptions.RequestException as e:
             status_code = getattr(e.response, "status_code", 0)
-            error_content = try_parse_response_to_json(e.response)
-            self._log_error_if_needed(method, url, params, data, e)
+            with measure_phase("parse"):
+                error_content = try_parse_response_to_json(
+                    e.response, self.config.json_codec
+                )
+            with measure_phase("logging"):
+                log_request_error(
+                    self.config,
+                    self.logger,
+                    method,
+                    url,
+                    params,
+                    data,
+                    e,
+                    e.response,
+                    error_content,
+                )
+            if deadline is not None and deadline.expired:
+                raise SantanderDeadlineExceededError(
+                    f"{deadline.seconds}s budget spent during {method} {url}"
+                ) from e
             raise SantanderRequestError(
                 "Not successful code", status_code, error_content
             )
-
+        except (
+            SantanderRateLimitError,
+            SantanderCircuitOpenError,
+            SantanderDeadlineExceededError,
+        ):
+            raise
         except Exception as e:
-            self._log_error_if_needed(method, url, params, data, e)
+            with measure_phase("logging"):
+                log_request_error(
+                    self.config, self.logger, method, url, params, data, e
+                )
             raise SantanderRequestError("Error in request: %s" % str(e), 0, None) from e
 
-    def _log_error_if_needed(
+    def _send(
         self,
         method: str,
         url: str,
-        params: dict | None,
         data: dict | None,
-        error: Exception | None,
-    ):
-        if self.config.log_request_response_level not in ["ALL", "ERROR"]:
-            self.logger.info("Logging error is disabled in client configuration")
-
-        response = getattr(error, "response", None)
-        extra = self._get_request_summary(
-            method, url, response, request_data=data, request_params=params, error=error
-        )
-        self.logger.error("API request failed", extra=extra)
+        params: dict | None,
+        timeout: Timeout,
+        deadline: Deadline | None,
+    ) -> requests.Response:
+        """Sends the request, retrying safe calls per the configured RetryPolicy."""
+        policy = self.config.retry_policy
+        if policy is None:
+            return self._send_once(method, url, data, params, timeout, deadline)
 
-    def _log_request_success_if_needed(
+        policy.budget.record_request()
+        attempt = 1
+        while True:
+            try:
+                response = self._send_once(method, url, data, params, timeout, deadline)
+            except requests.exceptions.RequestException as e:
+                delay = policy.retry_delay(method, data, attempt, error=e)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                delay = policy.retry_delay(method, data, attempt, response=response)
+                if delay is None:
+                    return response
+                reason = response.status_code
+
+            if self.config.metrics is not None:
+                self.config.metrics.record_retry(endpoint_family(url), reason)
+            self.logger.warning(
+                f"Retrying {method} {url} in {delay:.2f}s "
+                f"(attempt {attempt} failed: {reason})"
+            )
+            if deadline is not None:
+                deadline.sleep(delay, f"retrying {method} {url}")
+            else:
+                sleep(delay)
+            attempt += 1
+
+    def _send_once(
         self,
         method: str,
         url: str,
-        params: dict | None,
         data: dict | None,
-        response: requests.Response,
-    ):
-        if not self.config.log_request_response_level == "ALL":
-            self.logger.info("Request successful", url)
-            return
-
-        extra = self._get_request_summary(
-            method, url, response, request_data=data, request_params=params
-        )
-        self.logger.info("API request successful", extra=extra)
+        params: dict | None,
+        timeout: Timeout,
+        deadline: Deadline | None,
+    ) -> requests.Response:
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+        # Encoded first: a body that can't be encoded takes no permit.
+        body = None if data is None else self.config.json_codec.dumps(data)
+        family = endpoint_family(url)
+        limiter = self.config.rate_limiter
+        breaker = self.config.circuit_breaker
+        if limiter is not None:
+            limiter.acquire(family)
 
-    def _get_request_summary(
-        self,
-        method: str,
-        url: str,
-        response: requests.Response | None,
-        request_data: dict | None = None,
-        request_params: dict | None = None,
-        error: Exception | None = None,
-    ) -> dict:
-        return {
-            "method": method,
-            "url": url,
-            "request_body": request_data,
-            "request_params": request_params,
-            "status_code": response.status_code if response is not None else None,
-            "response_body": try_parse_response_to_json(response)
-            if response is not None
-            else None,
-            "status": "error" if error else "success",
-            "error": {"message": str(error), "type": type(error).__name__}
-            if error
-            else None,
-        }
+        concurrency = self.config.concurrency_limiter
+        # The slot is taken first: a breaker permit (e.g. the half-open trial) is
+        # only given to a call that will be sent, and so recorded.
+        with concurrency.slot(deadline) if concurrency is not None else nullcontext():
+            if breaker is not None:
+                # Renewed before the permit: the token endpoint's failures and
+                # latency don't count against the family of the request.
+                with measure_phase("token"):
+                    self.auth.ensure_token()
+                breaker.acquire(family)
+            failed = True
+            start = monotonic()
+            try:
+                with measure_transport() as timing:
+                    response = self.session.request(
+                        method,
+                        url,
+                        data=body,
+                        headers=JSON_HEADERS if body is not None else None,
+                        params=params,
+                        timeout=timeout,
+                    )
+                    if timing is not None:
+                        timing.record_response(
+                            body, response.status_code, response.content
+                        )
+                failed = breaker is not None and response.status_code >= 500
+            finally:
+                if breaker is not None:
+                    breaker.record(family, failed, monotonic() - start)
+
+        if limiter is not None:
+            limiter.update_from_response(family, response)
+        return response
+
+    def circuit_breaker_state(self) -> dict[str, str]:
+        """State of the circuit of each endpoint family, for health checks."""
+        breaker = self.config.circuit_breaker
+        return dict(breaker.state()) if breaker is not None else {}
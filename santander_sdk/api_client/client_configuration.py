@@ -1,6 +1,24 @@
 from typing import Literal
 import logging
 
+from santander_sdk.api_client.circuit_breaker import CircuitBreaker
+from santander_sdk.api_client.concurrency import ConcurrencyLimiter
+from santander_sdk.api_client.endpoints import EndpointFamily
+from santander_sdk.api_client.idempotency import IdempotencyRegistry
+from santander_sdk.api_client.json_codec import JsonCodec, default_json_codec
+from santander_sdk.api_client.metrics import SantanderMetrics
+from santander_sdk.api_client.rate_limit import RateLimiter
+from santander_sdk.api_client.response_cache import ResponseCache
+from santander_sdk.api_client.retry import RetryPolicy
+from santander_sdk.api_client.timing import TimingHook
+from santander_sdk.api_client.token_store import TokenStore
+from santander_sdk.api_client.transfer_journal import TransferJournal
+from santander_sdk.api_client.transport import TransportRegistry
+from santander_sdk.api_client.workspace_cache import (
+    WorkspaceCache,
+    default_workspace_cache,
+)
+
 
 class SantanderClientConfiguration:
     def __init__(
@@ -12,6 +30,29 @@ class SantanderClientConfiguration:
         workspace_id: str = "",
         log_request_response_level: Literal["ERROR", "ALL", "NONE"] = "ERROR",
         logger: logging.Logger | None = None,
+        refresh_token_in_background: bool = False,
+        token_store: TokenStore | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        pool_keep_alive: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        connect_timeout: float = 60,
+        read_timeout: float = 60,
+        workspace_cache: WorkspaceCache | None = None,
+        log_body_max_size: int = 4096,
+        log_sample_rates: dict[EndpointFamily, float] | None = None,
+        json_codec: JsonCodec | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce_gets: bool = True,
+        timing_hooks: list[TimingHook] | None = None,
+        metrics: SantanderMetrics | None = None,
+        transport_registry: TransportRegistry | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        transfer_journal: TransferJournal | None = None,
+        idempotency_registry: IdempotencyRegistry | None = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -20,10 +61,39 @@ class SantanderClientConfiguration:
         self.base_url = base_url
         self.log_request_response_level = log_request_response_level
         self.logger = logger or logging.getLogger(__name__)
+        self.refresh_token_in_background = refresh_token_in_background
+        self.token_store = token_store
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.pool_keep_alive = pool_keep_alive
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.workspace_cache = workspace_cache or default_workspace_cache
+        self.log_body_max_size = log_body_max_size
+        self.log_sample_rates = log_sample_rates or {}
+        self.json_codec = json_codec or default_json_codec()
+        self.response_cache = response_cache
+        self.coalesce_gets = coalesce_gets
+        self.timing_hooks = list(timing_hooks or [])
+        self.metrics = metrics
+        self.transport_registry = transport_registry
+        self.concurrency_limiter = concurrency_limiter
+        self.transfer_journal = transfer_journal
+        self.idempotency_registry = idempotency_registry
+        if metrics is not None:
+            self.timing_hooks.append(metrics.record_timing)
 
     def set_workspace_id(self, workspace_id: str):
         self.workspace_id = workspace_id
 
+    @property
+    def workspace_cache_key(self) -> str:
+        return f"{self.base_url}|{self.client_id}"
+
     def __repr__(self):
         return (
             f"SantanderClientConfiguration<client_id={self.client_id} cert={self.cert}>"
@@ -0,0 +1,180 @@
+"""
+Clients of many tenants (e.g. the companies paid out on behalf of), built on demand.
+
+Each tenant has its own SantanderClientConfiguration (client_id, secret,
+workspace), loaded from a mapping or a function only when the tenant is first
+used. The pool keeps resource use flat as the number of tenants grows:
+
+- The clients share transports through a TransportRegistry, so tenants under the
+  same base_url and cert use one connection pool and one SSL context.
+- Requests in flight are capped in total and per tenant (see concurrency.py). A
+  busy tenant waits for its own slots without holding the shared ones.
+- Tenants idle for idle_ttl seconds, and the least recently used ones past
+  max_clients, are evicted: their client is closed, dropping the token and the
+  session. The next use builds a new client.
+
+Get the client with pool.client(tenant) for each operation instead of keeping it:
+an evicted client still works, but outside the pool's limits.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Hashable, Mapping
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.concurrency import ConcurrencyLimiter
+from santander_sdk.api_client.exceptions import SantanderClientError
+from santander_sdk.api_client.transport import TransportRegistry
+
+ConfigLoader = Callable[[Hashable], SantanderClientConfiguration]
+
+EVICTION_INTERVAL = 60
+
+
+class SantanderClientPool:
+    def __init__(
+        self,
+        configs: Mapping[Hashable, SantanderClientConfiguration] | ConfigLoader,
+        max_concurrent_requests: int = 64,
+        max_concurrent_per_tenant: int = 8,
+        idle_ttl: float = 900,
+        max_clients: int | None = None,
+        transport_registry: TransportRegistry | None = None,
+    ):
+        """
+        - configs: the configuration of each tenant, or a function returning it.
+        - max_concurrent_requests: requests in flight across all tenants.
+        - max_concurrent_per_tenant: requests in flight of each tenant.
+        - idle_ttl: seconds without use after which a tenant's client is closed.
+        - max_clients: clients kept open; the least recently used idle ones go first.
+        - transport_registry: shares the transports; the pool has its own by default.
+        """
+        self.configs = configs
+        self.limiter = ConcurrencyLimiter(max_concurrent_requests)
+        self.max_concurrent_per_tenant = max_concurrent_per_tenant
+        self.idle_ttl = idle_ttl
+        self.max_clients = max_clients
+        self.transport_registry = transport_registry or TransportRegistry()
+        self.evictions = 0
+        # Least recently used first: tenant -> (client, last use).
+        self._clients: OrderedDict[Hashable, tuple[SantanderApiClient, float]] = (
+            OrderedDict()
+        )
+        self._last_eviction = monotonic()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._clients)
+
+    def __contains__(self, tenant: Hashable) -> bool:
+        with self._lock:
+            return tenant in self._clients
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def client(self, tenant: Hashable) -> SantanderApiClient:
+        """The client of the tenant, built on its first use or after an eviction."""
+        with self._lock:
+            client = self._touch(tenant)
+        if client is None:
+            config = self._tenant_config(tenant)
+            with self._lock:
+                client = self._touch(tenant)
+                if client is None:
+                    client = SantanderApiClient(config)
+                    self._clients[tenant] = (client, monotonic())
+        self._evict_if_due(keep=tenant)
+        return client
+
+    def evict(self, tenant: Hashable):
+        """Closes the client of the tenant, even with requests in flight."""
+        with self._lock:
+            entry = self._clients.pop(tenant, None)
+        if entry is not None:
+            self._close(entry[0])
+
+    def evict_idle(self) -> int:
+        """Closes the clients idle for idle_ttl and the ones past max_clients."""
+        return self._evict_idle()
+
+    def _evict_idle(self, keep: tuple[Hashable, ...] = ()) -> int:
+        now = monotonic()
+        evicted = []
+        with self._lock:
+            self._last_eviction = now
+            for tenant, (client, used_at) in list(self._clients.items()):
+                limiter = client.config.concurrency_limiter
+                if tenant in keep or limiter.in_flight:
+                    continue
+                idle_since = max(used_at, limiter.last_released_at)
+                over_limit = (
+                    self.max_clients is not None
+                    and len(self._clients) > self.max_clients
+                )
+                if over_limit or now - idle_since >= self.idle_ttl:
+                    del self._clients[tenant]
+                    evicted.append(client)
+        for client in evicted:
+            self._close(client)
+        return len(evicted)
+
+    def stats(self) -> dict[str, int]:
+        """Open clients, shared transports, requests in flight and evictions."""
+        return {
+            "clients": len(self),
+            "transports": len(self.transport_registry),
+            "in_flight": self.limiter.in_flight,
+            "evictions": self.evictions,
+        }
+
+    def close(self):
+        with self._lock:
+            clients = [client for client, _ in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def _touch(self, tenant: Hashable) -> SantanderApiClient | None:
+        entry = self._clients.get(tenant)
+        if entry is None:
+            return None
+        self._clients[tenant] = (entry[0], monotonic())
+        self._clients.move_to_end(tenant)
+        return entry[0]
+
+    def _tenant_config(self, tenant: Hashable) -> SantanderClientConfiguration:
+        if isinstance(self.configs, Mapping):
+            if tenant not in self.configs:
+                raise SantanderClientError(f"Tenant {tenant} não configurado no pool")
+            config = self.configs[tenant]
+        else:
+            config = self.configs(tenant)
+        # A copy, so the tenant's configuration is not tied to the pool.
+        config = copy.copy(config)
+        config.transport_registry = config.transport_registry or (
+            self.transport_registry
+        )
+        config.concurrency_limiter = ConcurrencyLimiter(
+            self.max_concurrent_per_tenant, parent=self.limiter
+        )
+        return config
+
+    def _evict_if_due(self, keep: Hashable):
+        """Evicts as evict_idle, except the client of keep, about to be returned."""
+        interval = min(EVICTION_INTERVAL, self.idle_ttl)
+        over_limit = self.max_clients is not None and len(self) > self.max_clients
+        if over_limit or monotonic() - self._last_eviction >= interval:
+            self._evict_idle(keep=(keep,))
+
+    def _close(self, client: SantanderApiClient):
+        with self._lock:
+            self.evictions += 1
+        client.close()
@@ -0,0 +1,90 @@
+"""
+Caps on the number of requests in flight at the same time.
+
+A ConcurrencyLimiter is a counting semaphore that can be chained to a parent: a
+slot is only granted when both the limiter and its parent (and the parent's
+parent) have room. SantanderClientPool gives each tenant a limiter whose parent
+is shared by every tenant, capping both the per-tenant and the total concurrency.
+
+Set it in SantanderClientConfiguration(concurrency_limiter=...) and the client
+holds a slot while each attempt is on the wire (token renewal included), but not
+during retry waits.
+"""
+
+import threading
+from contextlib import contextmanager
+from time import monotonic
+from typing import Iterator
+
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.exceptions import SantanderDeadlineExceededError
+
+
+class ConcurrencyLimiter:
+    def __init__(self, max_concurrent: int, parent: "ConcurrencyLimiter | None" = None):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.parent = parent
+        self.last_released_at = monotonic()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def __repr__(self):
+        return f"ConcurrencyLimiter<{self._in_flight}/{self.max_concurrent}>"
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Takes a slot here and in the parents, waiting at most `timeout` seconds."""
+        expires_at = None if timeout is None else monotonic() + timeout
+        if not self._acquire_own(expires_at):
+            return False
+        # The own slot is taken first, so a tenant waiting on its own cap never
+        # holds a slot of the shared parent.
+        parent_timeout = (
+            None if expires_at is None else max(expires_at - monotonic(), 0)
+        )
+        if self.parent is not None and not self.parent.acquire(parent_timeout):
+            self._release_own()
+            return False
+        return True
+
+    def release(self):
+        if self.parent is not None:
+            self.parent.release()
+        self._release_own()
+
+    @contextmanager
+    def slot(self, deadline: Deadline | None = None) -> Iterator[None]:
+        """Holds a slot, waiting for it at most what is left of the deadline."""
+        timeout = None if deadline is None else deadline.remaining()
+        if not self.acquire(timeout):
+            raise SantanderDeadlineExceededError(
+                f"{deadline.seconds}s budget spent waiting for a request slot"
+            )
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _acquire_own(self, expires_at: float | None) -> bool:
+        with self._condition:
+            while self._in_flight >= self.max_concurrent:
+                if expires_at is None:
+                    self._condition.wait()
+                    continue
+                remaining = expires_at - monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self._in_flight += 1
+            return True
+
+    def _release_own(self):
+        with self._condition:
+            self._in_flight -= 1
+            self.last_released_at = monotonic()
+            self._condition.notify()
@@ -0,0 +1,50 @@
+from time import monotonic, sleep
+
+from santander_sdk.api_client.exceptions import SantanderDeadlineExceededError
+
+Timeout = float | tuple[float, float]
+
+
+class Deadline:
+    """End-to-end time budget shared by the steps of a flow.
+
+    Pass the same Deadline to transfer_pix, SantanderPaymentFlow, the receipt
+    functions or the client methods: each request and polling interval only gets
+    what remains of the budget, and SantanderDeadlineExceededError is raised once
+    it is spent.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = monotonic() + seconds
+
+    def __repr__(self):
+        return f"Deadline<{self.remaining():.3f}s of {self.seconds}s remaining>"
+
+    def remaining(self) -> float:
+        return max(self.expires_at - monotonic(), 0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, step: str = "request"):
+        if self.expired:
+            raise SantanderDeadlineExceededError(
+                f"{self.seconds}s budget spent before {step}"
+            )
+
+    def timeout(self, timeout: Timeout) -> tuple[float, float]:
+        """The (connect, read) timeout limited to the remaining budget."""
+        self.check()
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        remaining = self.remaining()
+        return min(connect, remaining), min(read, remaining)
+
+    def sleep(self, seconds: float, step: str = "next attempt"):
+        """Sleeps, failing right away if the budget ends before the sleep does."""
+        if seconds >= self.remaining():
+            raise SantanderDeadlineExceededError(
+                f"{self.seconds}s budget would be spent before {step}"
+            )
+        sleep(seconds)
@@ -0,0 +1,140 @@
+"""
+Endpoints of the Santander API used by the SDK.
+
+Each EndpointTemplate is parsed once, at import time: the :workspaceid slug is
+split out so resolving it is a plain concatenation, and EndpointRegistry caches the
+absolute URL prefix of each template per workspace. Path parameters (payment id,
+receipt request id) are appended to that prefix without regex or urljoin.
+"""
+
+import re
+from functools import lru_cache
+from typing import Literal
+from urllib.parse import urljoin, urlsplit
+
+from santander_sdk.api_client.exceptions import SantanderClientError
+
+EndpointFamily = Literal["pix", "payment_receipts", "workspaces", "auth", "other"]
+
+WORKSPACE_SLUG = ":workspaceid"
+
+TOKEN_ENDPOINT = "/auth/oauth/v2/token"
+WORKSPACES_ENDPOINT = "/management_payments_partners/v1/workspaces"
+PIX_ENDPOINT = "/management_payments_partners/v1/workspaces/:workspaceid/pix_payments"
+RECEIPTS_ENDPOINT = "/consult_payment_receipts/v1/payment_receipts"
+
+
+def endpoint_family(endpoint: str) -> EndpointFamily:
+    """Groups the endpoints of the API that share limits and health."""
+    path = endpoint.lower()
+    if "/pix_payments" in path:
+        return "pix"
+    if "/payment_receipts" in path:
+        return "payment_receipts"
+    if "/oauth/" in path:
+        return "auth"
+    if "/workspaces" in path:
+        return "workspaces"
+    return "other"
+
+
+class EndpointTemplate:
+    def __init__(self, path: str):
+        self.path = path
+        self.family = endpoint_family(path)
+        index = path.lower().find(WORKSPACE_SLUG)
+        self.needs_workspace = index >= 0
+        self._head = path[:index] if self.needs_workspace else path
+        self._tail = path[index + len(WORKSPACE_SLUG) :] if self.needs_workspace else ""
+        resolved = (
+            re.escape(self._head) + r"[^/]+" + re.escape(self._tail)
+            if self.needs_workspace
+            else re.escape(path)
+        )
+        self._resolved_regex = re.compile(resolved + r"(?=/|$)")
+
+    def __repr__(self):
+        return f"EndpointTemplate<{self.path}>"
+
+    def resolve(self, workspace_id: str = "") -> str:
+        """The relative path, with the workspace ID in place of :workspaceid."""
+        if not self.needs_workspace:
+            return self.path
+        if not workspace_id:
+            raise SantanderClientError("ID da workspace não configurado")
+        return f"{self._head}{workspace_id}{self._tail}"
+
+    def format(self, *segments: str) -> str:
+        """The endpoint of a resource under the template, e.g. format(payment_id)."""
+        return "/".join((self.path, *segments))
+
+
+TOKEN = EndpointTemplate(TOKEN_ENDPOINT)
+WORKSPACES = EndpointTemplate(WORKSPACES_ENDPOINT)
+PIX = EndpointTemplate(PIX_ENDPOINT)
+RECEIPTS = EndpointTemplate(RECEIPTS_ENDPOINT)
+
+ENDPOINT_TEMPLATES = (TOKEN, WORKSPACES, PIX, RECEIPTS)
+
+# Path segments under a template that are names, not parameters.
+_LITERAL_SEGMENTS = frozenset({"file_requests"})
+
+
+@lru_cache(maxsize=1024)
+def endpoint_label(url: str) -> str:
+    """
+    Low-cardinality name of the endpoint of a (resolved, absolute or relative) URL,
+    for timings and metrics: its template path with {id} in place of the path
+    parameters, e.g. PIX_ENDPOINT + "/{id}". URLs out of the templates keep their path.
+    """
+    path = urlsplit(url).path
+    for template in sorted(ENDPOINT_TEMPLATES, key=lambda t: len(t.path), reverse=True):
+        match = template._resolved_regex.search(path)
+        if match is not None:
+            segments = [
+                segment if segment in _LITERAL_SEGMENTS else "{id}"
+                for segment in path[match.end() :].split("/")
+                if segment
+            ]
+            return "/".join((template.path, *segments))
+    return path
+
+
+class EndpointRegistry:
+    """Resolves endpoints under the known templates to absolute URLs.
+
+    Longer templates are matched first, so PIX wins over WORKSPACES. The absolute
+    prefix of each (template, workspace ID) is computed once per registry, so a
+    client keeps one registry for its base URL.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        templates: tuple[EndpointTemplate, ...] = ENDPOINT_TEMPLATES,
+    ):
+        self.base_url = base_url
+        self.templates = sorted(templates, key=lambda t: len(t.path), reverse=True)
+        self._prefixes: dict[tuple[str, str], str] = {}
+
+    def match(self, endpoint: str) -> tuple[EndpointTemplate, str] | None:
+        """
+        The template of the endpoint and the rest of the path after it. Endpoints
+        with a :workspaceid slug (in any case) after the template don't match.
+        """
+        for template in self.templates:
+            if endpoint.startswith(template.path):
+                rest = endpoint[len(template.path) :]
+                if WORKSPACE_SLUG in rest.lower():
+                    return None
+                if not rest or rest[0] in "/?":
+                    return template, rest
+        return None
+
+    def url(self, template: EndpointTemplate, rest: str, workspace_id: str) -> str:
+        key = (template.path, workspace_id)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix = urljoin(self.base_url, template.resolve(workspace_id))
+            self._prefixes[key] = prefix
+        return prefix + rest
@@ -45,3 +45,33 @@ class SantanderStatusTimeoutError(SantanderError):
 
     def __str__(self):
         return f"Status update timeout after several attempts: {super().__str__()}"
+
+
+class SantanderRateLimitError(SantanderRequestError):
+    """Raised without sending the request when the client-side limit is reached."""
+
+    def __init__(self, message, family: str):
+        super().__init__(message, status_code=429)
+        self.family = family
+
+    def __str__(self):
+        return f"Client rate limit reached: {super().__str__()}"
+
+
+class SantanderCircuitOpenError(SantanderRequestError):
+    """Raised without sending the request while the API is considered degraded."""
+
+    def __init__(self, message, family: str):
+        super().__init__(message, status_code=503)
+        self.family = family
+
+    def __str__(self):
+        return f"Circuit breaker open: {super().__str__()}"
+
+
+class SantanderDeadlineExceededError(SantanderError):
+    def __init__(self, message):
+        super().__init__(message)
+
+    def __str__(self):
+        return f"Deadline exceeded: {super().__str__()}"
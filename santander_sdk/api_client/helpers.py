@@ -1,5 +1,7 @@
 from decimal import ROUND_DOWN, Decimal
+import json
 import logging
+import random
 from itertools import cycle
 from time import sleep, time
 from typing import Literal
@@ -7,7 +9,9 @@ import re
 import requests
 import pathlib
 
+from santander_sdk.api_client.endpoints import endpoint_family
 from santander_sdk.api_client.exceptions import SantanderRequestError
+from santander_sdk.api_client.json_codec import JsonCodec, default_json_codec
 
 logger = logging.getLogger("santanderLogger")
 
@@ -53,14 +57,50 @@ def get_pix_key_type(chave: str) -> DictCodeTypes:
         raise ValueError(f"Chave Pix em formato inválido: {chave}")
 
 
-def try_parse_response_to_json(response) -> dict | None:
+def try_parse_response_to_json(response, codec: JsonCodec | None = None) -> dict | None:
+    if response is None:
+        return None
     try:
-        error_content = response.json()
-    except requests.exceptions.JSONDecodeError:
+        error_content = (codec or default_json_codec()).loads(response.content)
+    except ValueError:
         error_content = None
     return error_content
 
 
+def is_log_sampled(sample_rates: dict[str, float], url: str) -> bool:
+    """Whether a successful request goes to the logs, per the rate of its family."""
+    if not sample_rates:
+        return True
+    rate = sample_rates.get(endpoint_family(url), 1.0)
+    return rate >= 1 or random.random() < rate
+
+
+def truncate_body_for_log(body, max_size: int):
+    """The body as is if its JSON fits in max_size characters, else a truncated string."""
+    if body is None:
+        return None
+    text = json.dumps(body, default=str)
+    if len(text) <= max_size:
+        return body
+    return f"{text[:max_size]}... ({len(text)} chars)"
+
+
+def response_body_for_log(
+    response, max_size: int, parsed=None, codec: JsonCodec | None = None
+):
+    """The response body for the logs, parsed only if it fits in max_size bytes.
+
+    Pass the already parsed body, if any, so it is not decoded again.
+    """
+    content = response.content or b""
+    if len(content) > max_size:
+        text = content[:max_size].decode("utf-8", "replace")
+        return f"{text}... ({len(content)} bytes)"
+    if parsed is not None:
+        return parsed
+    return try_parse_response_to_json(response, codec)
+
+
 def only_numbers(s):
     return re.sub("[^0-9]", "", s) if s else s
 
@@ -0,0 +1,158 @@
+"""
+Idempotent PIX transfers within a process.
+
+transfer_pix(..., idempotency_key=...) sends the payment with a UUID derived from
+the key (and the client_id), so retrying the same logical payout after a timeout
+reuses the payment id instead of creating a second payment.
+
+With SantanderClientConfiguration(idempotency_registry=IdempotencyRegistry()),
+transfer_pix and submit_transfer_pix also track the ids they are transferring:
+
+- while a transfer of an id is in flight, other threads transferring the same id
+  wait for it and get a copy of its result (or the same handle, for a
+  submit_transfer_pix in flight), or the error it raised, without sending it again;
+- a transfer PAYED is remembered for `ttl` seconds (at most `max_entries`,
+  evicting the oldest), and transferring its id again returns a copy of the
+  result without any request.
+
+Failed transfers, and the ones still pending when transfer_pix returned, are not
+remembered, so they can be retried. The registry only covers one process; see
+transfer_journal for transfers across processes/crashes.
+"""
+
+import copy
+import threading
+import uuid
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Protocol
+
+from santander_sdk.types import ConfirmOrderStatus, TransferPixResult
+
+IDEMPOTENCY_NAMESPACE = uuid.UUID("6f0c1a52-3a4e-5b8e-9f1d-2c7b5e8a4d31")
+
+
+def idempotency_id(idempotency_key: str, scope: str = "") -> uuid.UUID:
+    """The payment id of an idempotency key: a UUIDv5, stable across processes."""
+    if not idempotency_key:
+        raise ValueError("idempotency_key not provided")
+    return uuid.uuid5(IDEMPOTENCY_NAMESPACE, f"{scope}:{idempotency_key}")
+
+
+class TransferHandle(Protocol):
+    """What the registry needs of a PixTransferHandle."""
+
+    def result(self) -> TransferPixResult | None: ...
+
+
+TransferOutcome = TransferPixResult | TransferHandle
+
+
+def _paid_result(outcome: TransferOutcome) -> TransferPixResult | None:
+    result = outcome if isinstance(outcome, dict) else outcome.result()
+    if result is None or not result["success"] or result["data"] is None:
+        return None
+    if result["data"].get("status") != ConfirmOrderStatus.PAYED:
+        return None
+    return result
+
+
+def _shared(outcome: TransferOutcome) -> TransferOutcome:
+    """A copy of a result for each caller; handles are shared."""
+    return copy.deepcopy(outcome) if isinstance(outcome, dict) else outcome
+
+
+class _Transfer:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: TransferOutcome | None = None
+        self.error: BaseException | None = None
+
+
+class IdempotencyRegistry:
+    def __init__(self, max_entries: int = 10_000, ttl: float = 24 * 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.short_circuited = 0
+        self._in_flight: dict[str, _Transfer] = {}
+        self._completed: OrderedDict[str, tuple[TransferPixResult, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"IdempotencyRegistry<max_entries={self.max_entries} ttl={self.ttl}>"
+
+    def run(
+        self,
+        id: str,
+        transfer: Callable[[], TransferOutcome],
+        timeout: float | None = None,
+    ) -> TransferOutcome:
+        """
+        Runs transfer(), unless the id was paid recently or is in flight: then
+        returns a copy of that result (or the in-flight handle), waiting up to
+        timeout seconds for the in-flight one (raising TimeoutError). If the
+        in-flight transfer raises, its waiters raise the same error.
+        """
+        with self._lock:
+            completed = self._get_completed(id)
+            if completed is not None:
+                self.short_circuited += 1
+                return copy.deepcopy(completed)
+            call = self._in_flight.get(id)
+            leader = call is None
+            if leader:
+                call = self._in_flight[id] = _Transfer()
+            else:
+                self.short_circuited += 1
+
+        if leader:
+            try:
+                call.result = transfer()
+                return call.result
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._in_flight[id]
+                    paid = None if call.result is None else _paid_result(call.result)
+                    if paid is not None:
+                        self._set_completed(id, paid)
+                call.done.set()
+
+        if not call.done.wait(timeout):
+            raise TimeoutError(f"Timed out waiting for the in-flight transfer of {id}")
+        if call.error is not None:
+            # Not sent again: the failed transfer may still have reached the API.
+            raise call.error
+        return _shared(call.result)
+
+    def forget(self, id: str):
+        """Drops the remembered result of the id, allowing it to be sent again."""
+        with self._lock:
+            self._completed.pop(id, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "completed": len(self._completed),
+                "short_circuited": self.short_circuited,
+            }
+
+    def _get_completed(self, id: str) -> TransferPixResult | None:
+        entry = self._completed.get(id)
+        if entry is None:
+            return None
+        if entry[1] <= monotonic():
+            del self._completed[id]
+            return None
+        return entry[0]
+
+    def _set_completed(self, id: str, result: TransferPixResult):
+        self._completed[id] = (copy.deepcopy(result), monotonic() + self.ttl)
+        self._completed.move_to_end(id)
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
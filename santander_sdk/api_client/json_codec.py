@@ -0,0 +1,103 @@
+"""
+JSON codecs used to encode request bodies and decode response bodies.
+
+Payment listing pages are large, so decoding them is the main CPU cost of
+receipt sync jobs. default_json_codec() picks the fastest codec installed:
+orjson, then msgspec, then the stdlib json module. Any codec can be set in
+SantanderClientConfiguration(json_codec=...).
+
+Every codec raises ValueError (or a subclass) for invalid JSON and encodes
+Decimal values as strings, the format of the amounts in the API.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Any
+
+
+class JsonCodec(ABC):
+    name = "abstract"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """The JSON of obj, as UTF-8 bytes."""
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """The object of a JSON document; raises ValueError if invalid."""
+
+    def __repr__(self):
+        return f"{type(self).__name__}<{self.name}>"
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=_encode_default).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, default=_encode_default)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+def _encode_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+_default_codec: JsonCodec | None = None
+
+
+def default_json_codec() -> JsonCodec:
+    """The fastest installed codec: orjson, msgspec or the stdlib json."""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = _first_available_codec()
+    return _default_codec
+
+
+def _first_available_codec() -> JsonCodec:
+    for codec_class in (OrjsonCodec, MsgspecJsonCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
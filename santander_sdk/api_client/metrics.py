@@ -0,0 +1,336 @@
+"""
+Metrics kept by the SDK itself, exposed in the Prometheus text format.
+
+MetricsRegistry holds counters, gauges and histograms with labels, without any
+metrics library: expose() renders them in the text exposition format (version
+0.0.4), ready to be served on a /metrics endpoint or pushed to a gateway.
+
+SantanderMetrics defines the SDK metrics on a registry. Set it in
+SantanderClientConfiguration(metrics=...) and the clients record:
+
+- santander_request_duration_seconds: latency per method, endpoint template and
+  status class (2xx, 4xx, 5xx or error).
+- santander_token_renewals_total: token renewals per result.
+- santander_retries_total: retries per endpoint family and reason.
+- santander_polling_attempts_total: PIX status polls per step and status.
+- santander_receipt_status_transitions_total: status changes seen by the receipt
+  functions for each receipt request.
+- santander_pool_connections / santander_pool_max_connections: pool utilisation.
+"""
+
+import math
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Iterable
+
+from santander_sdk.api_client.timing import RequestTiming
+
+DEFAULT_LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric(ABC):
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{type(self).__name__}<{self.name}>"
+
+    def _label_values(self, labels: dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """The sample lines of the metric, one per label set."""
+
+    def expose(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.help)}",
+            f"# TYPE {self.name} {self.type}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{self._format_labels(key)} {_number(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: count of each bucket (not cumulative), sum and count.
+        self._values: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._label_values(labels)
+        index = next(
+            (i for i, bound in enumerate(self.buckets) if value <= bound),
+            len(self.buckets),
+        )
+        with self._lock:
+            counts, totals = self._values.setdefault(
+                key, ([0] * (len(self.buckets) + 1), [0.0, 0])
+            )
+            counts[index] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            entry = self._values.get(self._label_values(labels))
+        return int(entry[1][1]) if entry else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(
+                (key, (list(counts), list(totals)))
+                for key, (counts, totals) in self._values.items()
+            )
+        lines = []
+        for key, (counts, (total, count)) in values:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(key, le)} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {int(count)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]):
+        """Called before each exposition, e.g. to update gauges from live stats."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def expose(self) -> str:
+        """All the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        for collect in collectors:
+            collect()
+        return "".join(metric.expose() + "\n" for metric in metrics)
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric) or (
+            existing.labelnames != metric.labelnames
+        ):
+            raise ValueError(f"Metric {metric.name} already registered differently")
+        return existing
+
+
+class SantanderMetrics:
+    """The SDK metrics, recorded by the clients sharing it (see module docstring)."""
+
+    RECEIPT_STATUSES_KEPT = 10_000
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.registry = registry or MetricsRegistry()
+        self.request_duration = self.registry.histogram(
+            "santander_request_duration_seconds",
+            "Latency of the requests to the Santander API.",
+            ("method", "template", "status_class"),
+            latency_buckets,
+        )
+        self.token_renewals = self.registry.counter(
+            "santander_token_renewals_total",
+            "Renewals of the OAuth token.",
+            ("result",),
+        )
+        self.retries = self.registry.counter(
+            "santander_retries_total",
+            "Requests retried by the RetryPolicy.",
+            ("family", "reason"),
+        )
+        self.polling_attempts = self.registry.counter(
+            "santander_polling_attempts_total",
+            "Status checks of PIX payments while polling.",
+            ("step", "status"),
+        )
+        self.receipt_status_transitions = self.registry.counter(
+            "santander_receipt_status_transitions_total",
+            "Status changes of receipt requests.",
+            ("from_status", "to_status"),
+        )
+        self.pool_connections = self.registry.gauge(
+            "santander_pool_connections",
+            "Connections of the HTTP pool by state.",
+            ("client_id", "state"),
+        )
+        self.pool_max_connections = self.registry.gauge(
+            "santander_pool_max_connections",
+            "Connections kept per host by the HTTP pool.",
+            ("client_id",),
+        )
+        self._receipt_statuses: OrderedDict[str, str] = OrderedDict()
+        self._pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.registry.add_collector(self._collect_pools)
+
+    def expose(self) -> str:
+        return self.registry.expose()
+
+    def record_timing(self, timing: RequestTiming):
+        """Timing hook of the clients: request latency and token renewals."""
+        if timing.kind == "token":
+            self.token_renewals.inc(result="error" if timing.error else "success")
+            return
+        self.request_duration.observe(
+            timing.total,
+            method=timing.method,
+            template=timing.template,
+            status_class=status_class(timing.status_code),
+        )
+
+    def record_retry(self, family: str, reason: str | int):
+        self.retries.inc(family=family, reason=reason)
+
+    def record_polling_attempt(self, step: str, status: str | None):
+        self.polling_attempts.inc(step=step, status=status or "unknown")
+
+    def observe_receipt_status(self, receipt_request_id: str, status: str):
+        """Counts a transition when the status of the receipt request changed."""
+        with self._lock:
+            previous = self._receipt_statuses.pop(receipt_request_id, "none")
+            self._receipt_statuses[receipt_request_id] = status
+            if len(self._receipt_statuses) > self.RECEIPT_STATUSES_KEPT:
+                self._receipt_statuses.popitem(last=False)
+        if previous != status:
+            self.receipt_status_transitions.inc(from_status=previous, to_status=status)
+
+    def track_pool(self, client_id: str, adapter, maxsize: int):
+        """Reports the pool of an HTTP adapter while the adapter is alive."""
+        with self._lock:
+            self._pools[adapter] = (client_id, maxsize)
+
+    def _collect_pools(self):
+        totals: dict[str, dict[str, int]] = {}
+        with self._lock:
+            pools = list(self._pools.items())
+        for adapter, (client_id, maxsize) in pools:
+            stats = adapter.pool_stats()
+            total = totals.setdefault(client_id, {"in_use": 0, "idle": 0, "max": 0})
+            total["in_use"] += stats["in_use"]
+            total["idle"] += stats["idle"]
+            total["max"] += maxsize
+        for client_id, total in totals.items():
+            for state in ("in_use", "idle"):
+                self.pool_connections.set(
+                    total[state], client_id=client_id, state=state
+                )
+            self.pool_max_connections.set(total["max"], client_id=client_id)
+
+
+def status_class(status_code: int | None) -> str:
+    if not status_code:
+        return "error"
+    return f"{status_code // 100}xx"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
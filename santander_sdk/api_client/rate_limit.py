@@ -0,0 +1,120 @@
+"""
+Client-side rate limiting of the requests to the Santander API.
+
+Each endpoint family (see endpoints.endpoint_family) has its own token bucket,
+shared by every thread using the client. When the bucket is empty the caller
+either waits for capacity or gets a SantanderRateLimitError right away.
+
+The buckets also follow the API: rate-limit headers (X-RateLimit-Remaining /
+X-RateLimit-Reset or RateLimit-Remaining / RateLimit-Reset) shrink the available
+tokens, and a 429 with Retry-After pauses the family until then.
+"""
+
+import threading
+from time import monotonic, sleep, time
+
+import requests
+
+from santander_sdk.api_client.endpoints import EndpointFamily
+from santander_sdk.api_client.exceptions import SantanderRateLimitError
+from santander_sdk.api_client.retry import parse_retry_after
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float | None = None):
+        """rate: requests per second; capacity: burst size (defaults to rate)."""
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = float(self.capacity)
+        self._updated_at = monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, block: bool = True, timeout: float | None = None) -> bool:
+        """Takes a token, waiting at most `timeout` seconds for it if `block`."""
+        with self._lock:
+            now = self._refill()
+            wait = max(self._paused_until - now, 0)
+            if self._tokens < 1:
+                wait = max(wait, (1 - self._tokens) / self.rate)
+            if wait > 0 and (not block or (timeout is not None and wait > timeout)):
+                return False
+            # Reserving the token before sleeping keeps waiting threads in order.
+            self._tokens -= 1
+
+        if wait > 0:
+            sleep(wait)
+        return True
+
+    def limit_remaining(self, remaining: int):
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, remaining)
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    def _refill(self) -> float:
+        now = monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self._tokens + elapsed * self.rate, self.capacity)
+        self._updated_at = now
+        return now
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        limits: dict[EndpointFamily, float | TokenBucket],
+        block: bool = True,
+        max_wait: float | None = None,
+    ):
+        """
+        - limits: requests per second (or a TokenBucket) per endpoint family.
+          Families without a limit are not throttled.
+        - block: wait for capacity; when False, fail fast with SantanderRateLimitError.
+        - max_wait: longest wait for capacity before failing when blocking.
+        """
+        self.buckets = {
+            family: limit if isinstance(limit, TokenBucket) else TokenBucket(limit)
+            for family, limit in limits.items()
+        }
+        self.block = block
+        self.max_wait = max_wait
+
+    def acquire(self, family: EndpointFamily):
+        bucket = self.buckets.get(family)
+        if bucket is None:
+            return
+        if not bucket.acquire(block=self.block, timeout=self.max_wait):
+            raise SantanderRateLimitError(
+                f"No capacity for {family} requests", family=family
+            )
+
+    def update_from_response(self, family: EndpointFamily, response: requests.Response):
+        bucket = self.buckets.get(family)
+        if bucket is None:
+            return
+
+        headers = response.headers
+        if response.status_code == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            bucket.pause(retry_after if retry_after is not None else 1 / bucket.rate)
+
+        remaining = _header_number(headers, "RateLimit-Remaining")
+        if remaining is None:
+            return
+        bucket.limit_remaining(int(remaining))
+        reset = _header_number(headers, "RateLimit-Reset")
+        if remaining < 1 and reset is not None:
+            # Some APIs send the reset as an epoch timestamp instead of seconds.
+            bucket.pause(reset - time() if reset > 1_000_000_000 else reset)
+
+
+def _header_number(headers, name: str) -> float | None:
+    value = headers.get(f"X-{name}", headers.get(name))
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
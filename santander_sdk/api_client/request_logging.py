@@ -0,0 +1,106 @@
+"""
+Request/response logs of SantanderApiClient and AsyncSantanderApiClient.
+
+The summary of a request is only built when log_request_response_level and the
+logger's level want it, so with "NONE" (or a logger above the level) logging
+costs no parsing. Bodies are capped at log_body_max_size, and successful
+requests are sampled per endpoint family with log_sample_rates.
+"""
+
+import logging
+
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.helpers import (
+    is_log_sampled,
+    response_body_for_log,
+    truncate_body_for_log,
+)
+
+
+def log_request_error(
+    config: SantanderClientConfiguration,
+    logger: logging.Logger,
+    method: str,
+    url: str,
+    params: dict | None,
+    data: dict | None,
+    error: Exception | None,
+    response=None,
+    response_body: dict | None = None,
+):
+    """Logs a failed request, with the response (requests or httpx), if any."""
+    if config.log_request_response_level not in ["ALL", "ERROR"]:
+        return
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+
+    extra = request_summary(
+        config,
+        method,
+        url,
+        response,
+        request_data=data,
+        request_params=params,
+        error=error,
+        response_body=response_body,
+    )
+    logger.error("API request failed", extra=extra)
+
+
+def log_request_success(
+    config: SantanderClientConfiguration,
+    logger: logging.Logger,
+    method: str,
+    url: str,
+    params: dict | None,
+    data: dict | None,
+    response,
+    response_body: dict | None = None,
+):
+    """Logs a successful request, if sampled."""
+    if config.log_request_response_level != "ALL":
+        return
+    if not is_log_sampled(config.log_sample_rates, url):
+        return
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    extra = request_summary(
+        config,
+        method,
+        url,
+        response,
+        request_data=data,
+        request_params=params,
+        response_body=response_body,
+    )
+    logger.info("API request successful", extra=extra)
+
+
+def request_summary(
+    config: SantanderClientConfiguration,
+    method: str,
+    url: str,
+    response,
+    request_data: dict | None = None,
+    request_params: dict | None = None,
+    error: Exception | None = None,
+    response_body: dict | None = None,
+) -> dict:
+    max_size = config.log_body_max_size
+    return {
+        "method": method,
+        "url": url,
+        "request_body": truncate_body_for_log(request_data, max_size),
+        "request_params": request_params,
+        "status_code": response.status_code if response is not None else None,
+        "response_body": response_body_for_log(
+            response, max_size, response_body, config.json_codec
+        )
+        if response is not None
+        else None,
+        "status": "error" if error else "success",
+        "error": {"message": str(error), "type": type(error).__name__}
+        if error
+        else None,
+    }
@@ -0,0 +1,164 @@
+"""
+Opt-in cache of the GET responses of SantanderApiClient.
+
+Each CacheRule gives the TTL of the responses whose URL matches its pattern.
+A rule can keep responses in a terminal status for longer (forever by default):
+a PIX payment that is PAYED or REJECTED never changes again, while an in-flight
+one is only reused for a moment. Responses without a matching rule, like the
+payment listing, are not cached.
+
+The cache holds at most `max_entries` responses, evicting the least recently
+used. Any POST/PUT/PATCH/DELETE through the client drops the cached responses of
+its exact URL (a POST to the payments collection keeps the cached payments), and
+invalidate() drops entries under a URL prefix explicitly.
+"""
+
+import copy
+import math
+import re
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable
+
+from santander_sdk.types import OrderStatus
+from santander_sdk.typing.receipts_types import ReceiptStatus
+
+FOREVER = math.inf
+
+CacheKey = tuple[str, tuple]
+
+
+def _payment_status(response: dict) -> str | None:
+    return response.get("status")
+
+
+def _receipt_status(response: dict) -> str | None:
+    return response.get("file", {}).get("statusInfo", {}).get("statusCode")
+
+
+class CacheRule:
+    def __init__(
+        self,
+        pattern: str,
+        ttl: float,
+        terminal_statuses: frozenset[str] = frozenset(),
+        terminal_ttl: float = FOREVER,
+        status: Callable[[dict], str | None] = _payment_status,
+    ):
+        """
+        - pattern: regex searched in the URL of the request.
+        - ttl: seconds a response is reused.
+        - terminal_statuses/terminal_ttl: responses whose status(response) is one of
+          terminal_statuses are reused for terminal_ttl seconds instead.
+        """
+        self.pattern = re.compile(pattern)
+        self.ttl = ttl
+        self.terminal_statuses = terminal_statuses
+        self.terminal_ttl = terminal_ttl
+        self.status = status
+
+    def __repr__(self):
+        return f"CacheRule<{self.pattern.pattern} ttl={self.ttl}>"
+
+    def ttl_for(self, response: dict) -> float:
+        if self.terminal_statuses and self.status(response) in self.terminal_statuses:
+            return self.terminal_ttl
+        return self.ttl
+
+
+DEFAULT_CACHE_RULES = (
+    # get_transfer / payment status polling: shorter than the polling interval.
+    CacheRule(
+        r"/pix_payments/[^/?]+$",
+        ttl=1,
+        terminal_statuses=frozenset({OrderStatus.PAYED, OrderStatus.REJECTED}),
+    ),
+    # get_receipt: a request in EXPUNGED or ERROR is never reused by the API.
+    CacheRule(
+        r"/file_requests/[^/?]+$",
+        ttl=5,
+        terminal_statuses=frozenset({ReceiptStatus.EXPUNGED, ReceiptStatus.ERROR}),
+        status=_receipt_status,
+    ),
+    # receipt_creation_history
+    CacheRule(r"/file_requests$", ttl=30),
+    # get_workspaces
+    CacheRule(r"/workspaces$", ttl=3600),
+)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        rules: tuple[CacheRule, ...] = DEFAULT_CACHE_RULES,
+    ):
+        self.max_entries = max_entries
+        self.rules = rules
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: dict | None) -> CacheKey:
+        return url, tuple(sorted(params.items())) if params else ()
+
+    def rule_for(self, url: str) -> CacheRule | None:
+        return next((rule for rule in self.rules if rule.pattern.search(url)), None)
+
+    def get(self, key: CacheKey) -> dict | None:
+        """A copy of the cached response, or None (counted as a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry[0])
+
+    def set(self, key: CacheKey, response: dict, rule: CacheRule | None = None):
+        rule = rule or self.rule_for(key[0])
+        if rule is None:
+            return
+        ttl = rule.ttl_for(response)
+        if ttl <= 0:
+            return
+
+        entry = (copy.deepcopy(response), monotonic() + ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, url_prefix: str | None = None):
+        """Drops the responses whose URL starts with url_prefix, or all of them."""
+        with self._lock:
+            if url_prefix is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0].startswith(url_prefix)]:
+                del self._entries[key]
+
+    def discard(self, url: str):
+        """Drops the responses of exactly url, whatever their params."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == url]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
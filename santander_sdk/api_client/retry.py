@@ -0,0 +1,133 @@
+"""
+Retry policy of SantanderApiClient requests.
+
+Only safe calls are retried: GETs, and POSTs carrying the client-supplied payment
+"id" (Santander rejects a second creation with the same id, so resending it cannot
+duplicate the payment). Retries back off exponentially with full jitter, honour the
+Retry-After header and are capped by a RetryBudget shared by all threads of the
+client, so an outage does not multiply the traffic sent to the API.
+"""
+
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of the requests.
+
+    Every request deposits `ratio` tokens and every retry withdraws one. The
+    bucket starts with `min_retries` tokens and holds at most `max_retries`.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_retries: float = 10, max_retries: float = 100
+    ):
+        self.ratio = ratio
+        self.max_retries = max_retries
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_request(self):
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.max_retries)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        max_retry_after: float = 60,
+        status_codes: frozenset[int] = RETRY_STATUS_CODES,
+        budget: RetryBudget | None = None,
+    ):
+        """
+        - max_attempts: total attempts of a call, including the first one.
+        - backoff_factor/max_backoff: the n-th retry waits a random time between 0
+          and min(max_backoff, backoff_factor * 2 ** (n - 1)) seconds.
+        - max_retry_after: a Retry-After longer than this fails the call right away.
+        - budget: shared cap on retries; a default RetryBudget is used if omitted.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.status_codes = status_codes
+        self.budget = budget or RetryBudget()
+
+    def is_safe_call(self, method: str, data: dict | None) -> bool:
+        if method == "GET":
+            return True
+        return method == "POST" and bool(data and data.get("id"))
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        return isinstance(
+            error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        )
+
+    def retry_delay(
+        self,
+        method: str,
+        data: dict | None,
+        attempt: int,
+        response: requests.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Seconds to wait before the next attempt, or None to stop retrying."""
+        if attempt >= self.max_attempts or not self.is_safe_call(method, data):
+            return None
+        if response is not None and response.status_code not in self.status_codes:
+            return None
+        if error is not None and not self.is_retryable_error(error):
+            return None
+
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if not self.budget.try_withdraw():
+            return None
+
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After in seconds, given either as delay-seconds or as an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
@@ -0,0 +1,123 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+
+While a GET is in flight, the same GET (same resolved URL and params) made by other
+threads or tasks does not go to the API: it waits for the first one and gets a copy of
+its result, or its exception. Status polling of the same PIX payment or receipt request
+from several places turns into one request at a time.
+
+Only calls made while the first one is in flight are coalesced; nothing is cached
+after it returns (see response_cache for that). Errors that only concern the first
+call (e.g. its own deadline running out) are not shared: the waiters run the call
+themselves.
+"""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+RequestKey = tuple[str, str, tuple]
+
+
+def request_key(method: str, url: str, params: dict | None) -> RequestKey:
+    return method, url, tuple(sorted(params.items())) if params else ()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces the calls of a key made from several threads."""
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout: float | None = None,
+        rerun_on: tuple[type[BaseException], ...] = (),
+    ):
+        """
+        Runs fn(), unless a call of the key is in flight: then waits for it (up to
+        timeout seconds, raising TimeoutError) and returns a copy of its result.
+        If that call raises one of rerun_on, fn() is run again instead.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fn()
+                return call.result
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if not call.done.wait(timeout):
+            raise TimeoutError(f"Timed out waiting for the in-flight call of {key}")
+        if isinstance(call.error, rerun_on):
+            return self.do(key, fn, timeout, rerun_on)
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.result)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Coalesces the calls of a key made from several tasks of an event loop."""
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]):
+        """Awaits fn(), or a copy of the result of the call of the key in flight."""
+        while (future := self._calls.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The task running the call was cancelled, not this one: retry.
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved, even without waiters.
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def in_flight(self) -> int:
+        return len(self._calls)
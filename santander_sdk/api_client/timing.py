@@ -0,0 +1,164 @@
+"""
+Per-request timing breakdown, for instrumentation hooks (APM, tracing, metrics).
+
+With timing_hooks in SantanderClientConfiguration, each call of
+SantanderApiClient._request and each token renewal (SantanderAuth.renew) produces a
+RequestTiming, passed to every hook once the call ends (successful or not). The
+time of the call is split in phases, in seconds, summed over all its attempts:
+
+- token: getting the token for the Authorization header, renewals included.
+- pool_wait: waiting for a connection of the pool.
+- connect: TCP and TLS handshake of new HTTPS connections.
+- server: sending the request and reading the response (the rest of the transport).
+- parse: decoding the JSON response.
+- logging: building and emitting the request logs.
+
+The phases are collected through a context variable, so the shared connection pool
+and auth attribute their time to the call of the current thread (or task). Without
+hooks nothing is measured.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Callable, Iterator
+
+PHASES = ("token", "pool_wait", "connect", "server", "parse", "logging")
+
+_current_timing: ContextVar["RequestTiming | None"] = ContextVar(
+    "santander_request_timing", default=None
+)
+
+
+class RequestTiming:
+    def __init__(self, kind: str, method: str, url: str, template: str):
+        """kind is "request" for client calls and "token" for token renewals."""
+        self.kind = kind
+        self.method = method
+        self.url = url
+        self.template = template
+        self.status_code: int | None = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.attempts = 0
+        self.error: str | None = None
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.total = 0.0
+        self._start = monotonic()
+
+    def __repr__(self):
+        return (
+            f"RequestTiming<{self.method} {self.template} {self.status_code} "
+            f"{self.total * 1000:.1f}ms>"
+        )
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] += seconds
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        start = monotonic()
+        try:
+            yield
+        finally:
+            self.phases[phase] += monotonic() - start
+
+    @contextmanager
+    def measure_transport(self) -> Iterator[None]:
+        """Counts an attempt, adding its time out of the nested phases to server."""
+        nested = ("token", "pool_wait", "connect")
+        before = sum(self.phases[phase] for phase in nested)
+        start = monotonic()
+        try:
+            yield
+        finally:
+            elapsed = monotonic() - start
+            after = sum(self.phases[phase] for phase in nested)
+            self.phases["server"] += max(elapsed - (after - before), 0.0)
+            self.attempts += 1
+
+    def record_response(self, request_body: bytes | None, status_code: int, content):
+        self.status_code = status_code
+        self.request_bytes += len(request_body or b"")
+        self.response_bytes = len(content or b"")
+
+    def finish(self):
+        self.total = monotonic() - self._start
+
+    def as_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "method": self.method,
+            "url": self.url,
+            "template": self.template,
+            "status_code": self.status_code,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "attempts": self.attempts,
+            "error": self.error,
+            "total": self.total,
+            **self.phases,
+        }
+
+
+TimingHook = Callable[[RequestTiming], None]
+
+
+def current_timing() -> RequestTiming | None:
+    """The timing of the call running in this thread (or task), if measured."""
+    return _current_timing.get()
+
+
+@contextmanager
+def measure_phase(phase: str) -> Iterator[None]:
+    """Adds the time of the block to the phase of the current timing, if any."""
+    timing = _current_timing.get()
+    if timing is None:
+        yield
+        return
+    with timing.measure(phase):
+        yield
+
+
+@contextmanager
+def measure_transport() -> Iterator[RequestTiming | None]:
+    """Measures an attempt of the current timing, if any (see measure_transport)."""
+    timing = _current_timing.get()
+    if timing is None:
+        yield None
+        return
+    with timing.measure_transport():
+        yield timing
+
+
+@contextmanager
+def timing_scope(
+    timing: RequestTiming | None,
+    hooks: list[TimingHook],
+    logger: logging.Logger,
+) -> Iterator[RequestTiming | None]:
+    """Makes the timing current for the block, then finishes and emits it."""
+    if timing is None:
+        yield None
+        return
+
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    except BaseException as e:
+        timing.error = timing.error or type(e).__name__
+        raise
+    finally:
+        _current_timing.reset(token)
+        timing.finish()
+        emit_timing(hooks, timing, logger)
+
+
+def emit_timing(hooks: list[TimingHook], timing: RequestTiming, logger):
+    """Calls every hook with the timing. A failing hook never fails the request."""
+    for hook in hooks:
+        try:
+            hook(timing)
+        except Exception as e:
+            logger.warning(f"Timing hook {hook!r} failed: {e}")
@@ -0,0 +1,101 @@
+"""
+Token stores let several SantanderAuth instances share the same OAuth token.
+
+Each gunicorn/celery process builds its own client and, without a store, fetches its
+own token. With a shared store, the first process to need a token fetches it and the
+others (and the processes started after a restart) reuse it until it expires.
+
+To plug another backend (Redis, memcached, a database), subclass TokenStore:
+    - get/set read and write the token and its expiration for a key. A Redis backend
+      would use SET with EXAT so the key expires together with the token.
+    - lock serializes the renewal between processes. A Redis backend would use
+      SET NX PX with a random value, releasing it only if the value still matches.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+
+class TokenStore(ABC):
+    @abstractmethod
+    def get(self, key: str) -> tuple[str, datetime] | None:
+        """Return the stored (token, expires_at) for the key, if any."""
+
+    @abstractmethod
+    def set(self, key: str, token: str, expires_at: datetime) -> None:
+        """Store the token for the key until expires_at."""
+
+    @abstractmethod
+    def lock(self, key: str) -> AbstractContextManager[None]:
+        """Exclusive lock held while checking the store and renewing the token."""
+
+
+class MemoryTokenStore(TokenStore):
+    """Shares a token between clients of the same process."""
+
+    def __init__(self):
+        self._tokens: dict[str, tuple[str, datetime]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: str) -> tuple[str, datetime] | None:
+        return self._tokens.get(key)
+
+    def set(self, key: str, token: str, expires_at: datetime) -> None:
+        self._tokens[key] = (token, expires_at)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._guard:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """Shares a token between the processes of a host through files in a directory.
+
+    The renewal is serialized with an advisory lock (flock), so only POSIX systems
+    are supported. Token files are only readable by the owner.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def get(self, key: str) -> tuple[str, datetime] | None:
+        try:
+            data = json.loads(self._path(key, ".json").read_text())
+            return data["access_token"], datetime.fromtimestamp(data["expires_at"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, token: str, expires_at: datetime) -> None:
+        path = self._path(key, ".json")
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"access_token": token, "expires_at": expires_at.timestamp()}, f)
+        os.replace(tmp_path, path)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        import fcntl
+
+        fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}{suffix}"
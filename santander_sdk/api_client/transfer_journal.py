@@ -0,0 +1,163 @@
+"""
+Write-ahead journal of PIX transfers, for batches that survive a crashed worker.
+
+With SantanderClientConfiguration(transfer_journal=...), transfer_pix and
+SantanderPaymentFlow record each step of a transfer, keyed by the payment id
+sent on creation (one is generated when the caller gives none):
+
+- before the creation is sent, the creation request (step CREATE, no status);
+- each status returned by the API (creation, status checks, confirmation);
+- before the confirmation is sent, the step CONFIRM;
+- the error that interrupted the flow, if any.
+
+After a crash, resume_transfer_pix / resume_incomplete_transfers (santander_sdk.pix)
+finish only the transfers not PAYED or REJECTED: the current status is fetched
+from the API, a payment never created is created with the journaled request, a
+READY_TO_PAY one is confirmed and a PENDING_CONFIRMATION one is awaited. Calling
+transfer_pix again with the id of a journaled transfer resumes it instead of
+creating a duplicate.
+
+SQLiteTransferJournal is the default backend, in WAL mode with a synchronous
+commit per step. To plug another one (e.g. a table of the application's
+database), subclass TransferJournal.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from time import time
+from typing import Literal, TypedDict
+
+from santander_sdk.types import ConfirmOrderStatus, OrderStatusType
+
+TransferStep = Literal["CREATE", "CONFIRM"]
+FINAL_STATUSES = (ConfirmOrderStatus.PAYED, ConfirmOrderStatus.REJECTED)
+
+
+class TransferJournalEntry(TypedDict):
+    id: str
+    request: dict
+    step: TransferStep
+    status: OrderStatusType | None
+    error: str | None
+    created_at: float
+    updated_at: float
+
+
+class TransferJournal(ABC):
+    @abstractmethod
+    def begin(self, id: str, request: dict) -> bool:
+        """Records the creation request before it is sent; False if already journaled."""
+
+    @abstractmethod
+    def record(
+        self,
+        id: str,
+        step: TransferStep | None = None,
+        status: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Records the progress of the transfer; the error is cleared when None."""
+
+    @abstractmethod
+    def get(self, id: str) -> TransferJournalEntry | None:
+        """The journaled transfer of the payment id, if any."""
+
+    @abstractmethod
+    def incomplete(self) -> list[TransferJournalEntry]:
+        """The transfers neither PAYED nor REJECTED, oldest first."""
+
+
+class SQLiteTransferJournal(TransferJournal):
+    """Journal in a SQLite database, shared by the threads and processes of a host."""
+
+    def __init__(self, path: str | os.PathLike, timeout: float = 30):
+        self.path = path
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=FULL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pix_transfers ("
+                " id TEXT PRIMARY KEY,"
+                " request TEXT NOT NULL,"
+                " step TEXT NOT NULL,"
+                " status TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS pix_transfers_status"
+                " ON pix_transfers (status)"
+            )
+
+    def __repr__(self):
+        return f"SQLiteTransferJournal<{self.path}>"
+
+    def begin(self, id: str, request: dict) -> bool:
+        now = time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO pix_transfers"
+                " (id, request, step, created_at, updated_at)"
+                " VALUES (?, ?, 'CREATE', ?, ?)",
+                (id, json.dumps(request, default=str), now, now),
+            )
+        return cursor.rowcount == 1
+
+    def record(
+        self,
+        id: str,
+        step: TransferStep | None = None,
+        status: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE pix_transfers SET step = COALESCE(?, step),"
+                " status = COALESCE(?, status), error = ?, updated_at = ?"
+                " WHERE id = ?",
+                (step, status, error, time(), id),
+            )
+
+    def get(self, id: str) -> TransferJournalEntry | None:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {self._COLUMNS} FROM pix_transfers WHERE id = ?", (id,)
+            ).fetchone()
+        return self._entry(row) if row else None
+
+    def incomplete(self) -> list[TransferJournalEntry]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {self._COLUMNS} FROM pix_transfers"
+                " WHERE status IS NULL OR status NOT IN (?, ?)"
+                " ORDER BY created_at",
+                FINAL_STATUSES,
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    _COLUMNS = "id, request, step, status, error, created_at, updated_at"
+
+    @staticmethod
+    def _entry(row: tuple) -> TransferJournalEntry:
+        id, request, step, status, error, created_at, updated_at = row
+        return {
+            "id": id,
+            "request": json.loads(request),
+            "step": step,
+            "status": status,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
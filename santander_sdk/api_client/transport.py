@@ -0,0 +1,131 @@
+"""
+Transports (connection pool and mTLS context) shared by clients of the same account.
+
+By default each SantanderApiClient has its own connection pool, and every new
+connection loads the client certificate from disk again. With a TransportRegistry in
+SantanderClientConfiguration(transport_registry=...), the clients with the same
+base_url and cert share one SantanderTransport: one pool and one SSL context with the
+certificate loaded once. Tokens, workspaces and everything else stay per client.
+
+The registry counts the clients of each transport: closing (or garbage collecting)
+the last one closes its connections and drops it. The pool settings of the first
+client of a transport are the ones used.
+"""
+
+import ssl
+import threading
+from typing import TYPE_CHECKING
+
+from requests import Session
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, extract_zipped_paths
+from urllib3.util.ssl_ import create_urllib3_context
+
+from santander_sdk.api_client.base import SantanderHTTPAdapter
+
+if TYPE_CHECKING:
+    from santander_sdk.api_client.client_configuration import (
+        SantanderClientConfiguration,
+    )
+
+TransportKey = tuple[str, str]
+
+
+class SharedSSLContextAdapter(SantanderHTTPAdapter):
+    """SantanderHTTPAdapter with one SSL context, with the client cert, for HTTPS.
+
+    The certificate and the CA bundle are loaded once, instead of for each new
+    connection. Sessions using it must not set their own cert. If the certificate
+    can't be loaded, ssl_context is None and sessions keep passing the cert, so the
+    error shows up on the requests as usual.
+    """
+
+    def __init__(self, cert: str, **kwargs):
+        self.cert = cert
+        self.ssl_context = _client_ssl_context(cert)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.ssl_context is not None:
+            pool_kwargs.setdefault("ssl_context", self.ssl_context)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+
+def _client_ssl_context(cert: str) -> ssl.SSLContext | None:
+    try:
+        context = create_urllib3_context()
+        context.load_verify_locations(extract_zipped_paths(DEFAULT_CA_BUNDLE_PATH))
+        context.load_cert_chain(cert)
+    except (OSError, ssl.SSLError):
+        return None
+    return context
+
+
+class SantanderTransport:
+    def __init__(self, key: TransportKey, adapter: SantanderHTTPAdapter):
+        self.key = key
+        self.adapter = adapter
+        self.clients = 0
+
+    def __repr__(self):
+        return f"SantanderTransport<{self.key[0]} clients={self.clients}>"
+
+    @classmethod
+    def from_config(
+        cls, config: "SantanderClientConfiguration", shared: bool = False
+    ) -> "SantanderTransport":
+        """A transport for the config; shared ones use one SSL context with the cert."""
+        pool_kwargs = dict(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+            keep_alive=config.pool_keep_alive,
+        )
+        adapter = (
+            SharedSSLContextAdapter(config.cert, **pool_kwargs)
+            if shared
+            else SantanderHTTPAdapter(**pool_kwargs)
+        )
+        return cls((config.base_url, config.cert), adapter)
+
+    def mount(self, session: Session, cert: str):
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        shared_context = getattr(self.adapter, "ssl_context", None)
+        session.cert = None if shared_context is not None else cert
+
+    def close(self):
+        self.adapter.close()
+
+
+class TransportRegistry:
+    def __init__(self):
+        self._transports: dict[TransportKey, SantanderTransport] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._transports)
+
+    def acquire(self, config: "SantanderClientConfiguration") -> SantanderTransport:
+        """The transport of the config's base_url and cert, counting one more client."""
+        key = (config.base_url, config.cert)
+        with self._lock:
+            transport = self._transports.get(key)
+            if transport is None:
+                transport = SantanderTransport.from_config(config, shared=True)
+                self._transports[key] = transport
+            transport.clients += 1
+            return transport
+
+    def release(self, transport: SantanderTransport):
+        """One client less; the transport is closed when no client is left."""
+        with self._lock:
+            transport.clients -= 1
+            if transport.clients > 0:
+                return
+            if self._transports.get(transport.key) is transport:
+                del self._transports[transport.key]
+        transport.close()
+
+
+default_transport_registry = TransportRegistry()
@@ -0,0 +1,103 @@
+"""
+Workspace caches keep the discovered workspace ID of a client_id.
+
+Without workspace_id in the configuration, the client looks up the first active
+PAYMENTS workspace the first time a :workspaceid endpoint is used. The result is
+kept in the cache for `ttl` seconds, so clients built per request (or in a new
+serverless instance, with FileWorkspaceCache) skip that lookup. Configurations
+without a workspace_cache share default_workspace_cache, keyed by base_url and
+client_id.
+
+To plug another backend, subclass WorkspaceCache and implement get, set and
+invalidate; the entries must expire after `ttl` seconds.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from time import time
+
+DEFAULT_WORKSPACE_TTL_SECS = 24 * 60 * 60
+
+
+class WorkspaceCache(ABC):
+    def __init__(self, ttl: float = DEFAULT_WORKSPACE_TTL_SECS):
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Return the cached workspace ID for the key, unless it has expired."""
+
+    @abstractmethod
+    def set(self, key: str, workspace_id: str) -> None:
+        """Cache the workspace ID for the key for `ttl` seconds."""
+
+    @abstractmethod
+    def invalidate(self, key: str) -> None:
+        """Drop the cached workspace ID of the key, if any."""
+
+
+class MemoryWorkspaceCache(WorkspaceCache):
+    """Shares the workspace ID between clients of the same process."""
+
+    def __init__(self, ttl: float = DEFAULT_WORKSPACE_TTL_SECS):
+        super().__init__(ttl)
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time():
+            return None
+        return entry[0]
+
+    def set(self, key: str, workspace_id: str) -> None:
+        with self._lock:
+            self._entries[key] = (workspace_id, time() + self.ttl)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+default_workspace_cache = MemoryWorkspaceCache()
+
+
+class FileWorkspaceCache(WorkspaceCache):
+    """Shares the workspace ID between processes (and restarts) through files."""
+
+    def __init__(
+        self, directory: str | os.PathLike, ttl: float = DEFAULT_WORKSPACE_TTL_SECS
+    ):
+        super().__init__(ttl)
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def get(self, key: str) -> str | None:
+        try:
+            data = json.loads(self._path(key).read_text())
+            if data["expires_at"] <= time():
+                return None
+            return data["workspace_id"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, workspace_id: str) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {"workspace_id": workspace_id, "expires_at": time() + self.ttl}, f
+            )
+        os.replace(tmp_path, path)
+
+    def invalidate(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}.workspace.json"
@@ -1,5 +1,7 @@
 from typing import Literal
 
+from santander_sdk.api_client.endpoints import WORKSPACES_ENDPOINT
+
 """
     Para ter acesso ao sistema cliente e consumir as APIs, se faz necessário ter o cadastro de
     uma ou mais Workspaces, sendo a Workspace a “porta de entrada” para ter o acesso ao Hub de
@@ -16,9 +18,6 @@ from typing import Literal
 WorkspaceType = Literal["PHYSICAL_CORBAN", "PAYMENTS", "DIGITAL_CORBAN"]
 
 
-WORKSPACES_ENDPOINT = "/management_payments_partners/v1/workspaces"
-
-
 def get_workspaces(client):
     response = client.get(WORKSPACES_ENDPOINT)
     return response.get("_content", None)
@@ -26,6 +25,12 @@ def get_workspaces(client):
 
 def get_first_workspace_id_of_type(client, workspace_type: WorkspaceType) -> str | None:
     workspaces = get_workspaces(client)
+    return first_workspace_id_of_type(workspaces, workspace_type)
+
+
+def first_workspace_id_of_type(
+    workspaces: list[dict] | None, workspace_type: WorkspaceType
+) -> str | None:
     if workspaces is None or len(workspaces) == 0:
         return None
 
@@ -45,6 +45,8 @@ https://developer.santander.com.br/api/documentacao/comprovantes-visao-geral/
 from time import sleep
 from typing import Generator, List, cast
 from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.endpoints import RECEIPTS, RECEIPTS_ENDPOINT
 from santander_sdk.api_client.exceptions import SantanderRequestError
 from santander_sdk.typing.receipts_types import (
     ALREADY_REQUESTED_RECEIPT,
@@ -57,16 +59,17 @@ from santander_sdk.typing.receipts_types import (
     ReceiptCreationHistoryResponse,
 )
 
-RECEIPTS_ENDPOINT = "/consult_payment_receipts/v1/payment_receipts"
-
 
 def payment_list(
-    client: SantanderApiClient, params: ListPaymentParams
+    client: SantanderApiClient,
+    params: ListPaymentParams,
+    deadline: Deadline | None = None,
 ) -> List[PaymentReceipts]:
     """List all payments by filters. Returns all pages of results.
     - See ListPaymentsParams for available filters.
+    - The deadline, if any, covers all the pages.
     """
-    responses = payment_list_iter_by_pages(client, params)
+    responses = payment_list_iter_by_pages(client, params, deadline)
     payments = []
     for response in responses:
         payments += response["paymentsReceipts"]
@@ -74,10 +77,12 @@ def payment_list(
 
 
 def payment_list_iter_by_pages(
-    client: SantanderApiClient, params: ListPaymentParams
+    client: SantanderApiClient,
+    params: ListPaymentParams,
+    deadline: Deadline | None = None,
 ) -> Generator[ListPaymentsResponse, None, None]:
     """Paginated version of list_payments. Each iteration returns a page of results."""
-    response = _payment_list_request(client, params)
+    response = _payment_list_request(client, params, deadline)
     yield response
     while "_next" in response.get("links", {}):
         try:
@@ -86,24 +91,29 @@ def payment_list_iter_by_pages(
                 break
             next_offset = next_link["href"].split("_offset=")[1].split("&")[0]
             params["_offset"] = next_offset
-            response = _payment_list_request(client, params)
+            response = _payment_list_request(client, params, deadline)
             yield response
         except KeyError as e:
             raise Exception(f"Expected the next page, but not found: {e}")
 
 
 def create_receipt(
-    client: SantanderApiClient, payment_id: str, handle_already_created: bool = True
+    client: SantanderApiClient,
+    payment_id: str,
+    handle_already_created: bool = True,
+    deadline: Deadline | None = None,
 ) -> ReceiptInfoResult:
     """Create a payment receipt request.
     You need the request.requestId to get the receipt when it's ready.
     """
     if not payment_id:
         raise ValueError("payment_id is required to create a receipt request.")
-    endpoint = f"{RECEIPTS_ENDPOINT}/{payment_id}/file_requests"
+    endpoint = RECEIPTS.format(payment_id, "file_requests")
     try:
-        response = cast(ReceiptInfoResponse, client.post(endpoint, None))
-        return _receipt_result(response, payment_id)
+        response = cast(
+            ReceiptInfoResponse, client.post(endpoint, None, deadline=deadline)
+        )
+        return _observe_status(client, _receipt_result(response, payment_id))
     except SantanderRequestError as e:
         if e.status_code == 400 and handle_already_created:
             """if a receipt was already requested the Santander API 
@@ -113,44 +123,54 @@ def create_receipt(
                 err.get("code") == ALREADY_REQUESTED_RECEIPT
                 for err in e.content.get("errors", [])
             ):
-                return _handle_already_created(client, payment_id, e)
+                return _handle_already_created(client, payment_id, e, deadline)
         raise
 
 
 def get_receipt(
-    client: SantanderApiClient, payment_id: str, receipt_request_id: str
+    client: SantanderApiClient,
+    payment_id: str,
+    receipt_request_id: str,
+    deadline: Deadline | None = None,
 ) -> ReceiptInfoResult:
     """Get the payment receipt information to download the file."""
     if not (payment_id and receipt_request_id):
         raise ValueError("payment_id and receipt_request are required")
-    endpoint = f"{RECEIPTS_ENDPOINT}/{payment_id}/file_requests/{receipt_request_id}"
-    response = cast(ReceiptInfoResponse, client.get(endpoint))
-    return _receipt_result(response, payment_id)
+    endpoint = RECEIPTS.format(payment_id, "file_requests", receipt_request_id)
+    response = cast(ReceiptInfoResponse, client.get(endpoint, deadline=deadline))
+    return _observe_status(client, _receipt_result(response, payment_id))
 
 
 def receipt_creation_history(
-    client: SantanderApiClient, payment_id: str
+    client: SantanderApiClient, payment_id: str, deadline: Deadline | None = None
 ) -> ReceiptCreationHistoryResponse:
     """List the history of receipt creation requests."""
-    endpoint = f"{RECEIPTS_ENDPOINT}/{payment_id}/file_requests"
-    response = client.get(endpoint)
+    endpoint = RECEIPTS.format(payment_id, "file_requests")
+    response = client.get(endpoint, deadline=deadline)
     return cast(ReceiptCreationHistoryResponse, response)
 
 
 def _payment_list_request(
-    client: SantanderApiClient, params: ListPaymentParams
+    client: SantanderApiClient,
+    params: ListPaymentParams,
+    deadline: Deadline | None = None,
 ) -> ListPaymentsResponse:
     """List payments by filters.
     Limited to 1000 results per page and 30 days of history.
     """
     if not params.get("_limit"):
         params["_limit"] = "1000"
-    response = client.get(RECEIPTS_ENDPOINT, params=cast(dict, params))
+    response = client.get(
+        RECEIPTS_ENDPOINT, params=cast(dict, params), deadline=deadline
+    )
     return cast(ListPaymentsResponse, response)
 
 
 def _handle_already_created(
-    client: SantanderApiClient, payment_id: str, error: SantanderRequestError
+    client: SantanderApiClient,
+    payment_id: str,
+    error: SantanderRequestError,
+    deadline: Deadline | None = None,
 ) -> ReceiptInfoResult:
     """This retrieve the request from history to renew the file.
     After retrieving from history, we need to refresh the status to generate a new one.
@@ -161,21 +181,34 @@ def _handle_already_created(
     client.logger.info(
         "Receipt already requested. Trying to get the receipt request ID."
     )
-    receipt_history = receipt_creation_history(client, payment_id)
+    receipt_history = receipt_creation_history(client, payment_id, deadline)
     if not receipt_history["paymentReceiptsFileRequests"]:
         client.logger.error("No previous receipts in history")
         raise
     last_from_history = receipt_history["paymentReceiptsFileRequests"][-1]
     request_id = last_from_history["request"]["requestId"]
-    result = get_receipt(client, payment_id, request_id)
+    result = get_receipt(client, payment_id, request_id, deadline)
     if result["status"] not in [ReceiptStatus.EXPUNGED, ReceiptStatus.ERROR]:
         return result
 
     client.logger.info("The last receipt is in an error state, creating another one.")
-    sleep(0.5)
-    endpoint = f"{RECEIPTS_ENDPOINT}/{payment_id}/file_requests"
-    response = cast(ReceiptInfoResponse, client.post(endpoint, None))
-    return _receipt_result(response, payment_id)
+    if deadline is not None:
+        deadline.sleep(0.5, "creating another receipt")
+    else:
+        sleep(0.5)
+    endpoint = RECEIPTS.format(payment_id, "file_requests")
+    response = cast(ReceiptInfoResponse, client.post(endpoint, None, deadline=deadline))
+    return _observe_status(client, _receipt_result(response, payment_id))
+
+
+def _observe_status(
+    client: SantanderApiClient, result: ReceiptInfoResult
+) -> ReceiptInfoResult:
+    """Reports the status of the receipt request to the metrics, if configured."""
+    metrics = client.config.metrics
+    if metrics is not None:
+        metrics.observe_receipt_status(result["receipt_request_id"], result["status"])
+    return result
 
 
 def _receipt_result(
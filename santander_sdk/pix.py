@@ -3,21 +3,34 @@ import uuid
 from typing import cast
 
 from santander_sdk.api_client.client import SantanderApiClient
-from santander_sdk.api_client.exceptions import SantanderClientError
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.endpoints import PIX, PIX_ENDPOINT
+from santander_sdk.api_client.exceptions import (
+    SantanderClientError,
+    SantanderDeadlineExceededError,
+    SantanderRequestError,
+    SantanderStatusTimeoutError,
+)
 
 from santander_sdk.api_client.helpers import (
     get_pix_key_type,
     truncate_value,
 )
-from santander_sdk.transfer_flow import SantanderPaymentFlow
+from santander_sdk.api_client.idempotency import idempotency_id
+from santander_sdk.api_client.transfer_journal import TransferJournalEntry
+from santander_sdk.pix_handle import PixTransferHandle
+from santander_sdk.transfer_flow import (
+    MAX_UPDATE_STATUS_AFTER_CONFIRM,
+    UPDATE_STATUS_INTERVAL_TIME,
+    SantanderPaymentFlow,
+)
 from santander_sdk.types import (
+    OrderStatus,
     SantanderBeneficiary,
     SantanderPixResponse,
     TransferPixResult,
 )
 
-PIX_ENDPOINT = "/management_payments_partners/v1/workspaces/:workspaceid/pix_payments"
-
 
 def transfer_pix(
     client: SantanderApiClient,
@@ -26,53 +39,325 @@ def transfer_pix(
     description: str,
     tags: list[str] = [],
     id: uuid.UUID | str | None = None,
+    deadline: Deadline | None = None,
+    idempotency_key: str | None = None,
 ) -> TransferPixResult:
-    transfer_flow = SantanderPaymentFlow(client, PIX_ENDPOINT)
+    """
+    Creates and confirms a PIX payment, waiting until it is PAYED.
 
-    try:
-        if value is None or value <= 0:
-            raise ValueError(f"Invalid value for PIX transfer: {value}")
+    With an idempotency_key (instead of an id), the payment id is derived from it,
+    so a retry of the same payout reuses the payment. With the client's
+    idempotency_registry, a transfer of an id already in flight or recently paid
+    in this process returns that result without any request.
+    """
+    id = _payment_id(client, id, idempotency_key)
+    registry = client.config.idempotency_registry
+    if registry is None or id is None:
+        return _transfer_pix(client, pix_key, value, description, tags, id, deadline)
+    outcome = registry.run(
+        str(id),
+        lambda: _transfer_pix(client, pix_key, value, description, tags, id, deadline),
+    )
+    if isinstance(outcome, PixTransferHandle):
+        return _wait_handle(outcome)
+    return cast(TransferPixResult, outcome)
+
+
+def submit_transfer_pix(
+    client: SantanderApiClient,
+    pix_key: str | SantanderBeneficiary,
+    value: D,
+    description: str,
+    tags: list[str] = [],
+    id: uuid.UUID | str | None = None,
+    deadline: Deadline | None = None,
+    idempotency_key: str | None = None,
+) -> PixTransferHandle:
+    """
+    Creates and confirms a PIX payment like transfer_pix, but returns as soon as
+    the confirmation is accepted, with a handle to track it until PAYED (see
+    santander_sdk.pix_handle). Raises if the payment can't be created or confirmed.
 
-        create_pix_dict = _generate_create_pix_dict(
-            pix_key, value, description, tags, id
+    The transfer journal and idempotency_registry are used like in transfer_pix:
+    a journaled id is resumed, and a submission of an id in flight or recently
+    paid gets a handle of it without any request.
+    """
+    id = _payment_id(client, id, idempotency_key)
+    registry = client.config.idempotency_registry
+    if registry is None or id is None:
+        return _submit_transfer_pix(
+            client, pix_key, value, description, tags, id, deadline
         )
-        create_pix_response = transfer_flow.create_payment(create_pix_dict)
-        if not create_pix_response.get("id"):
-            raise SantanderClientError("Payment ID was not returned on creation")
-        if create_pix_response.get("status") is None:
-            raise SantanderClientError("Payment status was not returned on creation")
+    outcome = registry.run(
+        str(id),
+        lambda: _submit_transfer_pix(
+            client, pix_key, value, description, tags, id, deadline
+        ),
+    )
+    if isinstance(outcome, PixTransferHandle):
+        return outcome
+    if not outcome["success"]:
+        raise SantanderClientError(outcome["error"])
+    return PixTransferHandle(
+        client, outcome["request_id"] or str(id), outcome["data"], deadline
+    )
+
 
+def _submit_transfer_pix(
+    client: SantanderApiClient,
+    pix_key: str | SantanderBeneficiary,
+    value: D,
+    description: str,
+    tags: list[str],
+    id: uuid.UUID | str | None,
+    deadline: Deadline | None,
+) -> PixTransferHandle:
+    journal = client.config.transfer_journal
+    if journal is not None:
+        id = str(id or uuid.uuid4())
+        entry = journal.get(id)
+        if entry is not None:
+            return _resume_submission(client, entry, deadline)
+    transfer_flow = SantanderPaymentFlow(client, PIX_ENDPOINT, deadline=deadline)
+    try:
+        create_pix_response = create_pix_payment(
+            transfer_flow, pix_key, value, description, tags, id
+        )
         transfer_flow.ensure_ready_to_pay(create_pix_response)
-        payment_data = {
-            "status": "AUTHORIZED",
-            "paymentValue": truncate_value(value),
-        }
-        confirm_response = transfer_flow.confirm_payment(
-            payment_data, create_pix_response.get("id")
+        payment_id = cast(str, create_pix_response.get("id"))
+        confirm_response = _send_confirmation(transfer_flow, value, payment_id)
+    except Exception as e:
+        client.logger.error(str(e))
+        transfer_flow.record_error(e)
+        raise
+    return PixTransferHandle(client, payment_id, confirm_response, deadline)
+
+
+def _resume_submission(
+    client: SantanderApiClient,
+    entry: TransferJournalEntry,
+    deadline: Deadline | None,
+) -> PixTransferHandle:
+    """Like resume_transfer_pix, but returns once the payment is confirmed."""
+    transfer_flow = SantanderPaymentFlow(
+        client, PIX_ENDPOINT, deadline=deadline, journal_id=entry["id"]
+    )
+    try:
+        response = _journaled_payment(transfer_flow, entry)
+        status = response.get("status")
+        if status not in (OrderStatus.PENDING_CONFIRMATION, OrderStatus.PAYED):
+            transfer_flow.ensure_ready_to_pay(response)
+            value = D(entry["request"]["paymentValue"])
+            response = _send_confirmation(transfer_flow, value, entry["id"])
+    except Exception as e:
+        client.logger.error(str(e))
+        transfer_flow.record_error(e)
+        raise
+    return PixTransferHandle(client, entry["id"], response, deadline)
+
+
+def _wait_handle(handle: PixTransferHandle) -> TransferPixResult:
+    """The result of a submission as transfer_pix would give it: pending on timeout."""
+    try:
+        return handle.wait(
+            MAX_UPDATE_STATUS_AFTER_CONFIRM * UPDATE_STATUS_INTERVAL_TIME
         )
+    except (SantanderStatusTimeoutError, SantanderDeadlineExceededError) as e:
+        handle.client.logger.info(f"Timeout occurred while updating status: {e}")
         return {
             "success": True,
-            "request_id": transfer_flow.request_id,
-            "data": confirm_response,
+            "request_id": handle.payment_id,
+            "data": handle.last_response,
             "error": "",
         }
     except Exception as e:
-        error_message = str(e)
-        client.logger.error(error_message)
+        handle.client.logger.error(str(e))
         return {
             "success": False,
-            "request_id": transfer_flow.request_id,
-            "error": error_message,
+            "request_id": handle.payment_id,
+            "error": str(e),
             "data": None,
         }
 
 
+def _send_confirmation(
+    transfer_flow: SantanderPaymentFlow, value: D, payment_id: str
+) -> SantanderPixResponse:
+    """Confirms the payment, checking that the confirmation was accepted."""
+    response = transfer_flow.send_confirmation(pix_confirmation_data(value), payment_id)
+    status = response.get("status")
+    if status not in (OrderStatus.PENDING_CONFIRMATION, OrderStatus.PAYED):
+        raise SantanderClientError(f"Unexpected status after confirmation: {status}")
+    return response
+
+
+def _payment_id(
+    client: SantanderApiClient,
+    id: uuid.UUID | str | None,
+    idempotency_key: str | None,
+) -> uuid.UUID | str | None:
+    if idempotency_key is None:
+        return id
+    if id is not None:
+        raise ValueError("Provide either id or idempotency_key, not both")
+    return idempotency_id(idempotency_key, client.config.client_id)
+
+
+def _transfer_pix(
+    client: SantanderApiClient,
+    pix_key: str | SantanderBeneficiary,
+    value: D,
+    description: str,
+    tags: list[str],
+    id: uuid.UUID | str | None,
+    deadline: Deadline | None,
+) -> TransferPixResult:
+    journal = client.config.transfer_journal
+    if journal is not None:
+        id = str(id or uuid.uuid4())
+        if journal.get(id) is not None:
+            return resume_transfer_pix(client, id, deadline)
+    transfer_flow = SantanderPaymentFlow(client, PIX_ENDPOINT, deadline=deadline)
+
+    try:
+        create_pix_response = create_pix_payment(
+            transfer_flow, pix_key, value, description, tags, id
+        )
+        transfer_flow.ensure_ready_to_pay(create_pix_response)
+        confirm_response = transfer_flow.confirm_payment(
+            pix_confirmation_data(value), create_pix_response.get("id")
+        )
+        return _transfer_succeeded(transfer_flow, confirm_response)
+    except Exception as e:
+        return _transfer_failed(transfer_flow, e)
+
+
+def resume_transfer_pix(
+    client: SantanderApiClient,
+    id: uuid.UUID | str,
+    deadline: Deadline | None = None,
+) -> TransferPixResult:
+    """
+    Finishes a transfer of the transfer journal from where it stopped.
+
+    The current status is fetched from the API: a payment never created is created
+    with the journaled request, a pending or READY_TO_PAY one is confirmed, and a
+    PENDING_CONFIRMATION one is polled until PAYED. Finished transfers just return
+    their current state.
+    """
+    journal = client.config.transfer_journal
+    if journal is None:
+        raise SantanderClientError("Transfer journal not configured")
+    entry = journal.get(str(id))
+    if entry is None:
+        raise SantanderClientError(f"Payment {id} not found in the transfer journal")
+
+    transfer_flow = SantanderPaymentFlow(
+        client, PIX_ENDPOINT, deadline=deadline, journal_id=entry["id"]
+    )
+    try:
+        response = _journaled_payment(transfer_flow, entry)
+        status = response.get("status")
+        if status in (OrderStatus.PENDING_CONFIRMATION, OrderStatus.PAYED):
+            transfer_flow.current_step = "CONFIRM"
+            response = transfer_flow.wait_until_paid(entry["id"], response)
+        else:
+            transfer_flow.ensure_ready_to_pay(response)
+            value = D(entry["request"]["paymentValue"])
+            response = transfer_flow.confirm_payment(
+                pix_confirmation_data(value), entry["id"]
+            )
+        return _transfer_succeeded(transfer_flow, response)
+    except Exception as e:
+        return _transfer_failed(transfer_flow, e)
+
+
+def resume_incomplete_transfers(
+    client: SantanderApiClient, deadline: Deadline | None = None
+) -> dict[str, TransferPixResult]:
+    """Resumes, one after another, the journaled transfers neither PAYED nor REJECTED."""
+    journal = client.config.transfer_journal
+    if journal is None:
+        raise SantanderClientError("Transfer journal not configured")
+    return {
+        entry["id"]: resume_transfer_pix(client, entry["id"], deadline)
+        for entry in journal.incomplete()
+    }
+
+
+def _journaled_payment(
+    transfer_flow: SantanderPaymentFlow, entry: TransferJournalEntry
+) -> SantanderPixResponse:
+    """The payment's current state, creating it if the creation never arrived."""
+    try:
+        return transfer_flow.check_status(entry["id"])
+    except SantanderRequestError as e:
+        if entry["status"] is not None or e.status_code != 404:
+            raise
+    transfer_flow.client.logger.info(f"Payment {entry['id']} not found, creating it")
+    return transfer_flow.create_payment(entry["request"])
+
+
+def _transfer_succeeded(
+    transfer_flow: SantanderPaymentFlow, response: SantanderPixResponse
+) -> TransferPixResult:
+    return {
+        "success": True,
+        "request_id": transfer_flow.request_id,
+        "data": response,
+        "error": "",
+    }
+
+
+def _transfer_failed(
+    transfer_flow: SantanderPaymentFlow, error: Exception
+) -> TransferPixResult:
+    error_message = str(error)
+    transfer_flow.client.logger.error(error_message)
+    transfer_flow.record_error(error)
+    return {
+        "success": False,
+        "request_id": transfer_flow.request_id,
+        "error": error_message,
+        "data": None,
+    }
+
+
+def create_pix_payment(
+    transfer_flow: SantanderPaymentFlow,
+    pix_key: str | SantanderBeneficiary,
+    value: D,
+    description: str,
+    tags: list[str] = [],
+    id: uuid.UUID | str | None = None,
+) -> SantanderPixResponse:
+    """Creation step of transfer_pix, checking the returned id and status."""
+    if value is None or value <= 0:
+        raise ValueError(f"Invalid value for PIX transfer: {value}")
+
+    if id is None and transfer_flow.journal is not None:
+        id = uuid.uuid4()
+    create_pix_dict = _generate_create_pix_dict(pix_key, value, description, tags, id)
+    create_pix_response = transfer_flow.create_payment(create_pix_dict)
+    if not create_pix_response.get("id"):
+        raise SantanderClientError("Payment ID was not returned on creation")
+    if create_pix_response.get("status") is None:
+        raise SantanderClientError("Payment status was not returned on creation")
+    return create_pix_response
+
+
+def pix_confirmation_data(value: D) -> dict:
+    return {"status": "AUTHORIZED", "paymentValue": truncate_value(value)}
+
+
 def get_transfer(
-    client: SantanderApiClient, pix_payment_id: str
+    client: SantanderApiClient,
+    pix_payment_id: str,
+    deadline: Deadline | None = None,
 ) -> SantanderPixResponse:
     if not pix_payment_id:
         raise ValueError("pix_payment_id not provided")
-    response = client.get(f"{PIX_ENDPOINT}/{pix_payment_id}")
+    response = client.get(PIX.format(pix_payment_id), deadline=deadline)
     return cast(SantanderPixResponse, response)
 
 
@@ -0,0 +1,512 @@
+"""
+PIX transfers in batches, e.g. the thousands of payouts of a payroll day.
+
+transfer_pix_batch runs transfer_pix (creation, confirmation and status polling)
+for many items on a bounded pool of worker threads, so a payment waiting in
+polling no longer holds up the next ones. Iterating the returned
+TransferPixBatch yields each item's result as soon as it finishes, in completion
+order, with the item's index in the input.
+
+Items are read from the iterable as workers become free, so a generator of 20k
+payouts is never loaded all at once. cancel() (or leaving the iteration early)
+stops starting new items: the ones queued are reported as cancelled, and the ones
+already running finish their flow, so no payment is left half-confirmed.
+
+With pipelined=True the phases of the flow are run for the whole batch instead
+of one payment after another: every payment is created, the ones not yet
+READY_TO_PAY are checked together in polling sweeps, the ready ones are confirmed
+in parallel, and the PENDING_CONFIRMATION ones are tracked together until PAYED.
+The validation of each payment then overlaps with the creation of the others,
+and a polling interval is waited once per sweep instead of once per payment.
+Results are still streamed: failures as they happen, payments as they are paid.
+Cancelling a pipelined batch stops creating and confirming payments; the created
+ones not confirmed are reported as cancelled, with their request_id.
+Items that transfer_pix would resume or coalesce are still run by it, on their own,
+instead of being pipelined: the ones with an id (or idempotency_key) in the
+client's transfer journal, and all the ones with an id under an
+idempotency_registry.
+
+Size the client's pool (pool_maxsize) to at least max_workers, or the extra
+connections are opened and discarded on every request.
+"""
+
+import threading
+import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from time import monotonic, sleep
+from typing import Callable, Generator, Iterable, Iterator
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.endpoints import PIX_ENDPOINT
+from santander_sdk.api_client.exceptions import (
+    SantanderClientError,
+    SantanderDeadlineExceededError,
+    SantanderStatusTimeoutError,
+)
+from santander_sdk.pix import (
+    _payment_id,
+    create_pix_payment,
+    pix_confirmation_data,
+    transfer_pix,
+)
+from santander_sdk.transfer_flow import (
+    MAX_UPDATE_STATUS_AFTER_CONFIRM,
+    MAX_UPDATE_STATUS_BEFORE_CONFIRM,
+    UPDATE_STATUS_INTERVAL_TIME,
+    SantanderPaymentFlow,
+)
+from santander_sdk.types import (
+    ConfirmOrderStatus,
+    CreateOrderStatus,
+    SantanderPixResponse,
+    TransferPixBatchResult,
+    TransferPixBatchSummary,
+    TransferPixItem,
+    TransferPixResult,
+)
+
+CANCELLED_ERROR = "Cancelled before starting"
+
+
+class TransferPixBatch:
+    def __init__(
+        self,
+        client: SantanderApiClient,
+        items: Iterable[TransferPixItem],
+        max_workers: int = 16,
+        deadline: Deadline | None = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.client = client
+        self.max_workers = max_workers
+        self.deadline = deadline
+        self._items = enumerate(items)
+        self._pending: dict[Future, tuple[int, TransferPixItem]] = {}
+        self._counts = {"total": 0, "succeeded": 0, "failed": 0, "cancelled": 0}
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        pool_maxsize = client.config.pool_maxsize
+        if pool_maxsize < max_workers:
+            client.logger.warning(
+                f"PIX batch with {max_workers} workers on a pool of {pool_maxsize} "
+                "connections: set pool_maxsize to at least max_workers"
+            )
+
+    def __repr__(self):
+        return f"TransferPixBatch<{self._counts}>"
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Stops starting items; the running ones finish, the queued are cancelled."""
+        self._cancelled.set()
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+
+    def wait(self) -> TransferPixBatchSummary:
+        """Runs the batch to the end, discarding the streamed results."""
+        for _ in self:
+            pass
+        return self.summary()
+
+    def summary(self) -> TransferPixBatchSummary:
+        """Counts of the results so far and the elapsed time."""
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or monotonic()) - self._started_at
+        return {
+            "total": self._counts["total"],
+            "succeeded": self._counts["succeeded"],
+            "failed": self._counts["failed"],
+            "cancelled": self._counts["cancelled"],
+            "elapsed_seconds": elapsed,
+        }
+
+    def __iter__(self) -> Iterator[TransferPixBatchResult]:
+        executor = self._start()
+        try:
+            while self._submit_next(executor) or self._pending:
+                with self._lock:
+                    pending = list(self._pending)
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    with self._lock:
+                        index, item = self._pending.pop(future)
+                    yield self._record(index, item, self._result_of(future))
+        finally:
+            # Left early: the queued items are dropped, the running ones finish.
+            if self._pending:
+                self.cancel()
+            executor.shutdown(wait=True)
+            self._finished_at = monotonic()
+
+    def _start(self) -> ThreadPoolExecutor:
+        if self._started_at is not None:
+            raise RuntimeError("A PIX batch can only be run once")
+        self._started_at = monotonic()
+        return ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="santander-pix-batch"
+        )
+
+    def _submit_next(self, executor: ThreadPoolExecutor) -> bool:
+        """Keeps up to two items per worker queued; False when there is none left."""
+        submitted = False
+        while not self.cancelled and len(self._pending) < self.max_workers * 2:
+            entry = next(self._items, None)
+            if entry is None:
+                break
+            with self._lock:
+                self._pending[executor.submit(self._transfer, entry[1])] = entry
+            submitted = True
+        return submitted
+
+    def _transfer(self, item: TransferPixItem) -> TransferPixResult | None:
+        if self.cancelled:
+            return None
+        try:
+            pix_key, value, description, tags, id, idempotency_key = _transfer_args(
+                item
+            )
+        except ValueError as e:
+            self.client.logger.error(str(e))
+            return {"success": False, "request_id": None, "data": None, "error": str(e)}
+        return transfer_pix(
+            self.client,
+            pix_key,
+            value,
+            description,
+            tags,
+            id,
+            deadline=self.deadline,
+            idempotency_key=idempotency_key,
+        )
+
+    def _result_of(self, future: Future) -> TransferPixResult | None:
+        """The item's result: None if cancelled, a failed one if its transfer raised."""
+        if future.cancelled():
+            return None
+        error = future.exception()
+        if error is None:
+            return future.result()
+        self.client.logger.error(f"PIX batch item failed: {error}")
+        return {"success": False, "request_id": None, "data": None, "error": str(error)}
+
+    def _record(
+        self,
+        index: int,
+        item: TransferPixItem,
+        result: TransferPixResult | None,
+        request_id: str | None = None,
+    ) -> TransferPixBatchResult:
+        """Counts the item's result; None when it was cancelled."""
+        self._counts["total"] += 1
+        if result is None:
+            self._counts["cancelled"] += 1
+            result = {
+                "success": False,
+                "request_id": request_id,
+                "data": None,
+                "error": CANCELLED_ERROR,
+            }
+        elif result["success"]:
+            self._counts["succeeded"] += 1
+        else:
+            self._counts["failed"] += 1
+        return {"index": index, "item": item, "result": result}
+
+
+class _PipelinedPix:
+    """A payment of a pipelined batch, along the phases of the flow."""
+
+    def __init__(self, index: int, item: TransferPixItem, flow: SantanderPaymentFlow):
+        self.index = index
+        self.item = item
+        self.flow = flow
+        self.payment_id: str | None = None
+        self.response: SantanderPixResponse | None = None
+        # The result of the items run by transfer_pix instead of the pipeline.
+        self.result: TransferPixResult | None = None
+
+    @property
+    def status(self) -> str | None:
+        return self.response.get("status") if self.response else None
+
+
+SweepResults = Generator[
+    TransferPixBatchResult,
+    None,
+    tuple[list[_PipelinedPix], list[_PipelinedPix], Exception | None],
+]
+
+
+class PipelinedTransferPixBatch(TransferPixBatch):
+    """TransferPixBatch running each phase of the flow for the whole batch."""
+
+    def __iter__(self) -> Iterator[TransferPixBatchResult]:
+        executor = self._start()
+        try:
+            created = []
+            for payment, error in self._run(executor, self._create, self._payments()):
+                if error is not None:
+                    yield self._fail(payment, error)
+                elif payment.result is not None:
+                    yield self._record(payment.index, payment.item, payment.result)
+                else:
+                    created.append(payment)
+
+            ready, waiting, error = yield from self._sweep(
+                executor,
+                created,
+                CreateOrderStatus.READY_TO_PAY,
+                MAX_UPDATE_STATUS_BEFORE_CONFIRM,
+                before_confirm=True,
+            )
+            for payment in waiting:
+                yield self._fail(payment, CancelledError() if self.cancelled else error)
+
+            confirming = []
+            for payment, error in self._run(executor, self._confirm, ready):
+                if error is not None:
+                    yield self._fail(payment, error)
+                elif payment.status == ConfirmOrderStatus.PAYED:
+                    yield self._succeed(payment)
+                elif payment.status == ConfirmOrderStatus.PENDING_CONFIRMATION:
+                    confirming.append(payment)
+                else:
+                    yield self._fail(
+                        payment,
+                        SantanderClientError(
+                            f"Unexpected status after confirmation: {payment.status}"
+                        ),
+                    )
+
+            paid, pending, error = yield from self._sweep(
+                executor,
+                confirming,
+                ConfirmOrderStatus.PAYED,
+                MAX_UPDATE_STATUS_AFTER_CONFIRM,
+                before_confirm=False,
+            )
+            if error is not None:
+                self.client.logger.info(
+                    "Timeout occurred while updating status: %s", error
+                )
+            # Like transfer_pix, confirmed payments not yet paid are returned pending.
+            for payment in paid + pending:
+                yield self._succeed(payment)
+        finally:
+            if self._pending:
+                self.cancel()
+            executor.shutdown(wait=True)
+            self._finished_at = monotonic()
+
+    def _payments(self) -> Iterator[_PipelinedPix]:
+        for index, item in self._items:
+            if self.cancelled:
+                return
+            flow = SantanderPaymentFlow(self.client, PIX_ENDPOINT, self.deadline)
+            yield _PipelinedPix(index, item, flow)
+
+    def _run(
+        self,
+        executor: ThreadPoolExecutor,
+        step: Callable[[_PipelinedPix], None],
+        payments: Iterable[_PipelinedPix],
+        cancellable: bool = True,
+    ) -> Iterator[tuple[_PipelinedPix, BaseException | None]]:
+        """Runs the step for each payment, yielding them with the error, if any."""
+        payments = iter(payments)
+        running: dict[Future, _PipelinedPix] = {}
+        while True:
+            while len(running) < self.max_workers * 2:
+                payment = next(payments, None)
+                if payment is None:
+                    break
+                if cancellable and self.cancelled:
+                    yield payment, CancelledError()
+                    continue
+                future = executor.submit(step, payment)
+                running[future] = payment
+                if cancellable:
+                    with self._lock:
+                        self._pending[future] = (payment.index, payment.item)
+            if not running:
+                return
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                payment = running.pop(future)
+                with self._lock:
+                    self._pending.pop(future, None)
+                if future.cancelled():
+                    yield payment, CancelledError()
+                else:
+                    yield payment, future.exception()
+
+    def _sweep(
+        self,
+        executor: ThreadPoolExecutor,
+        payments: list[_PipelinedPix],
+        until_status: str,
+        max_attempts: int,
+        before_confirm: bool,
+    ) -> SweepResults:
+        """
+        Polls the payments together until they reach the status, yielding failures.
+
+        Before the confirmations, returns the payments that reached the status;
+        after them, yields the paid ones as they are found. Also returns the
+        payments still waiting and why they stopped being polled.
+        """
+        reached: list[_PipelinedPix] = []
+        waiting = []
+        for payment in payments:
+            (reached if payment.status == until_status else waiting).append(payment)
+
+        error = None
+        for _ in range(max_attempts):
+            if not waiting or (before_confirm and self.cancelled):
+                break
+            try:
+                self._wait_interval(interruptible=before_confirm)
+            except SantanderDeadlineExceededError as e:
+                error = e
+                break
+            still_waiting = []
+            for payment, check_error in self._run(
+                executor, self._check_status, waiting, cancellable=before_confirm
+            ):
+                if check_error is not None:
+                    yield self._fail(payment, check_error)
+                elif payment.status != until_status:
+                    still_waiting.append(payment)
+                elif before_confirm:
+                    reached.append(payment)
+                else:
+                    yield self._succeed(payment)
+            waiting = still_waiting
+        else:
+            if waiting:
+                error = SantanderStatusTimeoutError(
+                    "Status update attempt limit reached",
+                    "CREATE" if before_confirm else "CONFIRM",
+                )
+        return reached, waiting, error
+
+    def _wait_interval(self, interruptible: bool):
+        """Waits between sweeps; before the confirmations, cancel() interrupts it."""
+        interval = UPDATE_STATUS_INTERVAL_TIME
+        if self.deadline is not None and interval >= self.deadline.remaining():
+            raise SantanderDeadlineExceededError(
+                f"{self.deadline.seconds}s budget would be spent before next status check"
+            )
+        if interruptible:
+            self._cancelled.wait(interval)
+        else:
+            sleep(interval)
+
+    def _create(self, payment: _PipelinedPix):
+        pix_key, value, description, tags, id, idempotency_key = _transfer_args(
+            payment.item
+        )
+        id = _payment_id(self.client, id, idempotency_key)
+        if self._run_alone(id):
+            payment.result = transfer_pix(
+                self.client, pix_key, value, description, tags, id, self.deadline
+            )
+            return
+        payment.response = create_pix_payment(
+            payment.flow, pix_key, value, description, tags, id
+        )
+        payment.payment_id = payment.response.get("id")
+
+    def _run_alone(self, id: uuid.UUID | str | None) -> bool:
+        """Whether transfer_pix must run the item: to resume or coalesce its id."""
+        if id is None:
+            return False
+        if self.client.config.idempotency_registry is not None:
+            return True
+        journal = self.client.config.transfer_journal
+        return journal is not None and journal.get(str(id)) is not None
+
+    def _check_status(self, payment: _PipelinedPix):
+        payment.response = payment.flow.check_status(payment.payment_id)
+
+    def _confirm(self, payment: _PipelinedPix):
+        payment.response = payment.flow.send_confirmation(
+            pix_confirmation_data(payment.item["value"]), payment.payment_id
+        )
+
+    def _succeed(self, payment: _PipelinedPix) -> TransferPixBatchResult:
+        result: TransferPixResult = {
+            "success": True,
+            "request_id": payment.flow.request_id,
+            "data": payment.response,
+            "error": "",
+        }
+        return self._record(payment.index, payment.item, result)
+
+    def _fail(
+        self, payment: _PipelinedPix, error: BaseException | None
+    ) -> TransferPixBatchResult:
+        request_id = payment.flow.request_id
+        if isinstance(error, CancelledError):
+            return self._record(payment.index, payment.item, None, request_id)
+        error_message = str(error)
+        self.client.logger.error(error_message)
+        result: TransferPixResult = {
+            "success": False,
+            "request_id": request_id,
+            "data": None,
+            "error": error_message,
+        }
+        return self._record(payment.index, payment.item, result)
+
+
+def _transfer_args(item: TransferPixItem) -> tuple:
+    """The transfer_pix arguments of a batch item."""
+    try:
+        return (
+            item["pix_key"],
+            item["value"],
+            item["description"],
+            list(item.get("tags", [])),
+            item.get("id"),
+            item.get("idempotency_key"),
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid PIX batch item: {e!r}") from e
+
+
+def transfer_pix_batch(
+    client: SantanderApiClient,
+    items: Iterable[TransferPixItem],
+    max_workers: int = 16,
+    deadline: Deadline | None = None,
+    pipelined: bool = False,
+) -> TransferPixBatch:
+    """
+    Transfers the PIX of each item with up to max_workers at a time.
+
+    Iterate the returned batch to get each TransferPixBatchResult as it finishes,
+    or call wait() to just run it. summary() counts the succeeded, failed and
+    cancelled items. The deadline, if any, is shared by the whole batch.
+    With pipelined=True, each phase of the flow runs for the whole batch (see
+    module docstring).
+    """
+    batch_class = PipelinedTransferPixBatch if pipelined else TransferPixBatch
+    return batch_class(client, items, max_workers, deadline)
@@ -0,0 +1,284 @@
+"""
+Handles of PIX transfers confirmed but not yet PAYED.
+
+submit_transfer_pix (santander_sdk.pix) returns a PixTransferHandle as soon as the
+confirmation is accepted, instead of polling the payment for up to minutes like
+transfer_pix. The handle is then tracked in one of these ways:
+
+- status() checks the payment once;
+- wait(timeout) polls it until PAYED or REJECTED, raising
+  SantanderStatusTimeoutError when the timeout runs out first (the handle stays
+  pending and can be waited again);
+- add_done_callback(fn) has the payment polled in the background by a
+  PixTransferTracker, calling fn(handle) once it is PAYED or REJECTED.
+
+token() serializes the handle, and PixTransferHandle.from_token(client, token)
+resumes its tracking in another process, e.g. a celery task scheduled later.
+"""
+
+import json
+import logging
+import threading
+from time import monotonic, sleep
+from typing import Callable, cast
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.endpoints import PIX_ENDPOINT
+from santander_sdk.api_client.exceptions import (
+    SantanderClientError,
+    SantanderDeadlineExceededError,
+    SantanderRejectedError,
+    SantanderStatusTimeoutError,
+)
+from santander_sdk.transfer_flow import (
+    MAX_UPDATE_STATUS_AFTER_CONFIRM,
+    UPDATE_STATUS_INTERVAL_TIME,
+    SantanderPaymentFlow,
+)
+from santander_sdk.types import (
+    ConfirmOrderStatus,
+    OrderStatus,
+    SantanderPixResponse,
+    TransferPixResult,
+)
+
+TOKEN_VERSION = 1
+
+DoneCallback = Callable[["PixTransferHandle"], None]
+
+
+class PixTransferHandle:
+    def __init__(
+        self,
+        client: SantanderApiClient,
+        payment_id: str,
+        response: SantanderPixResponse | None = None,
+        deadline: Deadline | None = None,
+        tracker: "PixTransferTracker | None" = None,
+    ):
+        """
+        - response: the last known state of the payment, e.g. the confirmation.
+        - tracker: polls the payment for the done callbacks (default_tracker).
+        """
+        if not payment_id:
+            raise ValueError("payment_id not provided")
+        self.client = client
+        self.payment_id = payment_id
+        self.deadline = deadline
+        self.tracker = tracker or default_tracker
+        self._flow = SantanderPaymentFlow(
+            client, PIX_ENDPOINT, deadline=deadline, journal_id=payment_id
+        )
+        self._flow.current_step = "CONFIRM"
+        self._response = response
+        self._result: TransferPixResult | None = None
+        self._callbacks: list[DoneCallback] = []
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        if response is not None and response.get("status") == ConfirmOrderStatus.PAYED:
+            self._finish(self._succeeded(response))
+
+    def __repr__(self):
+        return f"PixTransferHandle<{self.payment_id} {self.last_status}>"
+
+    @classmethod
+    def from_token(
+        cls,
+        client: SantanderApiClient,
+        token: str,
+        deadline: Deadline | None = None,
+    ) -> "PixTransferHandle":
+        """A pending handle of the payment serialized by token()."""
+        try:
+            data = json.loads(token)
+            if data["version"] != TOKEN_VERSION:
+                raise ValueError(f"Unsupported version {data['version']}")
+            payment_id = data["payment_id"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise SantanderClientError(f"Invalid PIX transfer token: {e}") from e
+        return cls(client, payment_id, deadline=deadline)
+
+    def token(self) -> str:
+        return json.dumps({"version": TOKEN_VERSION, "payment_id": self.payment_id})
+
+    @property
+    def last_response(self) -> SantanderPixResponse | None:
+        """The last known state of the payment, without any request."""
+        return self._response
+
+    @property
+    def last_status(self) -> str | None:
+        """The status of the last response, without any request."""
+        response = self._response
+        return response.get("status") if response is not None else None
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self) -> TransferPixResult | None:
+        """The result once PAYED or REJECTED, like transfer_pix's; None before."""
+        return self._result
+
+    def status(self) -> str | None:
+        """The current status: checked once with the API, unless already done."""
+        if not self.done():
+            self.refresh()
+        return self.last_status
+
+    def refresh(self):
+        """Checks the payment once, finishing the handle if PAYED or REJECTED."""
+        try:
+            response = self._flow.check_status(self.payment_id)
+        except SantanderRejectedError as e:
+            self._response = cast(
+                SantanderPixResponse,
+                {**(self._response or {}), "status": OrderStatus.REJECTED},
+            )
+            self._finish(self._failed(e))
+            return
+        self._response = response
+        if response.get("status") == ConfirmOrderStatus.PAYED:
+            self._finish(self._succeeded(response))
+
+    def wait(self, timeout: float | None = None) -> TransferPixResult:
+        """
+        Polls the payment until PAYED or REJECTED and returns the result. Raises
+        SantanderStatusTimeoutError if still pending after timeout seconds.
+        """
+        wait_until = None if timeout is None else monotonic() + timeout
+        while not self.done():
+            self.refresh()
+            if self.done():
+                break
+            interval = UPDATE_STATUS_INTERVAL_TIME
+            if self.deadline is not None and interval >= self.deadline.remaining():
+                raise SantanderDeadlineExceededError(
+                    f"{self.deadline.seconds}s budget would be spent"
+                    " before next status check"
+                )
+            if wait_until is not None and monotonic() + interval > wait_until:
+                raise SantanderStatusTimeoutError(
+                    f"Payment {self.payment_id} still {self.last_status}"
+                    f" after {timeout}s",
+                    "CONFIRM",
+                )
+            # A background tracker finishing the handle wakes this wait early.
+            self._done.wait(interval)
+        return self._result  # type: ignore[return-value]
+
+    def add_done_callback(self, fn: DoneCallback):
+        """
+        Calls fn(handle) once PAYED or REJECTED, tracking the payment in the
+        background until then. Called right away if already done.
+        """
+        with self._lock:
+            pending = not self.done()
+            if pending:
+                self._callbacks.append(fn)
+        if pending:
+            self.tracker.track(self)
+        else:
+            self._call(fn)
+
+    def _finish(self, result: TransferPixResult):
+        with self._lock:
+            if self.done():
+                return
+            self._result = result
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            self._call(fn)
+
+    def _call(self, fn: DoneCallback):
+        try:
+            fn(self)
+        except Exception as e:
+            self.client.logger.error(f"PIX transfer callback failed: {e}")
+
+    def _succeeded(self, response: SantanderPixResponse) -> TransferPixResult:
+        return {
+            "success": True,
+            "request_id": self.payment_id,
+            "data": response,
+            "error": "",
+        }
+
+    def _failed(self, error: Exception) -> TransferPixResult:
+        error_message = str(error)
+        self.client.logger.error(error_message)
+        self._flow.record_error(error)
+        return {
+            "success": False,
+            "request_id": self.payment_id,
+            "error": error_message,
+            "data": None,
+        }
+
+
+class PixTransferTracker:
+    """Polls pending handles in one background thread, a sweep per interval.
+
+    Each handle is checked up to max_checks times; after that it is dropped
+    (still pending, so it can be waited or tracked again) and logged.
+    """
+
+    def __init__(
+        self,
+        max_checks: int = MAX_UPDATE_STATUS_AFTER_CONFIRM,
+        logger: logging.Logger | None = None,
+    ):
+        self.max_checks = max_checks
+        self.logger = logger or logging.getLogger(__name__)
+        self._checks_left: dict[PixTransferHandle, int] = {}
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"PixTransferTracker<tracking={self.tracking()}>"
+
+    def track(self, handle: PixTransferHandle):
+        with self._lock:
+            if handle.done() or handle in self._checks_left:
+                return
+            self._checks_left[handle] = self.max_checks
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="santander-pix-tracker", daemon=True
+                )
+                self._thread.start()
+
+    def tracking(self) -> int:
+        with self._lock:
+            return len(self._checks_left)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                handles = list(self._checks_left)
+                if not handles:
+                    self._thread = None
+                    return
+            sleep(UPDATE_STATUS_INTERVAL_TIME)
+            for handle in handles:
+                self._check(handle)
+
+    def _check(self, handle: PixTransferHandle):
+        try:
+            if not handle.done():
+                handle.refresh()
+        except Exception as e:
+            self.logger.error(f"Status check of {handle.payment_id} failed: {e}")
+        with self._lock:
+            self._checks_left[handle] -= 1
+            if handle.done():
+                del self._checks_left[handle]
+            elif self._checks_left[handle] <= 0:
+                del self._checks_left[handle]
+                self.logger.warning(
+                    f"Stopped tracking {handle.payment_id}, still {handle.last_status}"
+                )
+
+
+default_tracker = PixTransferTracker()
@@ -2,8 +2,10 @@ from time import sleep
 from typing import List, Literal, cast
 
 from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.deadline import Deadline
 from santander_sdk.api_client.exceptions import (
     SantanderClientError,
+    SantanderDeadlineExceededError,
     SantanderRejectedError,
     SantanderRequestError,
     SantanderStatusTimeoutError,
@@ -31,16 +33,30 @@ class SantanderPaymentFlow:
         self,
         client: SantanderApiClient,
         endpoint: str,
+        deadline: Deadline | None = None,
+        journal_id: str | None = None,
     ):
+        """journal_id: resumes the transfer with this id in the transfer journal."""
         self.client = client
         self.endpoint = endpoint
-        self.request_id = None
+        self.deadline = deadline
+        self.journal = client.config.transfer_journal
+        self.journal_id = journal_id
+        self.request_id = journal_id
 
     def create_payment(self, data: dict) -> SantanderPixResponse:
+        if self.journal is not None and self.journal_id is None and data.get("id"):
+            self.journal_id = str(data["id"])
+            if not self.journal.begin(self.journal_id, data):
+                raise SantanderClientError(
+                    f"Payment {self.journal_id} is already in the transfer journal"
+                )
         response = cast(
-            SantanderPixResponse, self.client.post(self.endpoint, data=data)
+            SantanderPixResponse,
+            self.client.post(self.endpoint, data=data, deadline=self.deadline),
         )
         self.request_id = response.get("id")
+        self._record(status=response.get("status"))
         self._check_for_rejected_error(response)
         self.client.logger.info("Payment created: ", response.get("id"))
         return response
@@ -58,29 +74,54 @@ class SantanderPaymentFlow:
     def confirm_payment(
         self, confirm_data: dict, payment_id: str
     ) -> SantanderPixResponse:
-        try:
-            confirm_response = self._request_confirm_payment(confirm_data, payment_id)
-        except SantanderRequestError as e:
-            self.client.logger.error(str(e), payment_id, "checking current status")
-            confirm_response = self._request_payment_status(payment_id)
+        confirm_response = self.send_confirmation(confirm_data, payment_id)
+        return self.wait_until_paid(payment_id, confirm_response)
 
+    def wait_until_paid(
+        self, payment_id: str, confirm_response: SantanderPixResponse
+    ) -> SantanderPixResponse:
+        """Polls a confirmed payment until PAYED; on timeout, returns it pending."""
         if not confirm_response.get("status") == ConfirmOrderStatus.PAYED:
             try:
                 confirm_response = self._resolve_lazy_status_payed(
                     payment_id, confirm_response.get("status", "")
                 )
-            except SantanderStatusTimeoutError as e:
+            except (SantanderStatusTimeoutError, SantanderDeadlineExceededError) as e:
                 self.client.logger.info(
                     "Timeout occurred while updating status:", str(e)
                 )
         return confirm_response
 
+    def send_confirmation(
+        self, confirm_data: dict, payment_id: str
+    ) -> SantanderPixResponse:
+        """Confirms the payment once, without waiting for it to be paid."""
+        try:
+            return self._request_confirm_payment(confirm_data, payment_id)
+        except SantanderRequestError as e:
+            self.client.logger.error(f"{e} - {payment_id}: checking current status")
+            return self._request_payment_status(payment_id)
+
+    def check_status(self, payment_id: str) -> SantanderPixResponse:
+        """One status check of the polling; raises SantanderRejectedError if rejected."""
+        response = self._request_payment_status(payment_id)
+        metrics = self.client.config.metrics
+        if metrics is not None:
+            metrics.record_polling_attempt(self.current_step, response.get("status"))
+        self.client.logger.info(
+            f"Checking status by polling: {payment_id} - {response.get('status')}"
+        )
+        return response
+
     @retry_one_time_on_request_exception
     def _request_payment_status(self, payment_id: str) -> SantanderPixResponse:
         if not payment_id:
             raise ValueError("payment_id not provided")
-        response = self.client.get(f"{self.endpoint}/{payment_id}")
+        response = self.client.get(
+            f"{self.endpoint}/{payment_id}", deadline=self.deadline
+        )
         response = cast(SantanderPixResponse, response)
+        self._record(status=response.get("status"))
         self._check_for_rejected_error(response)
         return response
 
@@ -90,11 +131,23 @@ class SantanderPaymentFlow:
         self.current_step = "CONFIRM"
         if not payment_id:
             raise ValueError("payment_id not provided")
-        response = self.client.patch(f"{self.endpoint}/{payment_id}", data=confirm_data)
+        self._record(step="CONFIRM")
+        response = self.client.patch(
+            f"{self.endpoint}/{payment_id}", data=confirm_data, deadline=self.deadline
+        )
         response = cast(SantanderPixResponse, response)
+        self._record(status=response.get("status"))
         self._check_for_rejected_error(response)
         return response
 
+    def record_error(self, error: Exception):
+        """Journals the error that interrupted the transfer."""
+        self._record(error=str(error))
+
+    def _record(self, **progress):
+        if self.journal is not None and self.journal_id is not None:
+            self.journal.record(self.journal_id, **progress)
+
     def _check_for_rejected_error(self, payment_response: SantanderPixResponse):
         if not payment_response.get("status") == OrderStatus.REJECTED:
             return
@@ -123,17 +176,17 @@ class SantanderPaymentFlow:
         response = None
 
         for attempt in range(1, max_update_attemps + 1):
-            response = self._request_payment_status(payment_id)
-            self.client.logger.info(
-                f"Checking status by polling: {payment_id} - {response.get('status')}"
-            )
+            response = self.check_status(payment_id)
             if response.get("status") in until_status:
                 break
             if attempt == max_update_attemps:
                 raise SantanderStatusTimeoutError(
                     "Status update attempt limit reached", self.current_step
                 )
-            sleep(UPDATE_STATUS_INTERVAL_TIME)
+            if self.deadline is not None:
+                self.deadline.sleep(UPDATE_STATUS_INTERVAL_TIME, "next status check")
+            else:
+                sleep(UPDATE_STATUS_INTERVAL_TIME)
 
         if response is None:
             raise SantanderClientError("No response received during polling")
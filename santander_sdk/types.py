@@ -1,4 +1,5 @@
-from typing import Literal, TypedDict
+from decimal import Decimal
+from typing import Literal, NotRequired, TypedDict
 
 
 class SantanderAPIErrorsFields(TypedDict):
@@ -167,3 +168,28 @@ class TransferPixResult(TypedDict):
     request_id: str | None
     data: SantanderPixResponse | None
     error: str
+
+
+class TransferPixItem(TypedDict):
+    """Arguments of transfer_pix for one payment of a batch."""
+
+    pix_key: str | SantanderBeneficiary
+    value: Decimal
+    description: str
+    tags: NotRequired[list[str]]
+    id: NotRequired[str]
+    idempotency_key: NotRequired[str]
+
+
+class TransferPixBatchResult(TypedDict):
+    index: int
+    item: TransferPixItem
+    result: TransferPixResult
+
+
+class TransferPixBatchSummary(TypedDict):
+    total: int
+    succeeded: int
+    failed: int
+    cancelled: int
+    elapsed_seconds: float
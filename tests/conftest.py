@@ -1,9 +1,24 @@
+from unittest.mock import patch
+
 import pytest
+from requests.adapters import HTTPAdapter
+
 from santander_sdk.api_client.client import SantanderApiClient
 from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.workspace_cache import MemoryWorkspaceCache
 from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
 
 
+@pytest.fixture(autouse=True)
+def default_workspace_cache():
+    """A fresh shared workspace cache per test."""
+    cache = MemoryWorkspaceCache()
+    with patch(
+        "santander_sdk.api_client.client_configuration.default_workspace_cache", cache
+    ):
+        yield cache
+
+
 @pytest.fixture
 def client_instance():
     return SantanderApiClient(
@@ -15,3 +30,14 @@ def client_instance():
             workspace_id=TEST_WORKSPACE_ID,
         )
     )
+
+
+# Captured at collection time, before responses patches HTTPAdapter.send.
+_REAL_ADAPTER_SEND = HTTPAdapter.send
+
+
+@pytest.fixture
+def real_http():
+    """Let requests reach the network, e.g. an in-process fake server."""
+    with patch.object(HTTPAdapter, "send", _REAL_ADAPTER_SEND):
+        yield
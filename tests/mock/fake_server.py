@@ -0,0 +1,145 @@
+import json
+import threading
+from decimal import Decimal
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from typing import Callable, Iterator
+
+# (method, path, body) -> (status, headers, json body)
+FakeRoute = Callable[[str, str, dict | None], tuple[int, dict, dict | None]]
+
+
+class _FakeSantanderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeSantanderServer"
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PATCH(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            body = None
+        if self.server.delay:
+            sleep(self.server.delay)
+        self.server.record(self.command, self.path)
+        status, headers, response = self.server.route(self.command, self.path, body)
+        content = json.dumps(response).encode() if response is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSantanderServer(ThreadingHTTPServer):
+    """In-process HTTP server answering like the Santander API for tests."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, route: FakeRoute, delay: float = 0):
+        super().__init__(("127.0.0.1", 0), _FakeSantanderHandler)
+        self.route = route
+        self.delay = delay
+        self.requests: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, method: str, path: str):
+        with self._lock:
+            self.requests.append((method, path))
+
+
+def token_route(method, path, body):
+    if path.endswith("/auth/oauth/v2/token"):
+        return 200, {}, {"access_token": "FAKE_TOKEN", "expires_in": 900}
+    return 200, {}, {"path": path}
+
+
+class FakePixApi:
+    """PIX payments route: payments get ready and paid after some status checks.
+
+    Payments with an even value are created PENDING_VALIDATION, the others
+    READY_TO_PAY. Unknown payments are 404.
+    """
+
+    def __init__(self, ready_after=1, paid_after=1, rejected_value="13.00"):
+        self.ready_after = ready_after
+        self.paid_after = paid_after
+        self.rejected_value = rejected_value
+        self.payments = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, body):
+        if path.endswith("/token"):
+            return 200, {}, {"access_token": "TOKEN", "expires_in": 900}
+        with self.lock:
+            if method == "POST":
+                pix_id = body.get("id") or f"PIX{len(self.payments)}"
+                even = Decimal(body["paymentValue"]) % 2 == 0
+                status = "PENDING_VALIDATION" if even else "READY_TO_PAY"
+                if body["paymentValue"] == self.rejected_value:
+                    status = "REJECTED"
+                self.payments[pix_id] = payment = {"status": status, "polls": 0}
+            else:
+                pix_id = path.rsplit("/", 1)[1]
+                payment = self.payments.get(pix_id)
+                if payment is None:
+                    return 404, {}, {"_message": "Payment not found"}
+                if method == "PATCH":
+                    payment.update(status="PENDING_CONFIRMATION", polls=0)
+                else:
+                    payment["polls"] += 1
+                    self._advance(payment)
+            return 200, {}, {"id": pix_id, "status": payment["status"]}
+
+    def _advance(self, payment):
+        ready, paid = self.ready_after, self.paid_after
+        if payment["status"] == "PENDING_VALIDATION" and ready is not None:
+            if payment["polls"] >= ready:
+                payment["status"] = "READY_TO_PAY"
+        if payment["status"] == "PENDING_CONFIRMATION" and paid is not None:
+            if payment["polls"] >= paid:
+                payment["status"] = "PAYED"
+
+
+@contextmanager
+def fake_santander_server(
+    route: FakeRoute = token_route, delay: float = 0
+) -> Iterator[FakeSantanderServer]:
+    server = FakeSantanderServer(route, delay)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
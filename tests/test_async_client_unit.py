@@ -0,0 +1,221 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
+from time import perf_counter
+from unittest.mock import patch
+
+import pytest
+
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.exceptions import SantanderRequestError
+from tests.mock.santander_mocker import (
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+    workspace_response_mock,
+)
+
+httpx = pytest.importorskip("httpx")
+
+from santander_sdk.api_client.async_client import AsyncSantanderApiClient  # noqa: E402
+
+
+class FakeSantanderApp:
+    """In-process fake of the Santander API served through httpx.MockTransport."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+        self.routes = {
+            ("POST", "/auth/oauth/v2/token"): (
+                200,
+                {"access_token": "ASYNC_TOKEN", "expires_in": 900},
+            ),
+            (
+                "GET",
+                "/management_payments_partners/v1/workspaces",
+            ): (200, workspace_response_mock),
+        }
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        status, body = self.routes.get(
+            (request.method, request.url.path), (200, {"path": request.url.path})
+        )
+        return httpx.Response(status, json=body)
+
+    def calls(self, method: str, path: str) -> list[httpx.Request]:
+        return [r for r in self.requests if r.method == method and r.url.path == path]
+
+
+def new_client(
+    app: FakeSantanderApp, workspace_id: str = TEST_WORKSPACE_ID, **config_kwargs
+):
+    config = SantanderClientConfiguration(
+        client_id="buser",
+        client_secret="secret",
+        cert="/var/cets/cert.pem",
+        base_url=SANTANDER_URL,
+        workspace_id=workspace_id,
+        **config_kwargs,
+    )
+    return AsyncSantanderApiClient(config, transport=httpx.MockTransport(app.handler))
+
+
+def test_request_with_workspace_and_auth():
+    app = FakeSantanderApp()
+
+    async def run():
+        async with new_client(app) as client:
+            return await client.post("/v1/workspaces/:workspaceid/pix", {"a": 1})
+
+    response = asyncio.run(run())
+
+    assert response == {"path": f"/v1/workspaces/{TEST_WORKSPACE_ID}/pix"}
+    request = app.requests[-1]
+    assert request.headers["Authorization"] == "Bearer ASYNC_TOKEN"
+    assert request.headers["X-Application-Key"] == "buser"
+    assert json.loads(request.content) == {"a": 1}
+
+
+def test_workspace_is_discovered_on_first_use():
+    app = FakeSantanderApp()
+
+    async def run():
+        async with new_client(app, workspace_id="") as client:
+            await asyncio.gather(
+                client.get("/v1/workspaces/:workspaceid/pix/1"),
+                client.get("/v1/workspaces/:workspaceid/pix/2"),
+            )
+            return await client.workspace_id()
+
+    assert asyncio.run(run()) == TEST_WORKSPACE_ID
+    assert len(app.calls("GET", "/management_payments_partners/v1/workspaces")) == 1
+
+
+def test_error_mapping():
+    app = FakeSantanderApp()
+    app.routes[("GET", "/orders")] = (400, {"error": "Bad Request"})
+
+    async def run():
+        async with new_client(app) as client:
+            await client.get("/orders")
+
+    with pytest.raises(SantanderRequestError) as exc:
+        asyncio.run(run())
+
+    assert exc.value.status_code == 400
+    assert exc.value.content == {"error": "Bad Request"}
+
+
+def test_connection_error_mapping():
+    def handler(request):
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    config = SantanderClientConfiguration(
+        client_id="buser",
+        client_secret="secret",
+        cert="/var/cets/cert.pem",
+        base_url=SANTANDER_URL,
+        workspace_id=TEST_WORKSPACE_ID,
+    )
+
+    async def run():
+        client = AsyncSantanderApiClient(config, transport=httpx.MockTransport(handler))
+        client.auth._token = "TOKEN"
+        client.auth.expires_at = datetime(2999, 1, 1)
+        async with client:
+            await client.get("/orders")
+
+    with pytest.raises(SantanderRequestError, match="Connection refused") as exc:
+        asyncio.run(run())
+
+    assert exc.value.status_code == 0
+
+
+def test_invalid_credentials():
+    app = FakeSantanderApp()
+    app.routes[("POST", "/auth/oauth/v2/token")] = (
+        401,
+        {"error_description": "Invalid client credentials"},
+    )
+
+    async def run():
+        async with new_client(app) as client:
+            await client.get("/orders")
+
+    with pytest.raises(SantanderRequestError, match="Invalid client credentials"):
+        asyncio.run(run())
+
+
+def test_thousands_of_requests_share_one_event_loop():
+    app = FakeSantanderApp(delay=0.05)
+
+    async def run():
+        async with new_client(app) as client:
+            return await asyncio.gather(
+                *(client.get(f"/orders/{i}") for i in range(2000))
+            )
+
+    start = perf_counter()
+    responses = asyncio.run(run())
+    elapsed = perf_counter() - start
+
+    assert responses[1999] == {"path": "/orders/1999"}
+    assert len(app.calls("POST", "/auth/oauth/v2/token")) == 1
+    # 2000 sequential calls would take 100 s.
+    assert elapsed < 10
+
+
+def test_identical_concurrent_gets_are_coalesced():
+    app = FakeSantanderApp(delay=0.05)
+
+    async def run():
+        async with new_client(app) as client:
+            results = await asyncio.gather(
+                *(client.get("/orders/1") for _ in range(50)),
+                client.get("/orders/1", params={"page": "2"}),
+            )
+            return client, results
+
+    client, results = asyncio.run(run())
+
+    assert all(result == {"path": "/orders/1"} for result in results)
+    assert len(app.calls("GET", "/orders/1")) == 2
+    assert client.single_flight.coalesced == 49
+    assert client.single_flight.in_flight() == 0
+
+
+def test_timeouts_come_from_the_configuration():
+    client = new_client(FakeSantanderApp(), connect_timeout=3, read_timeout=20)
+    assert client.http.timeout.connect == 3
+    assert client.http.timeout.read == 20
+    asyncio.run(client.aclose())
+
+
+def test_request_logs_are_capped_and_lazy(caplog):
+    app = FakeSantanderApp()
+    app.routes[("GET", "/orders")] = (200, {"items": list(range(1000))})
+    logger = logging.getLogger("tests.santander_async_requests")
+
+    async def run(level):
+        async with new_client(
+            app,
+            log_request_response_level=level,
+            log_body_max_size=100,
+            logger=logger,
+        ) as client:
+            await client.get("/orders")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        asyncio.run(run("ALL"))
+        with patch(
+            "santander_sdk.api_client.request_logging.request_summary"
+        ) as mock_summary:
+            asyncio.run(run("NONE"))
+
+    (record,) = [r for r in caplog.records if r.msg == "API request successful"]
+    assert record.response_body.endswith(" bytes)")
+    mock_summary.assert_not_called()
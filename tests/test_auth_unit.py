@@ -1,11 +1,17 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from re import compile as regex
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import sleep
+from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
 from requests import PreparedRequest
 
-from santander_sdk.api_client.auth import SantanderAuth
+from santander_sdk.api_client.auth import SantanderAuth, SantanderTokenRefresher
+from santander_sdk.api_client.base import BaseURLSession
 from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
 from santander_sdk.api_client.exceptions import SantanderRequestError
 
@@ -115,3 +121,142 @@ def test_server_error(auth, responses):
     with pytest.raises(SantanderRequestError, match="500 Server Error"):
         req = PreparedRequest()
         req.prepare("GET", "https://api.santander.com.br/orders", auth=auth)
+
+
+def test_concurrent_renew_is_single_flight(auth, responses):
+    def token_callback(request):
+        sleep(0.05)
+        return 200, {}, json.dumps({"access_token": "NEW_TOKEN", "expires_in": 900})
+
+    responses.add_callback(
+        responses.POST, regex(".+/auth/oauth/v2/token"), callback=token_callback
+    )
+    barrier = threading.Barrier(32)
+
+    def get_token():
+        barrier.wait()
+        return auth.token
+
+    for expected_calls in (1, 2):
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            tokens = list(executor.map(lambda _: get_token(), range(32)))
+
+        assert tokens == ["NEW_TOKEN"] * 32
+        assert len(responses.calls) == expected_calls
+        auth.expires_at = datetime.now() - timedelta(seconds=1)
+
+
+@freeze_time("2025-02-13 10:00")
+def test_token_in_grace_window_is_used_while_renewing(auth, responses):
+    token_call = responses.add(
+        responses.POST,
+        regex(".+/auth/oauth/v2/token"),
+        json={"access_token": "NEW_VALID_TOKEN", "expires_in": 120},
+    )
+    auth.token = "VALID_TOKEN", datetime(2025, 2, 13, 10, 0, 30)
+
+    with auth._renew_lock:
+        assert auth.is_in_grace_window is True
+        assert auth.token == "VALID_TOKEN"
+
+    assert token_call.call_count == 0
+    assert auth.token == "NEW_VALID_TOKEN"
+
+
+@freeze_time("2025-02-13 10:00")
+@pytest.mark.parametrize(
+    "expires_at,jitter,expected",
+    [
+        (None, 0.5, 0),
+        (datetime(2025, 2, 13, 10, 15), 0, 840),
+        (datetime(2025, 2, 13, 10, 15), 1, 810),
+        (datetime(2025, 2, 13, 10, 0, 30), 0.5, 0),
+    ],
+)
+def test_refresher_seconds_until_refresh(auth, expires_at, jitter, expected):
+    auth.expires_at = expires_at
+    refresher = SantanderTokenRefresher(auth)
+
+    with patch("santander_sdk.api_client.auth.random.uniform", return_value=jitter):
+        assert refresher.seconds_until_refresh() == expected
+
+
+def test_refresher_renews_in_background(auth, responses):
+    responses.add(
+        responses.POST,
+        regex(".+/auth/oauth/v2/token"),
+        json={"access_token": "BACKGROUND_TOKEN", "expires_in": 900},
+    )
+    refresher = SantanderTokenRefresher(auth)
+
+    refresher.start()
+    for _ in range(100):
+        if auth._token:
+            break
+        sleep(0.01)
+    refresher.stop(timeout=1)
+
+    assert auth._token == "BACKGROUND_TOKEN"
+    assert auth.is_expired is False
+    assert refresher.is_running is False
+    assert len(responses.calls) == 1
+
+
+def test_refresher_retries_after_failure(auth):
+    refresher = SantanderTokenRefresher(auth)
+    refresher.RETRY_INTERVAL = timedelta(seconds=0.01)
+    calls = []
+
+    def failing_renew(force=False):
+        calls.append(force)
+        if len(calls) >= 3:
+            refresher._stop_event.set()
+        raise SantanderRequestError("Token endpoint down", 503)
+
+    with patch.object(auth, "_renew_once", side_effect=failing_renew):
+        refresher._run()
+
+    assert calls == [True, True, True]
+
+
+def test_renew_reuses_session(auth, responses):
+    responses.add(
+        responses.POST,
+        regex(".+/auth/oauth/v2/token"),
+        json={"access_token": "VALID_TOKEN", "expires_in": 120},
+    )
+
+    auth.renew()
+    session = auth.session
+    auth.renew()
+
+    assert auth.session is session
+    assert session.cert == "/var/certs/cert.pem"
+    assert len(responses.calls) == 2
+
+
+def test_renew_over_shared_session_without_auth_header(responses):
+    session = BaseURLSession("https://api.santander.com.br")
+    auth = SantanderAuth.from_config(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="/var/cets/cert.pem",
+            base_url="https://api.santander.com.br",
+        ),
+        session=session,
+    )
+    session.auth = auth
+    responses.add(
+        responses.POST,
+        regex(".+/auth/oauth/v2/token"),
+        json={"access_token": "VALID_TOKEN", "expires_in": 120},
+    )
+    responses.get("https://api.santander.com.br/orders", json={})
+
+    session.get("/orders")
+
+    token_request, orders_request = [call.request for call in responses.calls]
+    assert auth.session is session
+    assert "Authorization" not in token_request.headers
+    assert orders_request.headers["Authorization"] == "Bearer VALID_TOKEN"
@@ -0,0 +1,178 @@
+import re
+from time import sleep
+
+import pytest
+from freezegun import freeze_time
+
+from santander_sdk.api_client.circuit_breaker import CircuitBreaker
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.concurrency import ConcurrencyLimiter
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.exceptions import (
+    SantanderCircuitOpenError,
+    SantanderDeadlineExceededError,
+    SantanderRequestError,
+)
+from santander_sdk.pix import PIX_ENDPOINT
+from tests.mock.santander_mocker import (
+    PIX_ENDPOINT_WITH_WORKSPACE,
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+)
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker(
+        failure_rate_threshold=0.5, window_size=4, min_calls=4, open_secs=30
+    )
+
+
+def record_outcomes(breaker, outcomes, family="pix", duration=0.1):
+    for failed in outcomes:
+        breaker.acquire(family)
+        breaker.record(family, failed, duration)
+
+
+def test_opens_when_failure_rate_reached(breaker):
+    record_outcomes(breaker, [False, True, False])
+    assert breaker.state() == {"pix": "closed"}
+
+    record_outcomes(breaker, [True])
+
+    assert breaker.state() == {"pix": "open"}
+    with pytest.raises(SantanderCircuitOpenError) as exc:
+        breaker.acquire("pix")
+    assert exc.value.family == "pix"
+    assert exc.value.status_code == 503
+
+
+def test_families_are_independent(breaker):
+    record_outcomes(breaker, [True] * 4, family="pix")
+
+    breaker.acquire("payment_receipts")
+    assert breaker.state() == {"pix": "open", "payment_receipts": "closed"}
+
+
+def test_slow_calls_count_as_failures(breaker):
+    breaker.slow_call_secs = 1
+
+    record_outcomes(breaker, [False] * 4, duration=2)
+
+    assert breaker.state() == {"pix": "open"}
+
+
+def test_half_open_closes_after_successful_trial(breaker):
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        record_outcomes(breaker, [True] * 4)
+        frozen.tick(31)
+
+        assert breaker.state() == {"pix": "half_open"}
+        breaker.acquire("pix")
+        with pytest.raises(SantanderCircuitOpenError):
+            breaker.acquire("pix")
+        breaker.record("pix", False, 0.1)
+
+        assert breaker.state() == {"pix": "closed"}
+
+
+def test_half_open_reopens_after_failed_trial(breaker):
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        record_outcomes(breaker, [True] * 4)
+        frozen.tick(31)
+
+        record_outcomes(breaker, [True])
+
+        assert breaker.state() == {"pix": "open"}
+
+
+def test_client_rejects_calls_while_open(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    responses.get(f"{PIX_ENDPOINT_WITH_WORKSPACE}/1", status=503)
+    breaker = CircuitBreaker(window_size=2, min_calls=2)
+    client = SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            cert="test_cert",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            circuit_breaker=breaker,
+        )
+    )
+
+    for _ in range(2):
+        with pytest.raises(SantanderRequestError) as exc:
+            client.get(f"{PIX_ENDPOINT}/1")
+        assert exc.value.status_code == 503
+    with pytest.raises(SantanderCircuitOpenError):
+        client.get(f"{PIX_ENDPOINT}/1")
+
+    assert client.circuit_breaker_state() == {"pix": "open"}
+    assert len(responses.calls) == 3
+
+
+def test_token_failures_dont_open_the_circuit(responses):
+    responses.add(responses.POST, re.compile(r".*v2/token$"), status=500)
+    breaker = CircuitBreaker(window_size=2, min_calls=2)
+    client = SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            cert="test_cert",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            circuit_breaker=breaker,
+        )
+    )
+
+    for _ in range(3):
+        with pytest.raises(SantanderRequestError) as exc:
+            client.get(f"{PIX_ENDPOINT}/1")
+        assert not isinstance(exc.value, SantanderCircuitOpenError)
+
+    assert "open" not in client.circuit_breaker_state().values()
+    assert len(responses.calls) == 3
+
+
+def test_client_without_breaker_has_no_state(client_instance):
+    assert client_instance.circuit_breaker_state() == {}
+
+
+def test_half_open_trial_is_not_lost_waiting_for_a_slot(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    responses.get(f"{PIX_ENDPOINT_WITH_WORKSPACE}/1", json={"id": "1"})
+    breaker = CircuitBreaker(window_size=2, min_calls=2, open_secs=0.01)
+    limiter = ConcurrencyLimiter(1)
+    client = SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            cert="test_cert",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            circuit_breaker=breaker,
+            concurrency_limiter=limiter,
+            coalesce_gets=False,
+        )
+    )
+    record_outcomes(breaker, [True] * 2)
+    sleep(0.02)
+    assert breaker.state() == {"pix": "half_open"}
+
+    limiter.acquire()
+    with pytest.raises(SantanderDeadlineExceededError):
+        client.get(f"{PIX_ENDPOINT}/1", deadline=Deadline(0.05))
+    limiter.release()
+
+    assert client.get(f"{PIX_ENDPOINT}/1") == {"id": "1"}
+    assert breaker.state() == {"pix": "closed"}
@@ -0,0 +1,197 @@
+import threading
+from time import monotonic, sleep
+from unittest.mock import patch
+
+import pytest
+
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.client_pool import SantanderClientPool
+from santander_sdk.api_client.concurrency import ConcurrencyLimiter
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.exceptions import (
+    SantanderClientError,
+    SantanderDeadlineExceededError,
+)
+from tests.mock.fake_server import fake_santander_server, token_route
+from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
+
+
+def tenant_config(tenant, base_url=SANTANDER_URL):
+    return SantanderClientConfiguration(
+        client_id=f"client-{tenant}",
+        client_secret="secret",
+        cert="/var/certs/cert.pem",
+        base_url=base_url,
+        workspace_id=TEST_WORKSPACE_ID,
+    )
+
+
+def test_clients_are_built_on_first_use_and_reused():
+    configs = {"acme": tenant_config("acme"), "globex": tenant_config("globex")}
+    with SantanderClientPool(configs) as pool:
+        assert len(pool) == 0
+        acme = pool.client("acme")
+        assert pool.client("acme") is acme
+        globex = pool.client("globex")
+
+        assert acme.config.client_id == "client-acme"
+        assert acme.http_adapter is globex.http_adapter
+        assert pool.stats() == {
+            "clients": 2,
+            "transports": 1,
+            "in_flight": 0,
+            "evictions": 0,
+        }
+        # The tenant's configuration is copied, not changed.
+        assert configs["acme"].concurrency_limiter is None
+        assert configs["acme"].transport_registry is None
+        assert acme.config.concurrency_limiter.parent is pool.limiter
+
+        with pytest.raises(SantanderClientError):
+            pool.client("initech")
+
+
+def test_config_loader():
+    loaded = []
+
+    def load(tenant):
+        loaded.append(tenant)
+        return tenant_config(tenant)
+
+    pool = SantanderClientPool(load)
+    pool.client(1)
+    pool.client(1)
+    pool.client(2)
+    assert loaded == [1, 2]
+
+
+def test_idle_tenants_are_evicted():
+    pool = SantanderClientPool(tenant_config, idle_ttl=60)
+    acme = pool.client("acme")
+    pool.client("globex")
+    registry = pool.transport_registry
+
+    with patch(
+        "santander_sdk.api_client.client_pool.monotonic",
+        return_value=monotonic() + 61,
+    ):
+        pool.client("globex")
+        assert "acme" not in pool
+        assert "globex" in pool
+
+    assert pool.stats()["evictions"] == 1
+    assert acme.transport.clients == 1
+    assert len(registry) == 1
+    assert pool.client("acme") is not acme
+
+
+def test_busy_tenants_are_not_evicted():
+    pool = SantanderClientPool(tenant_config, idle_ttl=60)
+    limiter = pool.client("acme").config.concurrency_limiter
+    limiter.acquire()
+    with patch(
+        "santander_sdk.api_client.client_pool.monotonic",
+        return_value=monotonic() + 61,
+    ):
+        assert pool.evict_idle() == 0
+    limiter.release()
+    assert pool.evict_idle() == 0
+
+
+def test_least_recently_used_past_max_clients():
+    pool = SantanderClientPool(tenant_config, max_clients=2)
+    for tenant in ("a", "b", "a", "c"):
+        pool.client(tenant)
+    assert "b" not in pool
+    assert len(pool) == 2
+
+    pool.close()
+    assert len(pool) == 0
+    assert len(pool.transport_registry) == 0
+
+
+def test_the_returned_client_is_never_evicted():
+    pool = SantanderClientPool(tenant_config, max_clients=1)
+    busy = pool.client("a").config.concurrency_limiter
+    busy.acquire()
+    try:
+        client = pool.client("b")
+        assert "b" in pool
+        with patch.object(client, "close") as mock_close:
+            assert pool.client("b") is client
+            mock_close.assert_not_called()
+    finally:
+        busy.release()
+
+    pool = SantanderClientPool(tenant_config, idle_ttl=0)
+    assert pool.client("a") is pool.client("a")
+    assert "a" in pool
+
+
+def test_limiter_caps_own_and_parent_slots():
+    total = ConcurrencyLimiter(2)
+    first = ConcurrencyLimiter(1, parent=total)
+    second = ConcurrencyLimiter(2, parent=total)
+
+    assert first.acquire(timeout=0)
+    assert not first.acquire(timeout=0)
+    assert total.in_flight == 1
+    assert second.acquire(timeout=0)
+    assert not second.acquire(timeout=0)
+    assert second.in_flight == 1
+
+    first.release()
+    assert second.acquire(timeout=0)
+    assert total.in_flight == 2
+
+
+def test_waiting_for_a_slot_respects_the_deadline():
+    limiter = ConcurrencyLimiter(1)
+    limiter.acquire()
+    with pytest.raises(SantanderDeadlineExceededError):
+        with limiter.slot(Deadline(0.01)):
+            pass
+    limiter.release()
+    with limiter.slot(Deadline(1)):
+        assert limiter.in_flight == 1
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.usefixtures("real_http")
+def test_requests_in_flight_are_capped():
+    active = peak = 0
+    lock = threading.Lock()
+
+    def route(method, path, body):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        sleep(0.05)
+        with lock:
+            active -= 1
+        return token_route(method, path, body)
+
+    with fake_santander_server(route) as server:
+        pool = SantanderClientPool(
+            lambda tenant: tenant_config(tenant, server.url),
+            max_concurrent_requests=3,
+            max_concurrent_per_tenant=2,
+        )
+
+        def call(i):
+            client = pool.client(f"tenant-{i % 4}")
+            client.session.cert = None  # Plain HTTP fake server.
+            client.get(f"/orders/{i}")
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        orders = [r for r in server.requests if r[1].startswith("/orders")]
+        assert len(orders) == 12
+        assert peak == 3
+        assert pool.stats()["in_flight"] == 0
+        pool.close()
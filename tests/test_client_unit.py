@@ -1,3 +1,5 @@
+import gc
+import json
 import re
 import pytest
 from decimal import Decimal as D
@@ -54,11 +56,16 @@ def test_request(mock_request, client):
     request_dict = get_dict_payment_pix_request(
         "12345678", D(299.99), "12345678909", "CPF"
     )
-    mock_request.return_value.json.return_value = response_dict
+    mock_request.return_value.content = json.dumps(response_dict).encode()
     response_data = client._request("GET", "/test_endpoint")
     assert response_data == response_dict
     mock_request.assert_called_once_with(
-        "GET", "/test_endpoint", json=None, params=None, timeout=60
+        "GET",
+        "/test_endpoint",
+        data=None,
+        headers=None,
+        params=None,
+        timeout=(60, 60),
     )
 
     mock_request.reset_mock()
@@ -67,9 +74,10 @@ def test_request(mock_request, client):
     mock_request.assert_called_once_with(
         "POST",
         "/test_endpoint",
-        json=request_dict,
+        data=client.config.json_codec.dumps(request_dict),
+        headers={"Content-Type": "application/json"},
         params=None,
-        timeout=60,
+        timeout=(60, 60),
     )
 
 
@@ -79,22 +87,32 @@ def test_prepare_url(client):
     assert client._prepare_url("test/:WORKSPACEID") == "test/d6c7b8a9e"
     assert client._prepare_url(":workspaceid/pix") == "d6c7b8a9e/pix"
     client.config.workspace_id = ""
-    with pytest.raises(SantanderClientError):
-        client._prepare_url("test_endpoint/:workspaceid")
+    with patch(
+        "santander_sdk.api_client.client.get_first_workspace_id_of_type",
+        return_value=None,
+    ):
+        with pytest.raises(SantanderClientError):
+            client._prepare_url("test_endpoint/:workspaceid")
     client.config.workspace_id = "d6c7b8a9e"
 
 
 @patch("santander_sdk.api_client.client.SantanderApiClient._request")
 def test_get_method(mock_request, client):
     client.get("test_endpoint")
-    mock_request.assert_called_once_with("GET", "test_endpoint", params=None)
+    mock_request.assert_called_once_with(
+        "GET", "test_endpoint", params=None, timeout=None, deadline=None
+    )
 
 
 @patch("santander_sdk.api_client.client.SantanderApiClient._request")
 def test_post_method(mock_request, client):
     client.post("test_endpoint", data={"post_data_key": "post_data_value"})
     mock_request.assert_called_once_with(
-        "POST", "test_endpoint", data={"post_data_key": "post_data_value"}
+        "POST",
+        "test_endpoint",
+        data={"post_data_key": "post_data_value"},
+        timeout=None,
+        deadline=None,
     )
 
 
@@ -102,21 +120,31 @@ def test_post_method(mock_request, client):
 def test_put_method(mock_request, client):
     client.put("test_endpoint", data={"put_data_key": "put_data_value"})
     mock_request.assert_called_once_with(
-        "PUT", "test_endpoint", data={"put_data_key": "put_data_value"}
+        "PUT",
+        "test_endpoint",
+        data={"put_data_key": "put_data_value"},
+        timeout=None,
+        deadline=None,
     )
 
 
 @patch("santander_sdk.api_client.client.SantanderApiClient._request")
 def test_delete_method(mock_request, client):
     client.delete("test_endpoint")
-    mock_request.assert_called_once_with("DELETE", "test_endpoint")
+    mock_request.assert_called_once_with(
+        "DELETE", "test_endpoint", timeout=None, deadline=None
+    )
 
 
 @patch("santander_sdk.api_client.client.SantanderApiClient._request")
 def test_patch_method(mock_request, client):
     client.patch("test_endpoint", data={"patch_data_key": "patch_data_value"})
     mock_request.assert_called_once_with(
-        "PATCH", "test_endpoint", data={"patch_data_key": "patch_data_value"}
+        "PATCH",
+        "test_endpoint",
+        data={"patch_data_key": "patch_data_value"},
+        timeout=None,
+        deadline=None,
     )
 
 
@@ -188,3 +216,86 @@ def test_request_log_error(client):
 
     for key, value in expected_fields.items():
         assert extra[key] == value
+
+
+def test_background_token_refresher_lifecycle():
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    config = SantanderClientConfiguration(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        cert="test_cert",
+        workspace_id="test_workspace_id",
+        base_url=SANTANDER_URL,
+        refresh_token_in_background=True,
+    )
+
+    with SantanderApiClient(config) as client:
+        assert client.token_refresher is not None
+        assert client.token_refresher.is_running
+
+    assert not client.token_refresher.is_running
+
+
+def test_background_token_refresher_stops_with_the_client():
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    config = SantanderClientConfiguration(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        cert="test_cert",
+        workspace_id="test_workspace_id",
+        base_url=SANTANDER_URL,
+        refresh_token_in_background=True,
+    )
+    client = SantanderApiClient(config)
+    refresher = client.token_refresher
+    assert refresher.is_running
+
+    del client
+    gc.collect()
+    assert not refresher.is_running
+
+
+def test_no_background_token_refresher_by_default(client):
+    assert client.token_refresher is None
+
+
+def test_auth_renews_over_client_session(client):
+    assert client.session.auth.session is client.session
+
+
+def test_pool_configuration():
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    config = SantanderClientConfiguration(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        cert="test_cert",
+        workspace_id="test_workspace_id",
+        base_url=SANTANDER_URL,
+        pool_connections=2,
+        pool_maxsize=32,
+        pool_block=True,
+    )
+
+    client = SantanderApiClient(config)
+
+    assert client.session.get_adapter(SANTANDER_URL) is client.http_adapter
+    assert client.http_adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert client.http_adapter.poolmanager.connection_pool_kw["block"] is True
+    assert client.pool_stats() == {
+        "in_use": 0,
+        "idle": 0,
+        "created": 0,
+        "discarded": 0,
+    }
@@ -0,0 +1,167 @@
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from freezegun import freeze_time
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.exceptions import (
+    SantanderDeadlineExceededError,
+    SantanderRequestError,
+)
+from santander_sdk.api_client.retry import RetryPolicy
+from santander_sdk.pix import PIX_ENDPOINT
+from santander_sdk.transfer_flow import SantanderPaymentFlow
+from santander_sdk.types import OrderStatus
+from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
+
+ORDERS_URL = f"{SANTANDER_URL}/orders"
+
+
+@pytest.fixture
+def client():
+    config = SantanderClientConfiguration(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        cert="test_cert",
+        base_url=SANTANDER_URL,
+        workspace_id=TEST_WORKSPACE_ID,
+        connect_timeout=3,
+        read_timeout=20,
+    )
+    return SantanderApiClient(config)
+
+
+def test_deadline_remaining():
+    with freeze_time("2025-01-01 10:00:00") as frozen:
+        deadline = Deadline(10)
+        assert deadline.remaining() == 10
+        frozen.tick(4)
+        assert deadline.remaining() == 6
+        assert not deadline.expired
+        frozen.tick(7)
+        assert deadline.remaining() == 0
+        assert deadline.expired
+        with pytest.raises(SantanderDeadlineExceededError, match="before request"):
+            deadline.check()
+
+
+def test_deadline_clamps_timeout():
+    with freeze_time("2025-01-01 10:00:00") as frozen:
+        deadline = Deadline(10)
+        assert deadline.timeout((3, 20)) == (3, 10)
+        assert deadline.timeout(5) == (5, 5)
+        frozen.tick(8)
+        assert deadline.timeout((3, 20)) == (2, 2)
+
+
+@patch("santander_sdk.api_client.deadline.sleep")
+def test_deadline_sleep(mock_sleep):
+    with freeze_time("2025-01-01 10:00:00"):
+        deadline = Deadline(5)
+        deadline.sleep(2)
+        mock_sleep.assert_called_once_with(2)
+        with pytest.raises(SantanderDeadlineExceededError):
+            deadline.sleep(5, "next status check")
+    assert mock_sleep.call_count == 1
+
+
+def test_default_timeouts_come_from_config(client):
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.return_value.content = b"{}"
+        client.get("/orders")
+        client.get("/orders", timeout=5)
+    assert mock_request.call_args_list[0].kwargs["timeout"] == (3, 20)
+    assert mock_request.call_args_list[1].kwargs["timeout"] == 5
+
+
+def test_request_timeout_is_limited_by_deadline(client):
+    with freeze_time("2025-01-01 10:00:00"):
+        deadline = Deadline(8)
+        with patch.object(client.session, "request") as mock_request:
+            mock_request.return_value.content = b"{}"
+            client.get("/orders", deadline=deadline)
+    assert mock_request.call_args.kwargs["timeout"] == (3, 8)
+
+
+def test_expired_deadline_skips_request(client, responses):
+    with freeze_time("2025-01-01 10:00:00") as frozen:
+        deadline = Deadline(1)
+        frozen.tick(2)
+        with pytest.raises(SantanderDeadlineExceededError):
+            client.get("/orders", deadline=deadline)
+    assert len(responses.calls) == 0
+
+
+def test_timeout_after_deadline_raises_deadline_error(client):
+    with freeze_time("2025-01-01 10:00:00") as frozen:
+        deadline = Deadline(5)
+
+        def slow_request(*args, **kwargs):
+            frozen.tick(5)
+            raise requests.exceptions.ReadTimeout("read timed out")
+
+        with patch.object(client.session, "request", side_effect=slow_request):
+            with pytest.raises(SantanderDeadlineExceededError) as exc_info:
+                client.get("/orders", deadline=deadline)
+    assert isinstance(exc_info.value.__cause__, requests.exceptions.ReadTimeout)
+
+
+def test_timeout_within_deadline_raises_request_error(client):
+    deadline = Deadline(60)
+    error = requests.exceptions.ReadTimeout("read timed out")
+    with patch.object(client.session, "request", side_effect=error):
+        with pytest.raises(SantanderRequestError):
+            client.get("/orders", deadline=deadline)
+
+
+@patch("santander_sdk.api_client.deadline.sleep")
+def test_retries_stop_when_deadline_would_pass(mock_sleep, client, responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    client.config.retry_policy = RetryPolicy(max_attempts=5)
+    responses.add(responses.GET, ORDERS_URL, status=503, headers={"Retry-After": "10"})
+    with freeze_time("2025-01-01 10:00:00"):
+        with pytest.raises(SantanderDeadlineExceededError):
+            client.get("/orders", deadline=Deadline(5))
+    mock_sleep.assert_not_called()
+    assert sum(call.request.url == ORDERS_URL for call in responses.calls) == 1
+
+
+@patch("santander_sdk.api_client.deadline.sleep")
+def test_payment_flow_polling_respects_deadline(mock_sleep):
+    api_client = MagicMock()
+    api_client.get.return_value = {
+        "id": "12345",
+        "status": OrderStatus.PENDING_VALIDATION,
+    }
+    with freeze_time("2025-01-01 10:00:00") as frozen:
+        mock_sleep.side_effect = frozen.tick
+        deadline = Deadline(5)
+        flow = SantanderPaymentFlow(api_client, PIX_ENDPOINT, deadline=deadline)
+        with pytest.raises(SantanderDeadlineExceededError):
+            flow._payment_status_polling("12345", [OrderStatus.READY_TO_PAY], 10)
+
+    assert api_client.get.call_count == 3
+    api_client.get.assert_called_with(f"{PIX_ENDPOINT}/12345", deadline=deadline)
+
+
+@patch("santander_sdk.api_client.deadline.sleep")
+def test_confirm_payment_returns_pending_when_deadline_ends(mock_sleep):
+    api_client = MagicMock()
+    pending = {"id": "12345", "status": OrderStatus.PENDING_CONFIRMATION}
+    api_client.patch.return_value = pending
+    api_client.get.return_value = pending
+    with freeze_time("2025-01-01 10:00:00") as frozen:
+        mock_sleep.side_effect = frozen.tick
+        flow = SantanderPaymentFlow(api_client, PIX_ENDPOINT, deadline=Deadline(3))
+        result = flow.confirm_payment({"status": "AUTHORIZED"}, "12345")
+
+    assert result == pending
+    assert api_client.get.call_count == 2
@@ -0,0 +1,93 @@
+import pytest
+
+from santander_sdk.api_client.endpoints import (
+    PIX,
+    PIX_ENDPOINT,
+    RECEIPTS,
+    TOKEN,
+    WORKSPACES,
+    EndpointRegistry,
+    EndpointTemplate,
+    endpoint_label,
+)
+from santander_sdk.api_client.exceptions import SantanderClientError
+from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
+
+PIX_URL = (
+    f"{SANTANDER_URL}/management_payments_partners/v1/workspaces/"
+    f"{TEST_WORKSPACE_ID}/pix_payments"
+)
+
+
+def test_template_resolve():
+    assert PIX.needs_workspace
+    assert PIX.family == "pix"
+    assert PIX.resolve(TEST_WORKSPACE_ID) == PIX_URL.removeprefix(SANTANDER_URL)
+    assert not RECEIPTS.needs_workspace
+    assert RECEIPTS.resolve() == RECEIPTS.path
+    assert TOKEN.family == "auth"
+    with pytest.raises(SantanderClientError):
+        PIX.resolve("")
+
+
+def test_template_slug_is_case_insensitive():
+    template = EndpointTemplate("/v1/workspaces/:WorkspaceId/orders")
+    assert template.resolve("abc") == "/v1/workspaces/abc/orders"
+
+
+def test_template_format():
+    assert PIX.format("123") == f"{PIX_ENDPOINT}/123"
+    assert RECEIPTS.format("P1", "file_requests", "R1") == (
+        "/consult_payment_receipts/v1/payment_receipts/P1/file_requests/R1"
+    )
+
+
+def test_registry_matches_longest_template():
+    registry = EndpointRegistry(SANTANDER_URL)
+    assert registry.match(f"{PIX_ENDPOINT}/123") == (PIX, "/123")
+    assert registry.match(WORKSPACES.path) == (WORKSPACES, "")
+    assert registry.match(f"{RECEIPTS.path}?_limit=10") == (RECEIPTS, "?_limit=10")
+    assert registry.match(f"{RECEIPTS.path}_other") is None
+    assert registry.match("/other/endpoint") is None
+
+
+def test_registry_caches_prefix_per_workspace():
+    registry = EndpointRegistry(SANTANDER_URL)
+    assert registry.url(PIX, "/123", TEST_WORKSPACE_ID) == f"{PIX_URL}/123"
+    assert registry.url(PIX, "", TEST_WORKSPACE_ID) == PIX_URL
+    assert registry.url(PIX, "/1", "other").endswith("/workspaces/other/pix_payments/1")
+    assert len(registry._prefixes) == 2
+
+
+def test_client_prepare_url_uses_templates(client_instance):
+    assert client_instance._prepare_url(f"{PIX_ENDPOINT}/123") == f"{PIX_URL}/123"
+    assert client_instance._prepare_url("/v1/:workspaceid/other") == (
+        f"/v1/{TEST_WORKSPACE_ID}/other"
+    )
+    assert client_instance._prepare_url("/other") == "/other"
+
+
+def test_client_prepare_url_with_uppercase_slug(client_instance):
+    endpoint = f"{WORKSPACES.path}/:WORKSPACEID/pix_payments/1"
+    assert EndpointRegistry(SANTANDER_URL).match(endpoint) is None
+    assert client_instance._prepare_url(endpoint) == (
+        f"{WORKSPACES.path}/{TEST_WORKSPACE_ID}/pix_payments/1"
+    )
+
+
+@pytest.mark.parametrize(
+    "url, label",
+    [
+        (f"{PIX_URL}/PIX1", f"{PIX_ENDPOINT}/{{id}}"),
+        (PIX_URL, PIX_ENDPOINT),
+        (
+            f"{SANTANDER_URL}{RECEIPTS.path}/P1/file_requests/R1?x=1",
+            f"{RECEIPTS.path}/{{id}}/file_requests/{{id}}",
+        ),
+        (f"{SANTANDER_URL}{WORKSPACES.path}", WORKSPACES.path),
+        (TOKEN.path, TOKEN.path),
+        ("/orders/1", "/orders/1"),
+    ],
+)
+def test_endpoint_label(url, label):
+    assert endpoint_label(url) == label
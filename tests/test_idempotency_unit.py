@@ -0,0 +1,215 @@
+import threading
+import uuid
+from decimal import Decimal as D
+from time import sleep
+from unittest.mock import MagicMock
+
+import pytest
+from freezegun import freeze_time
+
+from santander_sdk.api_client.idempotency import IdempotencyRegistry, idempotency_id
+from santander_sdk.pix import transfer_pix
+from santander_sdk.types import OrderStatus
+from tests.mock.santander_mocker import get_dict_payment_pix_response
+
+
+def ok(request_id, status="PAYED"):
+    return {
+        "success": True,
+        "request_id": request_id,
+        "data": {"id": request_id, "status": status},
+        "error": "",
+    }
+
+
+def failed(request_id):
+    return {"success": False, "request_id": request_id, "data": None, "error": "x"}
+
+
+def test_idempotency_id_is_stable_and_scoped():
+    assert idempotency_id("order-1") == idempotency_id("order-1")
+    assert idempotency_id("order-1") != idempotency_id("order-2")
+    assert idempotency_id("order-1", "client-a") != idempotency_id("order-1", "b")
+    assert idempotency_id("order-1").version == 5
+    with pytest.raises(ValueError):
+        idempotency_id("")
+
+
+def test_registry_returns_the_completed_result_without_running():
+    registry = IdempotencyRegistry()
+    transfer = MagicMock(return_value=ok("PIX1"))
+
+    assert registry.run("PIX1", transfer) == ok("PIX1")
+    assert registry.run("PIX1", transfer) == ok("PIX1")
+    assert transfer.call_count == 1
+    assert registry.stats() == {"in_flight": 0, "completed": 1, "short_circuited": 1}
+
+
+def test_registry_does_not_remember_failures():
+    registry = IdempotencyRegistry()
+    transfer = MagicMock(side_effect=[failed("PIX1"), ok("PIX1")])
+
+    assert not registry.run("PIX1", transfer)["success"]
+    assert registry.run("PIX1", transfer)["success"]
+    assert transfer.call_count == 2
+
+
+def test_registry_does_not_remember_pending_transfers():
+    registry = IdempotencyRegistry()
+    transfer = MagicMock(
+        side_effect=[ok("PIX1", "PENDING_CONFIRMATION"), ok("PIX1"), ok("PIX1")]
+    )
+
+    assert registry.run("PIX1", transfer)["data"]["status"] == "PENDING_CONFIRMATION"
+    assert registry.run("PIX1", transfer)["data"]["status"] == "PAYED"
+    assert registry.run("PIX1", transfer)["data"]["status"] == "PAYED"
+    assert transfer.call_count == 2
+
+
+def test_registry_coalesces_concurrent_transfers():
+    registry = IdempotencyRegistry()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def transfer():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return ok("PIX1")
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(registry.run("PIX1", transfer))
+    )
+    leader.start()
+    started.wait()
+    followers = [
+        threading.Thread(target=lambda: results.append(registry.run("PIX1", transfer)))
+        for _ in range(5)
+    ]
+    for thread in followers:
+        thread.start()
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [ok("PIX1")] * 6
+
+
+def test_registry_waiters_get_the_leader_error_without_sending_again():
+    registry = IdempotencyRegistry()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def transfer():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise ConnectionError("connection reset")
+
+    errors = []
+
+    def run():
+        try:
+            registry.run("PIX1", transfer)
+        except ConnectionError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=run) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while registry.stats()["short_circuited"] < 3:
+        sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(errors) == 4
+    assert registry.stats() == {"in_flight": 0, "completed": 0, "short_circuited": 3}
+
+
+def test_registry_waits_with_timeout():
+    registry = IdempotencyRegistry()
+    started, release = threading.Event(), threading.Event()
+
+    def transfer():
+        started.set()
+        release.wait()
+        return ok("PIX1")
+
+    leader = threading.Thread(target=registry.run, args=("PIX1", transfer))
+    leader.start()
+    started.wait()
+    with pytest.raises(TimeoutError):
+        registry.run("PIX1", transfer, timeout=0.01)
+    release.set()
+    leader.join()
+
+
+def test_registry_expires_and_evicts():
+    registry = IdempotencyRegistry(max_entries=2, ttl=60)
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        for id in ("PIX1", "PIX2", "PIX3"):
+            registry.run(id, lambda: ok(id))
+        assert registry.stats()["completed"] == 2
+
+        transfer = MagicMock(return_value=ok("PIX1"))
+        registry.run("PIX1", transfer)
+        assert transfer.call_count == 1  # Evicted.
+
+        frozen.tick(61)
+        transfer = MagicMock(return_value=ok("PIX3"))
+        registry.run("PIX3", transfer)
+        assert transfer.call_count == 1  # Expired.
+
+
+def test_registry_forget():
+    registry = IdempotencyRegistry()
+    registry.run("PIX1", lambda: ok("PIX1"))
+    registry.forget("PIX1")
+    transfer = MagicMock(return_value=ok("PIX1"))
+    registry.run("PIX1", transfer)
+    assert transfer.call_count == 1
+
+
+@pytest.fixture
+def api_client():
+    client = MagicMock()
+    client.config.client_id = "buser"
+    client.config.transfer_journal = None
+    client.config.idempotency_registry = IdempotencyRegistry()
+    client.post.side_effect = lambda endpoint, data, deadline: (
+        get_dict_payment_pix_response(data["id"], D("10"), OrderStatus.READY_TO_PAY)
+    )
+    client.patch.side_effect = lambda endpoint, data, deadline: (
+        get_dict_payment_pix_response("x", D("10"), OrderStatus.PAYED)
+    )
+    return client
+
+
+def test_transfer_pix_with_idempotency_key(api_client):
+    result = transfer_pix(
+        api_client, "12345678909", D("10"), "Pay", idempotency_key="order-1"
+    )
+    again = transfer_pix(
+        api_client, "12345678909", D("10"), "Pay", idempotency_key="order-1"
+    )
+
+    expected_id = str(idempotency_id("order-1", "buser"))
+    assert result["success"]
+    assert again == result
+    assert api_client.post.call_count == 1
+    assert api_client.post.call_args.kwargs["data"]["id"] == expected_id
+    assert uuid.UUID(expected_id).version == 5
+
+
+def test_transfer_pix_id_and_idempotency_key_are_exclusive(api_client):
+    with pytest.raises(ValueError, match="either"):
+        transfer_pix(
+            api_client, "12345678909", D("10"), "Pay", id="1", idempotency_key="k"
+        )
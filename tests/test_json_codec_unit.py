@@ -0,0 +1,144 @@
+import re
+from decimal import Decimal
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from santander_sdk.api_client import json_codec
+from santander_sdk.api_client.circuit_breaker import CircuitBreaker
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.exceptions import SantanderRequestError
+from santander_sdk.api_client.helpers import try_parse_response_to_json
+from santander_sdk.api_client.json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_json_codec,
+)
+from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
+
+
+def available_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec_class in (OrjsonCodec, MsgspecJsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+def test_codec_roundtrip(codec):
+    body = {"paymentValue": Decimal("10.50"), "name": "João", "tags": [1, None]}
+    encoded = codec.dumps(body)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {
+        "paymentValue": "10.50",
+        "name": "João",
+        "tags": [1, None],
+    }
+    assert codec.loads(encoded.decode()) == codec.loads(encoded)
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>")
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+
+def test_codec_requires_dumps_and_loads():
+    class DecodeOnlyCodec(JsonCodec):
+        def loads(self, data):
+            return {}
+
+    with pytest.raises(TypeError, match="dumps"):
+        DecodeOnlyCodec()
+
+
+def test_default_codec_falls_back_to_stdlib():
+    with (
+        patch.object(json_codec, "_default_codec", None),
+        patch.object(OrjsonCodec, "__init__", side_effect=ImportError),
+        patch.object(MsgspecJsonCodec, "__init__", side_effect=ImportError),
+    ):
+        assert isinstance(default_json_codec(), StdlibJsonCodec)
+
+
+def test_default_codec_is_reused():
+    assert default_json_codec() is default_json_codec()
+
+
+def test_try_parse_response_uses_codec():
+    response = requests.Response()
+    response._content = b'{"error": "Bad Request"}'
+    codec = StdlibJsonCodec()
+    with patch.object(codec, "loads", wraps=codec.loads) as mock_loads:
+        assert try_parse_response_to_json(response, codec) == {"error": "Bad Request"}
+    mock_loads.assert_called_once_with(response.content)
+    response._content = b""
+    assert try_parse_response_to_json(response) is None
+
+
+def test_client_uses_configured_codec(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(responses.POST, f"{SANTANDER_URL}/orders", json={"id": "1"})
+    codec = StdlibJsonCodec()
+    client = SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="/var/certs/cert.pem",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            json_codec=codec,
+        )
+    )
+
+    with (
+        patch.object(codec, "dumps", wraps=codec.dumps) as mock_dumps,
+        patch.object(codec, "loads", wraps=codec.loads) as mock_loads,
+    ):
+        assert client.post("/orders", {"value": Decimal("1.00")}) == {"id": "1"}
+
+    mock_dumps.assert_called_once_with({"value": Decimal("1.00")})
+    mock_loads.assert_called_once()
+    request = responses.calls[-1].request
+    assert request.body == b'{"value": "1.00"}'
+    assert request.headers["Content-Type"] == "application/json"
+
+
+def test_unencodable_body_takes_no_circuit_permit(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(responses.POST, f"{SANTANDER_URL}/orders", json={"id": "1"})
+    breaker = CircuitBreaker(window_size=2, min_calls=2, open_secs=0.01)
+    client = SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="/var/certs/cert.pem",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            circuit_breaker=breaker,
+        )
+    )
+    for _ in range(2):
+        breaker.acquire("other")
+        breaker.record("other", True, 0.1)
+    sleep(0.02)
+    assert breaker.state() == {"other": "half_open"}
+
+    with pytest.raises(SantanderRequestError):
+        client.post("/orders", {"value": object()})
+    assert client.post("/orders", {"value": 1}) == {"id": "1"}
+    assert breaker.state() == {"other": "closed"}
@@ -0,0 +1,164 @@
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import PIX_ENDPOINT, RECEIPTS_ENDPOINT
+from santander_sdk.api_client.metrics import (
+    MetricsRegistry,
+    SantanderMetrics,
+    _Metric,
+    status_class,
+)
+from santander_sdk.api_client.retry import RetryPolicy
+from santander_sdk.payment_receipts import get_receipt
+from santander_sdk.transfer_flow import SantanderPaymentFlow
+from santander_sdk.typing.receipts_types import ReceiptStatus
+from tests.mock.santander_mocker import (
+    PIX_ENDPOINT_WITH_WORKSPACE,
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+    receipt_response_dict,
+)
+
+RECEIPT_URL = f"{SANTANDER_URL}{RECEIPTS_ENDPOINT}/P1/file_requests/R1"
+
+
+@pytest.fixture
+def metrics():
+    return SantanderMetrics()
+
+
+@pytest.fixture
+def client(responses, metrics):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    return SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="/var/certs/cert.pem",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            retry_policy=RetryPolicy(max_attempts=3),
+            metrics=metrics,
+        )
+    )
+
+
+def test_text_exposition():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.\nDone", ["queue"])
+    histogram = registry.histogram("job_seconds", "Job time.", ["queue"], [0.1, 1])
+    gauge = registry.gauge("workers", "Workers.")
+
+    counter.inc(queue='pix "fast"')
+    counter.inc(2, queue='pix "fast"')
+    histogram.observe(0.05, queue="pix")
+    histogram.observe(0.5, queue="pix")
+    histogram.observe(3, queue="pix")
+    gauge.set(4)
+
+    assert registry.expose() == (
+        "# HELP job_seconds Job time.\n"
+        "# TYPE job_seconds histogram\n"
+        'job_seconds_bucket{queue="pix",le="0.1"} 1\n'
+        'job_seconds_bucket{queue="pix",le="1"} 2\n'
+        'job_seconds_bucket{queue="pix",le="+Inf"} 3\n'
+        'job_seconds_sum{queue="pix"} 3.55\n'
+        'job_seconds_count{queue="pix"} 3\n'
+        "# HELP jobs_total Jobs.\\nDone\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{queue="pix \\"fast\\""} 3\n'
+        "# HELP workers Workers.\n"
+        "# TYPE workers gauge\n"
+        "workers 4\n"
+    )
+
+
+def test_registry_validation():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.", ["queue"])
+    assert registry.counter("jobs_total", "Jobs.", ["queue"]) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("jobs_total", "Jobs.", ["queue"])
+    with pytest.raises(ValueError):
+        counter.inc(family="pix")
+
+
+def test_metric_types_require_samples():
+    with pytest.raises(TypeError, match="samples"):
+        _Metric("jobs_total", "Jobs.")
+
+
+@pytest.mark.parametrize(
+    "status_code, expected", [(200, "2xx"), (404, "4xx"), (503, "5xx"), (None, "error")]
+)
+def test_status_class(status_code, expected):
+    assert status_class(status_code) == expected
+
+
+def test_request_latency_token_and_retries(client, responses, metrics):
+    url = f"{PIX_ENDPOINT_WITH_WORKSPACE}/PIX1"
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, json={"status": "PAYED"})
+
+    with patch("santander_sdk.api_client.client.sleep"):
+        client.get(f"{PIX_ENDPOINT}/PIX1")
+
+    template = f"{PIX_ENDPOINT}/{{id}}"
+    assert (
+        metrics.request_duration.count(
+            method="GET", template=template, status_class="2xx"
+        )
+        == 1
+    )
+    assert metrics.token_renewals.value(result="success") == 1
+    assert metrics.retries.value(family="pix", reason="503") == 1
+    text = metrics.expose()
+    assert "santander_request_duration_seconds_bucket{" in text
+    assert f'template="{template}"' in text
+
+
+def test_receipt_status_transitions(client, responses, metrics):
+    for status in (ReceiptStatus.REQUESTED, ReceiptStatus.AVAILABLE):
+        responses.add(
+            responses.GET, RECEIPT_URL, json=receipt_response_dict("R1", status)
+        )
+    for _ in range(3):
+        get_receipt(client, "P1", "R1")
+
+    transitions = metrics.receipt_status_transitions
+    assert transitions.value(from_status="none", to_status="REQUESTED") == 1
+    assert transitions.value(from_status="REQUESTED", to_status="AVAILABLE") == 1
+    assert transitions.value(from_status="AVAILABLE", to_status="AVAILABLE") == 0
+
+
+def test_polling_attempts(metrics):
+    client = MagicMock()
+    client.config.metrics = metrics
+    client.get.side_effect = [
+        {"id": "PIX1", "status": "PENDING_CONFIRMATION"},
+        {"id": "PIX1", "status": "PAYED"},
+    ]
+    flow = SantanderPaymentFlow(client, PIX_ENDPOINT)
+    flow.current_step = "CONFIRM"
+    with patch("santander_sdk.transfer_flow.sleep"):
+        flow._payment_status_polling("PIX1", ["PAYED"], 5)
+
+    attempts = metrics.polling_attempts
+    assert attempts.value(step="CONFIRM", status="PENDING_CONFIRMATION") == 1
+    assert attempts.value(step="CONFIRM", status="PAYED") == 1
+
+
+def test_pool_utilisation(client, responses, metrics):
+    responses.add(responses.GET, f"{SANTANDER_URL}/orders", json={})
+    client.get("/orders")
+    text = metrics.expose()
+    assert 'santander_pool_connections{client_id="buser",state="in_use"} 0' in text
+    assert 'santander_pool_max_connections{client_id="buser"} 10' in text
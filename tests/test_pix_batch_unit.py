@@ -0,0 +1,308 @@
+import logging
+import threading
+from decimal import Decimal as D
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.idempotency import IdempotencyRegistry
+from santander_sdk.api_client.transfer_journal import SQLiteTransferJournal
+from santander_sdk.pix_batch import CANCELLED_ERROR, transfer_pix_batch
+from tests.mock.fake_server import FakePixApi, fake_santander_server
+from tests.mock.santander_mocker import TEST_WORKSPACE_ID
+
+
+def pix_item(i):
+    return {"pix_key": "12345678909", "value": D(i + 1), "description": f"Pay {i}"}
+
+
+def ok(request_id):
+    return {"success": True, "request_id": request_id, "data": {}, "error": ""}
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.config.pool_maxsize = 10
+    return client
+
+
+def test_results_stream_in_completion_order(client):
+    release_first = threading.Event()
+
+    def transfer(
+        client, pix_key, value, description, tags, id, deadline, idempotency_key
+    ):
+        if value == D(1):
+            release_first.wait(5)
+        if value == D(3):
+            return {"success": False, "request_id": None, "data": None, "error": "x"}
+        return ok(f"PIX{value}")
+
+    items = (pix_item(i) for i in range(3))
+    with patch("santander_sdk.pix_batch.transfer_pix", side_effect=transfer):
+        batch = transfer_pix_batch(client, items, max_workers=2)
+        stream = iter(batch)
+        first = next(stream)
+        release_first.set()
+        results = [first, *stream]
+
+    assert first["index"] != 0
+    assert {r["index"] for r in results} == {0, 1, 2}
+    item_0 = next(r for r in results if r["index"] == 0)
+    assert item_0["result"]["request_id"] == "PIX1"
+    assert item_0["item"] == pix_item(0)
+    summary = batch.summary()
+    assert summary["total"] == 3
+    assert summary["succeeded"] == 2
+    assert summary["failed"] == 1
+    assert summary["cancelled"] == 0
+    assert summary["elapsed_seconds"] > 0
+    with pytest.raises(RuntimeError):
+        batch.wait()
+
+
+def test_cancel_drops_queued_items(client):
+    started = threading.Event()
+    release = threading.Event()
+
+    def transfer(
+        client, pix_key, value, description, tags, id, deadline, idempotency_key
+    ):
+        started.set()
+        release.wait(5)
+        return ok(f"PIX{value}")
+
+    with patch("santander_sdk.pix_batch.transfer_pix", side_effect=transfer):
+        batch = transfer_pix_batch(client, [pix_item(i) for i in range(100)], 1)
+        results = iter(batch)
+
+        def cancel():
+            started.wait(5)
+            batch.cancel()
+            release.set()
+
+        threading.Thread(target=cancel).start()
+        results = list(results)
+
+    assert batch.cancelled
+    # Item 0 was running and finished; only item 1 was queued (2 per worker).
+    assert [r["result"]["success"] for r in results].count(True) == 1
+    cancelled = [r for r in results if not r["result"]["success"]]
+    assert [r["result"]["error"] for r in cancelled] == [CANCELLED_ERROR]
+    assert batch.summary()["cancelled"] == 1
+    assert batch.summary()["total"] == 2
+
+
+def test_leaving_the_iteration_cancels(client):
+    with patch("santander_sdk.pix_batch.transfer_pix", return_value=ok("PIX")) as mock:
+        batch = transfer_pix_batch(client, (pix_item(i) for i in range(1000)), 2)
+        for _ in batch:
+            break
+    assert batch.cancelled
+    assert mock.call_count <= 4
+
+
+def test_invalid_item_fails_alone(client):
+    items = [{"value": D(1), "description": "No key"}, pix_item(1)]
+    with patch("santander_sdk.pix_batch.transfer_pix", return_value=ok("PIX")):
+        summary = transfer_pix_batch(client, items).wait()
+    assert summary["failed"] == 1
+    assert summary["succeeded"] == 1
+
+
+def test_item_raising_fails_alone(client):
+    def transfer(*args, **kwargs):
+        if args[2] == D(2):
+            raise TimeoutError("Timed out waiting for the in-flight transfer")
+        return ok("PIX")
+
+    items = [pix_item(i) for i in range(5)]
+    with patch("santander_sdk.pix_batch.transfer_pix", side_effect=transfer):
+        batch = transfer_pix_batch(client, items, max_workers=2)
+        results = {r["index"]: r["result"] for r in batch}
+
+    assert batch.summary()["succeeded"] == 4
+    assert batch.summary()["failed"] == 1
+    assert batch.summary()["cancelled"] == 0
+    assert results[1]["error"] == "Timed out waiting for the in-flight transfer"
+
+
+@pytest.mark.usefixtures("real_http")
+def test_batch_against_fake_server():
+    lock = threading.Lock()
+    created = []
+
+    def route(method, path, body):
+        if path.endswith("/token"):
+            return 200, {}, {"access_token": "TOKEN", "expires_in": 900}
+        if method == "POST":
+            with lock:
+                created.append(body["paymentValue"])
+                pix_id = f"PIX{len(created)}"
+            return 200, {}, {"id": pix_id, "status": "READY_TO_PAY"}
+        return 200, {}, {"id": path.rsplit("/", 1)[1], "status": "PAYED"}
+
+    with fake_santander_server(route, delay=0.01) as server:
+        client = SantanderApiClient(
+            SantanderClientConfiguration(
+                client_id="buser",
+                client_secret="secret",
+                cert="",
+                base_url=server.url,
+                workspace_id=TEST_WORKSPACE_ID,
+            )
+        )
+        summary = transfer_pix_batch(
+            client, [pix_item(i) for i in range(20)], max_workers=5
+        ).wait()
+
+    assert summary["succeeded"] == 20
+    assert sorted(created) == sorted(f"{i + 1}.00" for i in range(20))
+
+
+@pytest.fixture
+def fake_pix_api(request):
+    route = FakePixApi(**getattr(request, "param", {}))
+    with (
+        patch("santander_sdk.pix_batch.UPDATE_STATUS_INTERVAL_TIME", 0.01),
+        patch("santander_sdk.pix_batch.MAX_UPDATE_STATUS_BEFORE_CONFIRM", 3),
+        patch("santander_sdk.pix_batch.MAX_UPDATE_STATUS_AFTER_CONFIRM", 3),
+        patch("santander_sdk.transfer_flow.UPDATE_STATUS_INTERVAL_TIME", 0.01),
+        fake_santander_server(route) as server,
+    ):
+        client = SantanderApiClient(
+            SantanderClientConfiguration(
+                client_id="buser",
+                client_secret="secret",
+                cert="",
+                base_url=server.url,
+                workspace_id=TEST_WORKSPACE_ID,
+            )
+        )
+        yield client, server, route
+        client.close()
+
+
+@pytest.mark.usefixtures("real_http")
+def test_pipelined_batch_runs_the_phases_for_the_whole_batch(fake_pix_api):
+    client, server, route = fake_pix_api
+    items = [pix_item(i) for i in range(15)]
+    batch = transfer_pix_batch(client, items, max_workers=4, pipelined=True)
+    results = {r["index"]: r["result"] for r in batch}
+
+    assert batch.summary()["succeeded"] == 14
+    assert batch.summary()["failed"] == 1
+    assert not results[12]["success"]
+    assert "rejected" in results[12]["error"]
+    assert results[0]["request_id"] == results[0]["data"]["id"]
+    assert all(r["data"]["status"] == "PAYED" for r in results.values() if r["data"])
+
+    methods = [method for method, path in server.requests if "pix" in path]
+    last_post = max(i for i, method in enumerate(methods) if method == "POST")
+    assert methods.index("PATCH") > last_post
+    assert methods.count("PATCH") == 14
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize(
+    "fake_pix_api", [{"ready_after": None, "paid_after": None}], indirect=True
+)
+def test_pipelined_batch_status_timeouts(fake_pix_api):
+    client, server, route = fake_pix_api
+    results = {
+        r["index"]: r["result"]
+        for r in transfer_pix_batch(
+            client, [pix_item(i) for i in range(4)], pipelined=True
+        )
+    }
+    # Never READY_TO_PAY: failed like transfer_pix.
+    assert not results[1]["success"]
+    assert "attempt limit" in results[1]["error"]
+    # Confirmed but never PAYED: returned pending, like transfer_pix.
+    assert results[0]["success"]
+    assert results[0]["data"]["status"] == "PENDING_CONFIRMATION"
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": None}], indirect=True)
+def test_pipelined_batch_logs_the_status_timeout(fake_pix_api):
+    client, server, route = fake_pix_api
+    client.logger = MagicMock()
+    transfer_pix_batch(client, [pix_item(0)], pipelined=True).wait()
+
+    (call,) = [c for c in client.logger.info.call_args_list if "Timeout" in c.args[0]]
+    record = logging.makeLogRecord({"msg": call.args[0], "args": call.args[1:]})
+    assert record.getMessage() == (
+        "Timeout occurred while updating status: "
+        "Status update timeout after several attempts: "
+        "Santander - Status update attempt limit reached"
+    )
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"ready_after": None}], indirect=True)
+def test_cancelled_pipelined_batch_does_not_confirm(fake_pix_api):
+    client, server, route = fake_pix_api
+    batch = transfer_pix_batch(
+        client, [pix_item(i) for i in range(6)], max_workers=2, pipelined=True
+    )
+    batch.cancel()
+    assert list(batch) == []
+
+    batch = transfer_pix_batch(
+        client, [pix_item(i) for i in range(6)], max_workers=2, pipelined=True
+    )
+    with patch("santander_sdk.pix_batch.UPDATE_STATUS_INTERVAL_TIME", 30):
+        stream = iter(batch)
+        threading.Timer(0.2, batch.cancel).start()
+        results = list(stream)
+
+    assert batch.summary()["cancelled"] == 6
+    assert all(r["result"]["error"] == CANCELLED_ERROR for r in results)
+    assert all(r["result"]["request_id"] for r in results)
+    assert not [method for method, _ in server.requests if method == "PATCH"]
+
+
+def pix_posts(server):
+    return [
+        path for method, path in server.requests if method == "POST" and "pix" in path
+    ]
+
+
+@pytest.mark.usefixtures("real_http")
+def test_pipelined_batch_resumes_journaled_transfers(fake_pix_api, tmp_path):
+    client, server, route = fake_pix_api
+    journal = SQLiteTransferJournal(tmp_path / "transfers.db")
+    client.config.transfer_journal = journal
+    items = [{**pix_item(i), "idempotency_key": f"k{i}"} for i in range(4)]
+    try:
+        first = transfer_pix_batch(client, items, pipelined=True)
+        assert first.wait()["succeeded"] == 4
+        posts = len(pix_posts(server))
+
+        again = transfer_pix_batch(client, items, pipelined=True)
+        results = [r["result"] for r in again]
+    finally:
+        journal.close()
+
+    assert posts == 4
+    assert len(pix_posts(server)) == posts
+    assert all(r["success"] for r in results)
+    assert all(r["data"]["status"] == "PAYED" for r in results)
+
+
+@pytest.mark.usefixtures("real_http")
+def test_pipelined_batch_coalesces_duplicate_ids(fake_pix_api):
+    client, server, route = fake_pix_api
+    client.config.idempotency_registry = IdempotencyRegistry()
+    items = [{**pix_item(1), "idempotency_key": "k"} for _ in range(3)]
+    items.append(pix_item(2))
+
+    results = [r["result"] for r in transfer_pix_batch(client, items, pipelined=True)]
+
+    assert all(r["success"] for r in results)
+    assert len(pix_posts(server)) == 2
+    assert client.config.idempotency_registry.stats()["short_circuited"] == 2
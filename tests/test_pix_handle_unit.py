@@ -0,0 +1,235 @@
+import threading
+from decimal import Decimal as D
+from unittest.mock import patch
+
+import pytest
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.exceptions import (
+    SantanderClientError,
+    SantanderRejectedError,
+    SantanderStatusTimeoutError,
+)
+from santander_sdk.api_client.idempotency import IdempotencyRegistry
+from santander_sdk.api_client.transfer_journal import SQLiteTransferJournal
+from santander_sdk.pix import submit_transfer_pix, transfer_pix
+from santander_sdk.pix_handle import PixTransferHandle, PixTransferTracker
+from tests.mock.fake_server import FakePixApi, fake_santander_server
+from tests.mock.santander_mocker import TEST_WORKSPACE_ID
+
+
+def new_client(server, **config):
+    return SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="",
+            base_url=server.url,
+            workspace_id=TEST_WORKSPACE_ID,
+            **config,
+        )
+    )
+
+
+@pytest.fixture
+def fake_pix_api(request):
+    route = FakePixApi(**getattr(request, "param", {}))
+    with (
+        patch("santander_sdk.pix_handle.UPDATE_STATUS_INTERVAL_TIME", 0.01),
+        patch("santander_sdk.transfer_flow.UPDATE_STATUS_INTERVAL_TIME", 0.01),
+        fake_santander_server(route) as server,
+    ):
+        client = new_client(server)
+        yield client, server, route
+        client.close()
+
+
+def pix_methods(server):
+    return [method for method, path in server.requests if "pix" in path]
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": 3}], indirect=True)
+def test_submit_returns_once_confirmed(fake_pix_api):
+    client, server, route = fake_pix_api
+    handle = submit_transfer_pix(client, "12345678909", D("11.00"), "Pay")
+
+    assert pix_methods(server) == ["POST", "PATCH"]
+    assert not handle.done()
+    assert handle.result() is None
+    assert handle.last_status == "PENDING_CONFIRMATION"
+    assert handle.status() == "PENDING_CONFIRMATION"
+
+    result = handle.wait(timeout=5)
+    assert result["success"]
+    assert result["request_id"] == handle.payment_id
+    assert result["data"]["status"] == "PAYED"
+    assert handle.done()
+    assert handle.status() == "PAYED"
+    assert pix_methods(server).count("GET") == 3
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": None}], indirect=True)
+def test_wait_timeout_keeps_the_handle_pending(fake_pix_api):
+    client, server, route = fake_pix_api
+    handle = submit_transfer_pix(client, "12345678909", D("11.00"), "Pay")
+
+    with pytest.raises(SantanderStatusTimeoutError):
+        handle.wait(timeout=0.05)
+    assert not handle.done()
+
+    route.paid_after = 1
+    assert handle.wait(timeout=5)["success"]
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": 2}], indirect=True)
+def test_done_callbacks_run_from_the_tracker(fake_pix_api):
+    client, server, route = fake_pix_api
+    tracker = PixTransferTracker()
+    handle = submit_transfer_pix(client, "12345678909", D("11.00"), "Pay")
+    handle.tracker = tracker
+    called = threading.Event()
+    handles = []
+
+    def callback(h):
+        handles.append(h)
+        called.set()
+
+    handle.add_done_callback(callback)
+    assert called.wait(5)
+    assert handles == [handle]
+    assert handle.result()["success"]
+    assert tracker.tracking() == 0
+
+    # Already done: called right away.
+    handle.add_done_callback(handles.append)
+    assert handles == [handle, handle]
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": 2}], indirect=True)
+def test_token_resumes_tracking_with_another_client(fake_pix_api):
+    client, server, route = fake_pix_api
+    token = submit_transfer_pix(client, "12345678909", D("11.00"), "Pay").token()
+
+    other_client = new_client(server)
+    try:
+        handle = PixTransferHandle.from_token(other_client, token)
+        assert handle.wait(timeout=5)["data"]["status"] == "PAYED"
+    finally:
+        other_client.close()
+    assert pix_methods(server).count("PATCH") == 1
+
+
+def test_invalid_token(fake_pix_api):
+    client, server, route = fake_pix_api
+    for token in ("", "[]", '{"version": 2, "payment_id": "1"}'):
+        with pytest.raises(SantanderClientError, match="Invalid PIX transfer token"):
+            PixTransferHandle.from_token(client, token)
+
+
+@pytest.mark.usefixtures("real_http")
+def test_submit_raises_when_rejected(fake_pix_api):
+    client, server, route = fake_pix_api
+    with pytest.raises(SantanderRejectedError):
+        submit_transfer_pix(client, "12345678909", D("13.00"), "Pay")
+    assert "PATCH" not in pix_methods(server)
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": None}], indirect=True)
+def test_rejected_after_confirmation(fake_pix_api):
+    client, server, route = fake_pix_api
+    handle = submit_transfer_pix(client, "12345678909", D("11.00"), "Pay")
+    route.payments[handle.payment_id]["status"] = "REJECTED"
+
+    assert handle.status() == "REJECTED"
+    assert handle.done()
+    result = handle.wait()
+    assert not result["success"]
+    assert "rejected" in result["error"]
+
+
+@pytest.mark.usefixtures("real_http")
+def test_submit_raises_when_the_confirmation_fails(fake_pix_api):
+    client, server, route = fake_pix_api
+
+    def failing_patch(method, path, body):
+        if method == "PATCH":
+            return 500, {}, {"_message": "Internal error"}
+        return route(method, path, body)
+
+    server.route = failing_patch
+    with pytest.raises(SantanderClientError, match="READY_TO_PAY"):
+        submit_transfer_pix(client, "12345678909", D("11.00"), "Pay")
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": 3}], indirect=True)
+def test_submit_resumes_a_journaled_transfer(fake_pix_api, tmp_path):
+    client, server, route = fake_pix_api
+    journal = SQLiteTransferJournal(tmp_path / "transfers.db")
+    client.config.transfer_journal = journal
+    try:
+        first = submit_transfer_pix(
+            client, "12345678909", D("11.00"), "Pay", idempotency_key="k"
+        )
+        again = submit_transfer_pix(
+            client, "12345678909", D("11.00"), "Pay", idempotency_key="k"
+        )
+
+        assert again.payment_id == first.payment_id
+        assert again.last_status == "PENDING_CONFIRMATION"
+        assert pix_methods(server).count("POST") == 1
+        assert pix_methods(server).count("PATCH") == 1
+        assert again.wait(timeout=5)["success"]
+        assert journal.incomplete() == []
+    finally:
+        journal.close()
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": None}], indirect=True)
+def test_concurrent_duplicate_submits_share_one_handle(fake_pix_api):
+    client, server, route = fake_pix_api
+    client.config.idempotency_registry = IdempotencyRegistry()
+    server.delay = 0.1  # The submissions overlap.
+    handles = []
+
+    def submit():
+        handles.append(
+            submit_transfer_pix(
+                client, "12345678909", D("12.00"), "Pay", idempotency_key="k"
+            )
+        )
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(handles) == 4
+    assert pix_methods(server).count("POST") == 1
+    assert pix_methods(server).count("PATCH") == 1
+    assert len({h.payment_id for h in handles}) == 1
+
+
+@pytest.mark.usefixtures("real_http")
+@pytest.mark.parametrize("fake_pix_api", [{"paid_after": 1}], indirect=True)
+def test_submit_of_a_paid_id_makes_no_request(fake_pix_api):
+    client, server, route = fake_pix_api
+    client.config.idempotency_registry = IdempotencyRegistry()
+    transfer_pix(client, "12345678909", D("11.00"), "Pay", idempotency_key="k")
+    requests_before = len(server.requests)
+
+    handle = submit_transfer_pix(
+        client, "12345678909", D("11.00"), "Pay", idempotency_key="k"
+    )
+
+    assert handle.done()
+    assert handle.result()["data"]["status"] == "PAYED"
+    assert len(server.requests) == requests_before
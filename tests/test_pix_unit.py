@@ -36,7 +36,10 @@ confirm_response = get_dict_payment_pix_response("1234", D("123"), OrderStatus.P
 
 @pytest.fixture
 def api_client():
-    return MagicMock()
+    client = MagicMock()
+    client.config.transfer_journal = None
+    client.config.idempotency_registry = None
+    return client
 
 
 @pytest.fixture
@@ -150,7 +153,7 @@ def test_request_create_pix_payment_with_beneficiary(api_client, mock_sdk):
 def test_request_pix_payment_status(api_client):
     api_client.get.return_value = confirm_response
     result = get_transfer(api_client, "2175814018608")
-    api_client.get.assert_called_with(f"{PIX_ENDPOINT}/2175814018608")
+    api_client.get.assert_called_with(f"{PIX_ENDPOINT}/2175814018608", deadline=None)
     assert result == confirm_response
 
 
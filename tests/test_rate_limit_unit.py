@@ -0,0 +1,148 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import endpoint_family
+from santander_sdk.api_client.exceptions import (
+    SantanderRateLimitError,
+    SantanderRequestError,
+)
+from santander_sdk.api_client.rate_limit import RateLimiter, TokenBucket
+from santander_sdk.api_client.workspaces import WORKSPACES_ENDPOINT
+from santander_sdk.payment_receipts import RECEIPTS_ENDPOINT
+from santander_sdk.pix import PIX_ENDPOINT
+from tests.mock.santander_mocker import (
+    PIX_ENDPOINT_WITH_WORKSPACE,
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+)
+
+
+def response_with(status: int = 200, headers: dict | None = None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.mark.parametrize(
+    "endpoint,family",
+    [
+        (PIX_ENDPOINT, "pix"),
+        (f"{PIX_ENDPOINT_WITH_WORKSPACE}/123", "pix"),
+        (f"{RECEIPTS_ENDPOINT}/123/file_requests", "payment_receipts"),
+        (WORKSPACES_ENDPOINT, "workspaces"),
+        ("/auth/oauth/v2/token", "auth"),
+        ("/orders", "other"),
+    ],
+)
+def test_endpoint_family(endpoint, family):
+    assert endpoint_family(endpoint) == family
+
+
+def test_bucket_fail_fast_when_empty():
+    bucket = TokenBucket(rate=1, capacity=2)
+
+    assert bucket.acquire(block=False) is True
+    assert bucket.acquire(block=False) is True
+    assert bucket.acquire(block=False) is False
+
+
+def test_bucket_timeout_shorter_than_wait():
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.acquire()
+
+    assert bucket.acquire(timeout=0.1) is False
+
+
+def test_bucket_is_shared_by_threads():
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    start = monotonic()
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(lambda _: bucket.acquire(), range(21)))
+
+    assert all(results)
+    assert monotonic() - start >= 0.19
+
+
+def test_rate_limit_headers_limit_remaining_tokens():
+    limiter = RateLimiter({"pix": TokenBucket(rate=1, capacity=10)}, block=False)
+
+    limiter.update_from_response(
+        "pix", response_with(headers={"X-RateLimit-Remaining": "1"})
+    )
+
+    limiter.acquire("pix")
+    with pytest.raises(SantanderRateLimitError):
+        limiter.acquire("pix")
+
+
+def test_exhausted_rate_limit_pauses_until_reset():
+    bucket = TokenBucket(rate=100, capacity=10)
+    limiter = RateLimiter({"pix": bucket}, block=False)
+
+    limiter.update_from_response(
+        "pix",
+        response_with(headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "30"}),
+    )
+
+    with pytest.raises(SantanderRateLimitError):
+        limiter.acquire("pix")
+    assert bucket._paused_until - monotonic() > 29
+
+
+def test_too_many_requests_pauses_for_retry_after():
+    bucket = TokenBucket(rate=100, capacity=10)
+    limiter = RateLimiter({"payment_receipts": bucket}, block=True, max_wait=1)
+
+    limiter.update_from_response(
+        "payment_receipts", response_with(429, {"Retry-After": "5"})
+    )
+
+    with pytest.raises(SantanderRateLimitError):
+        limiter.acquire("payment_receipts")
+
+
+def test_family_without_limit_is_not_throttled():
+    limiter = RateLimiter({"pix": 1}, block=False)
+
+    for _ in range(100):
+        limiter.acquire("workspaces")
+
+
+def test_client_fails_fast_without_sending(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    responses.get(f"{PIX_ENDPOINT_WITH_WORKSPACE}/1", json={"id": "1"})
+    limiter = RateLimiter({"pix": TokenBucket(rate=1, capacity=1), "auth": 1})
+    limiter.block = False
+    client = SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            cert="test_cert",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            rate_limiter=limiter,
+        )
+    )
+
+    with patch.object(limiter, "acquire", wraps=limiter.acquire) as acquire:
+        assert client.get(f"{PIX_ENDPOINT}/1") == {"id": "1"}
+        with pytest.raises(SantanderRateLimitError) as exc:
+            client.get(f"{PIX_ENDPOINT}/1")
+
+    assert isinstance(exc.value, SantanderRequestError)
+    assert exc.value.status_code == 429
+    assert [call.args[0] for call in acquire.call_args_list] == ["pix", "auth", "pix"]
+    assert len(responses.calls) == 2
@@ -82,7 +82,7 @@ def test_payment_list(sdk_with_payments_result):
     assert len(payments) == 1
     assert payments[0]["payment"]["paymentId"] == "VXB123456789ABCFEF"
     sdk_with_payments_result.get.assert_called_once_with(
-        "/consult_payment_receipts/v1/payment_receipts", params=params
+        "/consult_payment_receipts/v1/payment_receipts", params=params, deadline=None
     )
 
 
@@ -227,5 +227,5 @@ def test_create_receipt_already_requested(mock_handle_already_created, mock_clie
     payment_id = "VXB123456789ABCFEF"
     create_receipt(client_instance, payment_id)
     mock_handle_already_created.assert_called_once_with(
-        client_instance, payment_id, expected_exception
+        client_instance, payment_id, expected_exception, None
     )
@@ -0,0 +1,132 @@
+import logging
+import re
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import RECEIPTS_ENDPOINT
+from santander_sdk.api_client.exceptions import SantanderRequestError
+from santander_sdk.api_client.helpers import (
+    is_log_sampled,
+    response_body_for_log,
+    truncate_body_for_log,
+)
+from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
+
+RECEIPTS_URL = f"{SANTANDER_URL}{RECEIPTS_ENDPOINT}"
+PAGE = {
+    "paymentsReceipts": [{"payment": {"paymentId": str(i)}} for i in range(1000)],
+    "links": {},
+}
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("tests.santander_requests")
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+@pytest.fixture
+def new_client(responses, logger):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+
+    def _new_client(**kwargs):
+        return SantanderApiClient(
+            SantanderClientConfiguration(
+                client_id="buser",
+                client_secret="secret",
+                cert="/var/certs/cert.pem",
+                base_url=SANTANDER_URL,
+                workspace_id=TEST_WORKSPACE_ID,
+                logger=logger,
+                **kwargs,
+            )
+        )
+
+    return _new_client
+
+
+def test_truncate_body_for_log():
+    assert truncate_body_for_log(None, 10) is None
+    assert truncate_body_for_log({"a": 1}, 10) == {"a": 1}
+    assert truncate_body_for_log({"a": "x" * 20}, 10) == '{"a": "xxx... (29 chars)'
+
+
+def test_response_body_for_log():
+    response = requests.Response()
+    response._content = b'{"items": [1, 2, 3]}'
+    assert response_body_for_log(response, 100) == {"items": [1, 2, 3]}
+    assert response_body_for_log(response, 100, {"parsed": True}) == {"parsed": True}
+    assert response_body_for_log(response, 5) == '{"ite... (20 bytes)'
+    response._content = b"<html>"
+    assert response_body_for_log(response, 100) is None
+
+
+def test_is_log_sampled():
+    assert is_log_sampled({}, RECEIPTS_ENDPOINT)
+    assert not is_log_sampled({"payment_receipts": 0}, RECEIPTS_ENDPOINT)
+    assert is_log_sampled({"payment_receipts": 0}, "/other")
+    with patch("santander_sdk.api_client.helpers.random.random", return_value=0.3):
+        assert is_log_sampled({"payment_receipts": 0.5}, RECEIPTS_ENDPOINT)
+        assert not is_log_sampled({"payment_receipts": 0.2}, RECEIPTS_ENDPOINT)
+
+
+def test_large_page_is_parsed_once(new_client, responses, caplog):
+    responses.add(responses.GET, RECEIPTS_URL, json=PAGE)
+    client = new_client(log_request_response_level="ALL", log_body_max_size=100)
+
+    codec = client.config.json_codec
+    with patch.object(codec, "loads", wraps=codec.loads) as mock_loads:
+        with caplog.at_level(logging.INFO, logger=client.logger.name):
+            assert client.get(RECEIPTS_ENDPOINT) == PAGE
+
+    mock_loads.assert_called_once()
+    (record,) = [r for r in caplog.records if r.msg == "API request successful"]
+    assert record.response_body.endswith(" bytes)")
+    assert len(record.response_body) < 150
+
+
+def test_no_summary_when_level_is_none(new_client, responses):
+    responses.add(responses.GET, RECEIPTS_URL, status=500, json={"error": "boom"})
+    client = new_client(log_request_response_level="NONE")
+    with patch(
+        "santander_sdk.api_client.request_logging.request_summary"
+    ) as mock_summary:
+        with pytest.raises(SantanderRequestError):
+            client.get(RECEIPTS_ENDPOINT)
+        responses.replace(responses.GET, RECEIPTS_URL, json={})
+        client.get(RECEIPTS_ENDPOINT)
+    mock_summary.assert_not_called()
+
+
+def test_no_summary_when_logger_does_not_want_it(new_client, responses, logger):
+    responses.add(responses.GET, RECEIPTS_URL, json={})
+    client = new_client(log_request_response_level="ALL")
+    logger.setLevel(logging.WARNING)
+    with patch(
+        "santander_sdk.api_client.request_logging.request_summary"
+    ) as mock_summary:
+        client.get(RECEIPTS_ENDPOINT)
+    mock_summary.assert_not_called()
+
+
+def test_sampling_applies_to_successes_only(new_client, responses, caplog):
+    responses.add(responses.GET, RECEIPTS_URL, json={})
+    client = new_client(
+        log_request_response_level="ALL", log_sample_rates={"payment_receipts": 0}
+    )
+    with caplog.at_level(logging.INFO, logger=client.logger.name):
+        client.get(RECEIPTS_ENDPOINT)
+        responses.replace(responses.GET, RECEIPTS_URL, status=503, json={})
+        with pytest.raises(SantanderRequestError):
+            client.get(RECEIPTS_ENDPOINT)
+
+    assert [r.msg for r in caplog.records] == ["API request failed"]
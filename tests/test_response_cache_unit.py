@@ -0,0 +1,158 @@
+import re
+
+import pytest
+from freezegun import freeze_time
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import PIX_ENDPOINT, RECEIPTS_ENDPOINT
+from santander_sdk.api_client.response_cache import CacheRule, ResponseCache
+from santander_sdk.payment_receipts import payment_list, receipt_creation_history
+from santander_sdk.pix import get_transfer
+from santander_sdk.types import OrderStatus
+from tests.mock.santander_mocker import (
+    PIX_ENDPOINT_WITH_WORKSPACE,
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+)
+
+PAYMENT_URL = f"{PIX_ENDPOINT_WITH_WORKSPACE}/PIX1"
+HISTORY_URL = f"{SANTANDER_URL}{RECEIPTS_ENDPOINT}/P1/file_requests"
+
+
+@pytest.fixture
+def client(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    return SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="/var/certs/cert.pem",
+            base_url=SANTANDER_URL,
+            workspace_id=TEST_WORKSPACE_ID,
+            response_cache=ResponseCache(max_entries=2),
+        )
+    )
+
+
+def calls_to(responses, url: str) -> int:
+    return sum(call.request.url == url for call in responses.calls)
+
+
+def test_terminal_payment_is_cached_forever(client, responses):
+    responses.add(responses.GET, PAYMENT_URL, json={"status": OrderStatus.PAYED})
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        for _ in range(3):
+            assert get_transfer(client, "PIX1")["status"] == OrderStatus.PAYED
+            frozen.tick(86400)
+
+    assert calls_to(responses, PAYMENT_URL) == 1
+    assert client.response_cache_stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "size": 1,
+    }
+
+
+def test_in_flight_payment_expires_quickly(client, responses):
+    responses.add(
+        responses.GET, PAYMENT_URL, json={"status": OrderStatus.PENDING_VALIDATION}
+    )
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        get_transfer(client, "PIX1")
+        get_transfer(client, "PIX1")
+        assert calls_to(responses, PAYMENT_URL) == 1
+        frozen.tick(1.5)
+        get_transfer(client, "PIX1")
+
+    assert calls_to(responses, PAYMENT_URL) == 2
+
+
+def test_hits_are_copies(client, responses):
+    responses.add(responses.GET, PAYMENT_URL, json={"status": OrderStatus.PAYED})
+    get_transfer(client, "PIX1")["status"] = "changed"
+    assert get_transfer(client, "PIX1")["status"] == OrderStatus.PAYED
+
+
+def test_listing_is_not_cached(client, responses):
+    responses.add(
+        responses.GET,
+        f"{SANTANDER_URL}{RECEIPTS_ENDPOINT}",
+        json={"paymentsReceipts": [], "links": {}},
+    )
+    payment_list(client, {})
+    payment_list(client, {})
+    assert len(responses.calls) == 3
+    assert client.response_cache_stats()["misses"] == 0
+
+
+def test_lru_eviction(client, responses):
+    for pix_id in ("A", "B", "C"):
+        responses.add(
+            responses.GET,
+            f"{PIX_ENDPOINT_WITH_WORKSPACE}/{pix_id}",
+            json={"status": OrderStatus.PAYED},
+        )
+    get_transfer(client, "A")
+    get_transfer(client, "B")
+    get_transfer(client, "A")
+    get_transfer(client, "C")
+    get_transfer(client, "A")
+    get_transfer(client, "B")
+
+    stats = client.response_cache_stats()
+    assert stats["evictions"] == 2
+    assert stats["size"] == 2
+    assert calls_to(responses, f"{PIX_ENDPOINT_WITH_WORKSPACE}/B") == 2
+
+
+def test_writes_and_explicit_invalidation(client, responses):
+    responses.add(responses.GET, HISTORY_URL, json={"paymentReceiptsFileRequests": []})
+    responses.add(responses.POST, HISTORY_URL, json={})
+    responses.add(responses.GET, PAYMENT_URL, json={"status": OrderStatus.PAYED})
+
+    receipt_creation_history(client, "P1")
+    receipt_creation_history(client, "P1")
+    client.post(f"{RECEIPTS_ENDPOINT}/P1/file_requests", None)
+    receipt_creation_history(client, "P1")
+    assert calls_to(responses, HISTORY_URL) == 3  # 2 GETs + 1 POST
+
+    get_transfer(client, "PIX1")
+    client.invalidate_cache(f"{PIX_ENDPOINT}/PIX1")
+    get_transfer(client, "PIX1")
+    client.invalidate_cache()
+    assert client.response_cache_stats()["size"] == 0
+    assert calls_to(responses, PAYMENT_URL) == 2
+
+
+def test_writes_keep_the_other_resources_cached(client, responses):
+    responses.add(responses.GET, PAYMENT_URL, json={"status": OrderStatus.PAYED})
+    responses.add(responses.POST, PIX_ENDPOINT_WITH_WORKSPACE, json={})
+
+    get_transfer(client, "PIX1")
+    client.post(PIX_ENDPOINT, {"id": "PIX2"})
+    get_transfer(client, "PIX1")
+    assert calls_to(responses, PAYMENT_URL) == 1
+
+
+def test_errors_are_not_cached(client, responses):
+    responses.add(responses.GET, PAYMENT_URL, status=503)
+    for _ in range(2):
+        with pytest.raises(Exception):
+            get_transfer(client, "PIX1")
+    assert calls_to(responses, PAYMENT_URL) == 2
+
+
+def test_custom_rules():
+    cache = ResponseCache(rules=(CacheRule(r"/orders/\d+$", ttl=0),))
+    assert cache.rule_for("https://api/orders/1") is not None
+    assert cache.rule_for("https://api/orders") is None
+    key = cache.key("https://api/orders/1", {"b": "2", "a": "1"})
+    assert key == ("https://api/orders/1", (("a", "1"), ("b", "2")))
+    cache.set(key, {"id": 1})
+    assert cache.get(key) is None
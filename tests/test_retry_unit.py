@@ -0,0 +1,173 @@
+import re
+from unittest.mock import patch
+
+import pytest
+import requests
+from freezegun import freeze_time
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.exceptions import SantanderRequestError
+from santander_sdk.api_client.retry import RetryBudget, RetryPolicy, parse_retry_after
+from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
+
+ORDERS_URL = f"{SANTANDER_URL}/orders"
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("santander_sdk.api_client.client.sleep") as mock:
+        yield mock
+
+
+@pytest.fixture
+def client(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "test_access_token", "expires_in": 3600},
+    )
+    config = SantanderClientConfiguration(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        cert="test_cert",
+        base_url=SANTANDER_URL,
+        workspace_id=TEST_WORKSPACE_ID,
+        retry_policy=RetryPolicy(max_attempts=3),
+    )
+    return SantanderApiClient(config)
+
+
+@pytest.mark.parametrize(
+    "method,data,expected",
+    [
+        ("GET", None, True),
+        ("POST", {"id": "abc", "paymentValue": "1.00"}, True),
+        ("POST", {"paymentValue": "1.00"}, False),
+        ("POST", None, False),
+        ("PATCH", {"id": "abc", "status": "AUTHORIZED"}, False),
+        ("DELETE", None, False),
+    ],
+)
+def test_is_safe_call(method, data, expected):
+    assert RetryPolicy().is_safe_call(method, data) is expected
+
+
+@pytest.mark.parametrize("attempt,ceiling", [(1, 0.5), (2, 1), (3, 2), (10, 30)])
+def test_backoff_is_exponential_with_full_jitter(attempt, ceiling):
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=30)
+
+    with patch("santander_sdk.api_client.retry.random.uniform") as uniform:
+        policy.backoff(attempt)
+
+    uniform.assert_called_once_with(0, ceiling)
+
+
+@freeze_time("2025-02-13 10:00:00")
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, None),
+        ("", None),
+        ("3", 3),
+        ("-1", 0),
+        ("Thu, 13 Feb 2025 10:00:05 GMT", 5),
+        ("Thu, 13 Feb 2025 09:00:00 GMT", 0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_retry_budget_caps_retries():
+    budget = RetryBudget(ratio=0.5, min_retries=1, max_retries=2)
+
+    assert budget.try_withdraw() is True
+    assert budget.try_withdraw() is False
+    budget.record_request()
+    assert budget.try_withdraw() is False
+    budget.record_request()
+    assert budget.try_withdraw() is True
+    for _ in range(10):
+        budget.record_request()
+    assert budget.tokens == 2
+
+
+def test_get_retried_on_server_unavailable(client, responses, mock_sleep):
+    responses.get(ORDERS_URL, status=503)
+    responses.get(ORDERS_URL, json={"ok": True})
+
+    assert client.get("/orders") == {"ok": True}
+    mock_sleep.assert_called_once()
+
+
+def test_retry_after_is_honoured(client, responses, mock_sleep):
+    responses.get(ORDERS_URL, status=429, headers={"Retry-After": "2"})
+    responses.get(ORDERS_URL, json={"ok": True})
+
+    assert client.get("/orders") == {"ok": True}
+    mock_sleep.assert_called_once_with(2)
+
+
+def test_long_retry_after_fails_fast(client, responses, mock_sleep):
+    responses.get(ORDERS_URL, status=429, headers={"Retry-After": "3600"})
+
+    with pytest.raises(SantanderRequestError) as exc:
+        client.get("/orders")
+
+    assert exc.value.status_code == 429
+    mock_sleep.assert_not_called()
+
+
+def test_gives_up_after_max_attempts(client, responses, mock_sleep):
+    responses.get(ORDERS_URL, status=503)
+
+    with pytest.raises(SantanderRequestError) as exc:
+        client.get("/orders")
+
+    assert exc.value.status_code == 503
+    assert mock_sleep.call_count == 2
+    assert len([c for c in responses.calls if c.request.url == ORDERS_URL]) == 3
+
+
+def test_connection_error_retried(client, responses, mock_sleep):
+    responses.get(ORDERS_URL, body=requests.exceptions.ConnectionError("reset"))
+    responses.get(ORDERS_URL, json={"ok": True})
+
+    assert client.get("/orders") == {"ok": True}
+
+
+def test_post_without_id_is_not_retried(client, responses, mock_sleep):
+    responses.post(ORDERS_URL, status=503)
+
+    with pytest.raises(SantanderRequestError):
+        client.post("/orders", data={"paymentValue": "1.00"})
+
+    mock_sleep.assert_not_called()
+
+
+def test_post_with_id_is_retried(client, responses, mock_sleep):
+    responses.post(ORDERS_URL, status=502)
+    responses.post(ORDERS_URL, json={"id": "abc"})
+
+    assert client.post("/orders", data={"id": "abc"}) == {"id": "abc"}
+
+
+def test_client_error_is_not_retried(client, responses, mock_sleep):
+    responses.get(ORDERS_URL, status=400, json={"error": "Bad Request"})
+
+    with pytest.raises(SantanderRequestError):
+        client.get("/orders")
+
+    mock_sleep.assert_not_called()
+
+
+def test_exhausted_budget_stops_retries(client, responses, mock_sleep):
+    client.config.retry_policy.budget = RetryBudget(ratio=0, min_retries=0)
+    responses.get(ORDERS_URL, status=503)
+
+    with pytest.raises(SantanderRequestError):
+        client.get("/orders")
+
+    mock_sleep.assert_not_called()
@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from requests import Request
 
-from santander_sdk.api_client.base import BaseURLSession
+from santander_sdk.api_client.base import BaseURLSession, SantanderHTTPAdapter
+from tests.mock.fake_server import fake_santander_server
 
 
 def test_base_url_session_prepare_request():
@@ -10,3 +14,48 @@ def test_base_url_session_prepare_request():
     req = session.prepare_request(req)
 
     assert req.url == "https://api.santander.com.br/orders"
+
+
+@pytest.mark.usefixtures("real_http")
+def test_adapter_pool_stats_reuse_connection():
+    session = BaseURLSession("")
+    adapter = SantanderHTTPAdapter(pool_maxsize=2)
+    session.mount("http://", adapter)
+
+    with fake_santander_server() as server:
+        for _ in range(3):
+            session.get(f"{server.url}/orders").raise_for_status()
+
+        assert adapter.pool_stats() == {
+            "in_use": 0,
+            "idle": 1,
+            "created": 1,
+            "discarded": 0,
+        }
+
+
+@pytest.mark.usefixtures("real_http")
+def test_adapter_pool_stats_discard_when_full():
+    session = BaseURLSession("")
+    adapter = SantanderHTTPAdapter(pool_maxsize=1)
+    session.mount("http://", adapter)
+
+    with fake_santander_server(delay=0.1) as server:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: session.get(f"{server.url}/orders"), range(3)))
+
+        stats = adapter.pool_stats()
+
+    assert stats["created"] == 3
+    assert stats["discarded"] == 2
+    assert stats["idle"] == 1
+    assert stats["in_use"] == 0
+
+
+def test_adapter_without_keep_alive_closes_connections():
+    adapter = SantanderHTTPAdapter(keep_alive=False)
+    req = Request("GET", "https://api.santander.com.br/orders").prepare()
+
+    adapter.add_headers(req)
+
+    assert req.headers["Connection"] == "close"
@@ -0,0 +1,238 @@
+import asyncio
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.deadline import Deadline
+from santander_sdk.api_client.exceptions import (
+    SantanderDeadlineExceededError,
+    SantanderRequestError,
+)
+from santander_sdk.api_client.single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    request_key,
+)
+from santander_sdk.pix import get_transfer
+from tests.mock.santander_mocker import (
+    PIX_ENDPOINT_WITH_WORKSPACE,
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+)
+
+
+def run_concurrently(fn, count: int) -> list:
+    with ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(fn) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+def slow(result, started: threading.Event | None = None, delay: float = 0.1):
+    def fn():
+        if started is not None:
+            started.set()
+        sleep(delay)
+        return result
+
+    return MagicMock(side_effect=fn)
+
+
+def test_request_key():
+    assert request_key("GET", "/a", {"b": 1, "a": 2}) == (
+        "GET",
+        "/a",
+        (("a", 2), ("b", 1)),
+    )
+    assert request_key("GET", "/a", None) == request_key("GET", "/a", {})
+
+
+def test_single_flight_runs_one_call_per_key():
+    flight = SingleFlight()
+    fn = slow({"status": "PAYED"})
+
+    results = run_concurrently(lambda: flight.do("key", fn), 10)
+
+    assert fn.call_count == 1
+    assert results == [{"status": "PAYED"}] * 10
+    assert len({id(result) for result in results}) == 10
+    assert flight.coalesced == 9
+    assert flight.in_flight() == 0
+    flight.do("key", fn)
+    assert fn.call_count == 2
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        sleep(0.1)
+        raise SantanderRequestError("Not successful code", 503, None)
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.do, "key", failing)
+        started.wait()
+        follower = executor.submit(flight.do, "key", MagicMock())
+        for future in (leader, follower):
+            with pytest.raises(SantanderRequestError):
+                future.result()
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_reruns_on_leader_only_errors():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def leader_deadline():
+        started.set()
+        sleep(0.1)
+        raise SantanderDeadlineExceededError("0.1s budget spent")
+
+    rerun_on = (SantanderDeadlineExceededError,)
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.do, "key", leader_deadline, None, rerun_on)
+        started.wait()
+        follower = executor.submit(
+            flight.do, "key", MagicMock(return_value={"id": "1"}), None, rerun_on
+        )
+        with pytest.raises(SantanderDeadlineExceededError):
+            leader.result()
+        assert follower.result() == {"id": "1"}
+
+
+def test_single_flight_wait_timeout():
+    flight = SingleFlight()
+    started = threading.Event()
+    with ThreadPoolExecutor(1) as executor:
+        executor.submit(flight.do, "key", slow({}, started, delay=0.3))
+        started.wait()
+        with pytest.raises(TimeoutError):
+            flight.do("key", MagicMock(), timeout=0.01)
+
+
+def test_async_single_flight_survives_leader_cancellation():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"calls": len(calls)}
+
+    async def run():
+        leader = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == {"calls": 2}
+    assert flight.in_flight() == 0
+
+
+@pytest.fixture
+def new_client():
+    def _new_client(**kwargs):
+        return SantanderApiClient(
+            SantanderClientConfiguration(
+                client_id="buser",
+                client_secret="secret",
+                cert="/var/certs/cert.pem",
+                base_url=SANTANDER_URL,
+                workspace_id=TEST_WORKSPACE_ID,
+                **kwargs,
+            )
+        )
+
+    return _new_client
+
+
+def test_concurrent_status_polls_share_one_request(new_client, responses):
+    url = f"{PIX_ENDPOINT_WITH_WORKSPACE}/PIX1"
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(responses.GET, url, json={"id": "PIX1", "status": "PENDING"})
+    client = new_client()
+    send = client._send
+
+    def slow_send(*args):
+        sleep(0.1)
+        return send(*args)
+
+    with patch.object(client, "_send", side_effect=slow_send):
+        results = run_concurrently(lambda: get_transfer(client, "PIX1"), 8)
+
+    assert results == [{"id": "PIX1", "status": "PENDING"}] * 8
+    assert sum(call.request.url == url for call in responses.calls) == 1
+    assert client.single_flight.coalesced == 7
+
+
+def test_coalescing_can_be_disabled(new_client):
+    client = new_client(coalesce_gets=False)
+    assert client.single_flight is None
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.return_value.content = b"{}"
+        run_concurrently(lambda: client.get("/orders"), 3)
+    assert mock_request.call_count == 3
+
+
+def test_waiters_respect_their_deadline(new_client):
+    client = new_client()
+    started = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        started.set()
+        sleep(0.3)
+        return MagicMock(content=b"{}")
+
+    with patch.object(client.session, "request", side_effect=slow_request):
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(client.get, "/orders")
+            started.wait()
+            with pytest.raises(SantanderDeadlineExceededError):
+                client.get("/orders", deadline=Deadline(0.05))
+
+
+def test_waiters_dont_fail_on_the_leader_deadline(new_client):
+    client = new_client()
+    started = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        if not started.is_set():
+            started.set()
+            sleep(0.2)
+            raise requests.exceptions.ReadTimeout()
+        return MagicMock(content=b'{"id": "1"}', status_code=200)
+
+    with patch.object(client.session, "request", side_effect=slow_request):
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(client.get, "/orders", deadline=Deadline(0.1))
+            started.wait()
+            assert client.get("/orders") == {"id": "1"}
+            with pytest.raises(SantanderDeadlineExceededError):
+                leader.result()
+
+
+def test_calls_with_other_timeouts_are_not_coalesced(new_client):
+    client = new_client()
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.side_effect = lambda *args, **kwargs: (
+            sleep(0.05) or MagicMock(content=b"{}", status_code=200)
+        )
+        with ThreadPoolExecutor(2) as executor:
+            first = executor.submit(client.get, "/orders", timeout=1)
+            second = executor.submit(client.get, "/orders", timeout=30)
+            first.result(), second.result()
+    assert mock_request.call_count == 2
@@ -0,0 +1,145 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import PIX_ENDPOINT, TOKEN_ENDPOINT
+from santander_sdk.api_client.exceptions import SantanderRequestError
+from santander_sdk.api_client.timing import (
+    PHASES,
+    RequestTiming,
+    current_timing,
+    measure_phase,
+    timing_scope,
+)
+from tests.mock.fake_server import fake_santander_server
+from tests.mock.santander_mocker import (
+    PIX_ENDPOINT_WITH_WORKSPACE,
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+)
+
+
+def new_client(base_url: str = SANTANDER_URL, **kwargs) -> SantanderApiClient:
+    return SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="/var/certs/cert.pem",
+            base_url=base_url,
+            workspace_id=TEST_WORKSPACE_ID,
+            **kwargs,
+        )
+    )
+
+
+def test_timing_scope_collects_phases(caplog):
+    timings = []
+
+    def failing_hook(timing):
+        raise RuntimeError("APM down")
+
+    timing = RequestTiming("request", "GET", "/orders/1", "/orders/{id}")
+    with timing_scope(
+        timing, [timings.append, failing_hook], logging.getLogger(__name__)
+    ):
+        assert current_timing() is timing
+        with measure_phase("parse"):
+            pass
+    with measure_phase("parse"):
+        assert current_timing() is None
+
+    assert timings == [timing]
+    assert timing.total >= timing.phases["parse"] > 0
+    assert set(timing.as_dict()) >= set(PHASES) | {"template", "status_code"}
+    assert "Timing hook" in caplog.text
+
+
+def test_timing_scope_records_errors():
+    timings = []
+    timing = RequestTiming("request", "GET", "/orders", "/orders")
+    with pytest.raises(ValueError):
+        with timing_scope(timing, [timings.append], logging.getLogger(__name__)):
+            raise ValueError("boom")
+    assert timings[0].error == "ValueError"
+
+
+def test_request_and_token_timings(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(
+        responses.GET, f"{PIX_ENDPOINT_WITH_WORKSPACE}/PIX1", json={"id": "PIX1"}
+    )
+    responses.add(
+        responses.GET, f"{PIX_ENDPOINT_WITH_WORKSPACE}/PIX2", status=404, json={}
+    )
+    timings: list[RequestTiming] = []
+    client = new_client(timing_hooks=[timings.append])
+
+    client.get(f"{PIX_ENDPOINT}/PIX1")
+    with pytest.raises(SantanderRequestError):
+        client.get(f"{PIX_ENDPOINT}/PIX2")
+
+    token, success, failure = timings
+    assert token.kind == "token"
+    assert token.template == TOKEN_ENDPOINT
+    assert token.status_code == 200
+    assert token.request_bytes > 0
+
+    assert success.kind == "request"
+    assert success.template == f"{PIX_ENDPOINT}/{{id}}"
+    assert success.status_code == 200
+    assert success.response_bytes == len(b'{"id": "PIX1"}')
+    assert success.attempts == 1
+    assert success.error is None
+    assert success.phases["token"] >= token.total
+    assert success.total >= sum(success.phases.values())
+
+    assert failure.status_code == 404
+    assert failure.error == "SantanderRequestError"
+    assert failure.phases["token"] < token.total
+
+
+def test_no_timing_without_hooks(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(responses.GET, f"{SANTANDER_URL}/orders", json={})
+    client = new_client()
+    client.get("/orders")
+    assert client.config.timing_hooks == []
+    assert current_timing() is None
+
+
+@pytest.mark.usefixtures("real_http")
+def test_pool_wait_is_attributed_to_each_call():
+    timings: list[RequestTiming] = []
+    with fake_santander_server(delay=0.1) as server:
+        client = new_client(
+            server.url,
+            timing_hooks=[timings.append],
+            pool_maxsize=1,
+            pool_block=True,
+        )
+        client.session.cert = None  # Plain HTTP fake server.
+        client.get("/orders")  # Token and connection ready.
+        timings.clear()
+        with ThreadPoolExecutor(3) as executor:
+            list(executor.map(client.get, ["/a", "/b", "/c"]))
+
+    assert len(timings) == 3
+    waits = sorted(timing.phases["pool_wait"] for timing in timings)
+    assert waits[0] < 0.05
+    assert waits[-1] > 0.15
+    for timing in timings:
+        assert timing.phases["server"] >= 0.1
+        assert timing.phases["token"] < 0.05
+        assert timing.response_bytes > 0
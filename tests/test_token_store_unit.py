@@ -0,0 +1,131 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from re import compile as regex
+from time import sleep
+
+import pytest
+from freezegun import freeze_time
+
+from santander_sdk.api_client.auth import SantanderAuth
+from santander_sdk.api_client.token_store import (
+    FileTokenStore,
+    MemoryTokenStore,
+    TokenStore,
+)
+
+
+def new_auth(token_store):
+    return SantanderAuth(
+        "https://api.santander.com.br",
+        client_id="123",
+        client_secret="secret",
+        cert_path="/var/certs/cert.pem",
+        token_store=token_store,
+    )
+
+
+@pytest.fixture
+def token_endpoint(responses):
+    def token_callback(request):
+        sleep(0.02)
+        return 200, {}, json.dumps({"access_token": "SHARED_TOKEN", "expires_in": 900})
+
+    responses.add_callback(
+        responses.POST, regex(".+/auth/oauth/v2/token"), callback=token_callback
+    )
+    return responses
+
+
+def test_token_store_requires_every_method():
+    class NoLockStore(TokenStore):
+        def get(self, key):
+            return None
+
+        def set(self, key, token, expires_at):
+            pass
+
+    with pytest.raises(TypeError, match="lock"):
+        NoLockStore()
+
+
+def test_file_token_store_roundtrip(tmp_path):
+    store = FileTokenStore(tmp_path / "tokens")
+    expires_at = datetime(2025, 2, 13, 10, 15)
+
+    assert store.get("key") is None
+    store.set("key", "TOKEN", expires_at)
+
+    assert store.get("key") == ("TOKEN", expires_at)
+    assert FileTokenStore(tmp_path / "tokens").get("key") == ("TOKEN", expires_at)
+    assert store.get("other") is None
+    (token_file,) = (tmp_path / "tokens").glob("*.json")
+    assert token_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_file_token_store_ignores_corrupted_file(tmp_path):
+    store = FileTokenStore(tmp_path)
+    store.set("key", "TOKEN", datetime(2025, 2, 13, 10, 15))
+    (token_file,) = tmp_path.glob("*.json")
+    token_file.write_text("{not json")
+
+    assert store.get("key") is None
+
+
+def test_processes_sharing_file_store_fetch_one_token(token_endpoint, tmp_path):
+    # One FileTokenStore per auth, as each process would open its own.
+    auths = [new_auth(FileTokenStore(tmp_path)) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda auth: auth.token, auths))
+
+    assert tokens == ["SHARED_TOKEN"] * 8
+    assert len(token_endpoint.calls) == 1
+
+
+def test_clients_sharing_memory_store_fetch_one_token(token_endpoint):
+    store = MemoryTokenStore()
+    auths = [new_auth(store) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda auth: auth.token, auths))
+
+    assert tokens == ["SHARED_TOKEN"] * 8
+    assert len(token_endpoint.calls) == 1
+
+
+@freeze_time("2025-02-13 10:00")
+def test_token_from_store_survives_restart(token_endpoint, tmp_path):
+    new_auth(FileTokenStore(tmp_path)).token
+    restarted_auth = new_auth(FileTokenStore(tmp_path))
+
+    assert restarted_auth.token == "SHARED_TOKEN"
+    assert restarted_auth.expires_at == datetime(2025, 2, 13, 10, 15)
+    assert len(token_endpoint.calls) == 1
+
+
+@freeze_time("2025-02-13 10:00")
+def test_expiring_token_in_store_is_renewed(token_endpoint):
+    store = MemoryTokenStore()
+    auth = new_auth(store)
+    store.set(auth.token_store_key, "OLD_TOKEN", datetime(2025, 2, 13, 10, 0, 30))
+
+    assert auth.token == "SHARED_TOKEN"
+    assert store.get(auth.token_store_key) == (
+        "SHARED_TOKEN",
+        datetime.now() + timedelta(seconds=900),
+    )
+    assert len(token_endpoint.calls) == 1
+
+
+@freeze_time("2025-02-13 10:00")
+def test_forced_renew_adopts_newer_token_from_store(responses):
+    store = MemoryTokenStore()
+    auth = new_auth(store)
+    auth.token = "CURRENT_TOKEN", datetime(2025, 2, 13, 10, 5)
+    store.set(auth.token_store_key, "NEWER_TOKEN", datetime(2025, 2, 13, 10, 15))
+
+    auth._renew_once(force=True)
+
+    assert auth.token == "NEWER_TOKEN"
+    assert len(responses.calls) == 0
@@ -15,7 +15,9 @@ PIX_ENDPOINT = "/management_payments_partners/v1/workspaces/:workspaceid/pix_pay
 
 @pytest.fixture
 def api_client():
-    return MagicMock()
+    client = MagicMock()
+    client.config.transfer_journal = None
+    return client
 
 
 @pytest.fixture
@@ -47,7 +49,7 @@ def test_create_payment(payment_flow, api_client):
 
     result = payment_flow.create_payment(data)
     assert result == response
-    api_client.post.assert_called_once_with(PIX_ENDPOINT, data=data)
+    api_client.post.assert_called_once_with(PIX_ENDPOINT, data=data, deadline=None)
 
 
 def test_ensure_ready_to_pay(payment_flow, api_client):
@@ -55,7 +57,7 @@ def test_ensure_ready_to_pay(payment_flow, api_client):
     api_client.get.return_value = {"id": "12345", "status": OrderStatus.READY_TO_PAY}
 
     payment_flow.ensure_ready_to_pay(confirm_data)
-    api_client.get.assert_called_once_with(f"{PIX_ENDPOINT}/12345")
+    api_client.get.assert_called_once_with(f"{PIX_ENDPOINT}/12345", deadline=None)
 
 
 def test_ensure_ready_to_pay_lazy(payment_flow, api_client, lazy_status_update):
@@ -81,7 +83,7 @@ def test_confirm_payment(payment_flow, api_client):
     result = payment_flow.confirm_payment(confirm_data, payment_id)
     assert result == response
     api_client.patch.assert_called_once_with(
-        f"{PIX_ENDPOINT}/{payment_id}", data=confirm_data
+        f"{PIX_ENDPOINT}/{payment_id}", data=confirm_data, deadline=None
     )
 
 
@@ -98,7 +100,9 @@ def test_request_payment_status(payment_flow, api_client):
 
     result = payment_flow._request_payment_status(payment_id)
     assert result == response
-    api_client.get.assert_called_once_with(f"{PIX_ENDPOINT}/{payment_id}")
+    api_client.get.assert_called_once_with(
+        f"{PIX_ENDPOINT}/{payment_id}", deadline=None
+    )
 
 
 def test_request_confirm_payment(payment_flow, api_client):
@@ -110,7 +114,7 @@ def test_request_confirm_payment(payment_flow, api_client):
     result = payment_flow._request_confirm_payment(confirm_data, payment_id)
     assert result == response
     api_client.patch.assert_called_once_with(
-        f"{PIX_ENDPOINT}/{payment_id}", data=confirm_data
+        f"{PIX_ENDPOINT}/{payment_id}", data=confirm_data, deadline=None
     )
 
 
@@ -129,7 +133,7 @@ def test_payment_status_polling(
         payment_id, [OrderStatus.READY_TO_PAY], 10
     )
     assert result.get("status") == OrderStatus.READY_TO_PAY
-    api_client.get.assert_called_with(f"{PIX_ENDPOINT}/{payment_id}")
+    api_client.get.assert_called_with(f"{PIX_ENDPOINT}/{payment_id}", deadline=None)
     assert mock_sleep.call_count == attemps_to_be_ready
 
 
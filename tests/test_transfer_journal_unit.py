@@ -0,0 +1,204 @@
+from decimal import Decimal as D
+from unittest.mock import patch
+
+import pytest
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.endpoints import PIX_ENDPOINT
+from santander_sdk.api_client.exceptions import SantanderClientError
+from santander_sdk.api_client.transfer_journal import (
+    SQLiteTransferJournal,
+    TransferJournal,
+)
+from santander_sdk.pix import (
+    create_pix_payment,
+    resume_incomplete_transfers,
+    resume_transfer_pix,
+    transfer_pix,
+)
+from santander_sdk.transfer_flow import SantanderPaymentFlow
+from tests.mock.fake_server import FakePixApi, fake_santander_server
+from tests.mock.santander_mocker import TEST_WORKSPACE_ID
+
+PIX_ID = "2e1b4a8c-0f0e-4e39-9d7c-7f3b1d2a9c10"
+
+
+def test_transfer_journal_requires_every_method():
+    class WriteOnlyJournal(TransferJournal):
+        def begin(self, id, request):
+            return True
+
+        def record(self, id, step=None, status=None, error=None):
+            pass
+
+    with pytest.raises(TypeError, match="get"):
+        WriteOnlyJournal()
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = SQLiteTransferJournal(tmp_path / "transfers.db")
+    yield journal
+    journal.close()
+
+
+@pytest.fixture
+def fake_pix_api(journal):
+    route = FakePixApi()
+    with (
+        patch("santander_sdk.transfer_flow.UPDATE_STATUS_INTERVAL_TIME", 0.01),
+        fake_santander_server(route) as server,
+    ):
+        client = SantanderApiClient(
+            SantanderClientConfiguration(
+                client_id="buser",
+                client_secret="secret",
+                cert="",
+                base_url=server.url,
+                workspace_id=TEST_WORKSPACE_ID,
+                transfer_journal=journal,
+            )
+        )
+        yield client, server, route
+        client.close()
+
+
+def pix_methods(server):
+    return [method for method, path in server.requests if "pix" in path]
+
+
+def test_sqlite_journal_roundtrip(journal):
+    request = {"id": PIX_ID, "paymentValue": "10.00"}
+
+    assert journal.get(PIX_ID) is None
+    assert journal.begin(PIX_ID, request)
+    assert not journal.begin(PIX_ID, {"id": PIX_ID, "paymentValue": "99.00"})
+
+    entry = journal.get(PIX_ID)
+    assert entry is not None
+    assert entry["request"] == request
+    assert entry["step"] == "CREATE"
+    assert entry["status"] is None
+
+    journal.record(PIX_ID, status="READY_TO_PAY", error="Timeout")
+    journal.record(PIX_ID, step="CONFIRM")
+    entry = journal.get(PIX_ID)
+    assert entry is not None
+    assert (entry["step"], entry["status"], entry["error"]) == (
+        "CONFIRM",
+        "READY_TO_PAY",
+        None,
+    )
+    assert [e["id"] for e in journal.incomplete()] == [PIX_ID]
+
+    journal.record(PIX_ID, status="PAYED")
+    assert journal.incomplete() == []
+
+
+def test_sqlite_journal_is_shared_between_connections(journal):
+    journal.begin(PIX_ID, {"id": PIX_ID})
+    other = SQLiteTransferJournal(journal.path)
+    try:
+        assert other.get(PIX_ID) is not None
+    finally:
+        other.close()
+
+
+@pytest.mark.usefixtures("real_http")
+def test_transfer_pix_journals_every_step(fake_pix_api, journal):
+    client, server, route = fake_pix_api
+    result = transfer_pix(client, "12345678909", D("11.00"), "Pay", id=PIX_ID)
+
+    assert result["success"]
+    entry = journal.get(PIX_ID)
+    assert entry is not None
+    assert entry["request"]["paymentValue"] == "11.00"
+    assert (entry["step"], entry["status"]) == ("CONFIRM", "PAYED")
+    assert journal.incomplete() == []
+
+
+@pytest.mark.usefixtures("real_http")
+def test_transfer_pix_generates_the_journal_id(fake_pix_api, journal):
+    client, server, route = fake_pix_api
+    result = transfer_pix(client, "12345678909", D("11.00"), "Pay")
+
+    assert result["success"]
+    assert journal.get(result["request_id"]) is not None
+
+
+@pytest.mark.usefixtures("real_http")
+def test_transfer_pix_again_resumes_instead_of_duplicating(fake_pix_api, journal):
+    client, server, route = fake_pix_api
+    transfer_pix(client, "12345678909", D("11.00"), "Pay", id=PIX_ID)
+    result = transfer_pix(client, "12345678909", D("11.00"), "Pay", id=PIX_ID)
+
+    assert result["success"]
+    assert result["data"]["status"] == "PAYED"
+    assert pix_methods(server).count("POST") == 1
+    assert pix_methods(server).count("PATCH") == 1
+
+
+@pytest.mark.usefixtures("real_http")
+def test_resume_confirms_a_created_payment(fake_pix_api, journal):
+    client, server, route = fake_pix_api
+    flow = SantanderPaymentFlow(client, PIX_ENDPOINT)
+    create_pix_payment(flow, "12345678909", D("11.00"), "Pay", id=PIX_ID)
+    # The worker crashed here, with the payment READY_TO_PAY.
+
+    results = resume_incomplete_transfers(client)
+
+    assert results[PIX_ID]["success"]
+    assert results[PIX_ID]["data"]["status"] == "PAYED"
+    assert pix_methods(server).count("POST") == 1
+    assert pix_methods(server).count("PATCH") == 1
+    assert journal.incomplete() == []
+
+
+@pytest.mark.usefixtures("real_http")
+def test_resume_creates_a_payment_never_sent(fake_pix_api, journal):
+    client, server, route = fake_pix_api
+    journal.begin(PIX_ID, {"id": PIX_ID, "paymentValue": "11.00", "tags": []})
+
+    result = resume_transfer_pix(client, PIX_ID)
+
+    assert result["success"]
+    methods = pix_methods(server)
+    assert methods.index("POST") > methods.index("GET")
+    assert methods.count("POST") == 1
+    assert route.payments[PIX_ID]["status"] == "PAYED"
+
+
+@pytest.mark.usefixtures("real_http")
+def test_resume_only_waits_for_a_confirmed_payment(fake_pix_api, journal):
+    client, server, route = fake_pix_api
+    flow = SantanderPaymentFlow(client, PIX_ENDPOINT)
+    response = create_pix_payment(flow, "12345678909", D("11.00"), "Pay", id=PIX_ID)
+    flow.send_confirmation({"status": "AUTHORIZED"}, response["id"])
+
+    result = resume_transfer_pix(client, PIX_ID)
+
+    assert result["success"]
+    assert result["data"]["status"] == "PAYED"
+    assert pix_methods(server).count("PATCH") == 1
+
+
+@pytest.mark.usefixtures("real_http")
+def test_resume_records_the_error(fake_pix_api, journal):
+    client, server, route = fake_pix_api
+    journal.begin(PIX_ID, {"id": PIX_ID, "paymentValue": "13.00", "tags": []})
+
+    result = resume_transfer_pix(client, PIX_ID)
+
+    assert not result["success"]
+    entry = journal.get(PIX_ID)
+    assert entry is not None
+    assert entry["status"] == "REJECTED"
+    assert "rejected" in (entry["error"] or "")
+    assert journal.incomplete() == []
+
+
+def test_resume_requires_a_journaled_transfer(fake_pix_api):
+    client, server, route = fake_pix_api
+    with pytest.raises(SantanderClientError, match="not found"):
+        resume_transfer_pix(client, PIX_ID)
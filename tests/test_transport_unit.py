@@ -0,0 +1,108 @@
+import gc
+import ssl
+from unittest.mock import patch
+
+import pytest
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.transport import (
+    SharedSSLContextAdapter,
+    TransportRegistry,
+)
+from tests.mock.fake_server import fake_santander_server
+from tests.mock.santander_mocker import SANTANDER_URL, TEST_WORKSPACE_ID
+
+
+@pytest.fixture
+def ssl_context():
+    context = ssl.create_default_context()
+    with patch(
+        "santander_sdk.api_client.transport._client_ssl_context", return_value=context
+    ) as mock_context:
+        yield mock_context
+
+
+def new_client(registry, client_id="buser", base_url=SANTANDER_URL, **kwargs):
+    return SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id=client_id,
+            client_secret="secret",
+            cert="/var/certs/cert.pem",
+            base_url=base_url,
+            workspace_id=TEST_WORKSPACE_ID,
+            transport_registry=registry,
+            **kwargs,
+        )
+    )
+
+
+def test_clients_share_transport_per_base_url_and_cert(ssl_context):
+    registry = TransportRegistry()
+    first = new_client(registry, "tenant-1")
+    second = new_client(registry, "tenant-2")
+    other = new_client(registry, "tenant-3", base_url="https://other.santander.com.br")
+
+    assert first.http_adapter is second.http_adapter
+    assert other.http_adapter is not first.http_adapter
+    assert first.session.auth is not second.session.auth
+    assert len(registry) == 2
+    assert first.transport.clients == 2
+
+    adapter = first.http_adapter
+    assert isinstance(adapter, SharedSSLContextAdapter)
+    assert adapter.poolmanager.connection_pool_kw["ssl_context"] is (
+        ssl_context.return_value
+    )
+    assert first.session.cert is None
+    ssl_context.assert_called_with("/var/certs/cert.pem")
+    assert ssl_context.call_count == 2
+
+
+def test_transport_is_closed_with_its_last_client(ssl_context):
+    registry = TransportRegistry()
+    first = new_client(registry)
+    second = new_client(registry)
+    transport = first.transport
+
+    with patch.object(transport.adapter, "close") as mock_close:
+        first.close()
+        first.close()
+        assert transport.clients == 1
+        mock_close.assert_not_called()
+
+        del second
+        gc.collect()
+        mock_close.assert_called_once()
+    assert len(registry) == 0
+
+    third = new_client(registry)
+    assert third.transport is not transport
+
+
+def test_unreadable_cert_falls_back_to_the_session_cert():
+    registry = TransportRegistry()
+    client = new_client(registry)
+    assert client.http_adapter.ssl_context is None
+    assert client.session.cert == "/var/certs/cert.pem"
+
+
+def test_own_transport_without_registry():
+    client = new_client(None)
+    assert client.transport.clients == 0
+    assert not isinstance(client.http_adapter, SharedSSLContextAdapter)
+    assert client.session.cert == "/var/certs/cert.pem"
+
+
+@pytest.mark.usefixtures("real_http")
+def test_shared_pool_reuses_connections_between_clients():
+    registry = TransportRegistry()
+    with fake_santander_server() as server:
+        clients = [new_client(registry, f"tenant-{i}", server.url) for i in range(5)]
+        for client in clients:
+            client.session.cert = None  # Plain HTTP fake server.
+            client.get("/orders")
+
+        tokens = [r for r in server.requests if r[1].endswith("/token")]
+        assert len(tokens) == 5
+        assert clients[0].pool_stats()["created"] == 1
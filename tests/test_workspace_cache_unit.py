@@ -0,0 +1,170 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from freezegun import freeze_time
+
+from santander_sdk.api_client.client import SantanderApiClient
+from santander_sdk.api_client.client_configuration import SantanderClientConfiguration
+from santander_sdk.api_client.exceptions import SantanderClientError
+from santander_sdk.api_client.workspace_cache import (
+    FileWorkspaceCache,
+    MemoryWorkspaceCache,
+    WorkspaceCache,
+)
+from santander_sdk.api_client.workspaces import WORKSPACES_ENDPOINT
+from tests.mock.santander_mocker import (
+    SANTANDER_URL,
+    TEST_WORKSPACE_ID,
+    workspace_response_mock,
+)
+
+WORKSPACES_URL = f"{SANTANDER_URL}{WORKSPACES_ENDPOINT}"
+ORDERS_ENDPOINT = "/v1/workspaces/:workspaceid/orders"
+ORDERS_URL = f"{SANTANDER_URL}/v1/workspaces/{TEST_WORKSPACE_ID}/orders"
+
+
+def new_client(workspace_cache=None, workspace_id=""):
+    return SantanderApiClient(
+        SantanderClientConfiguration(
+            client_id="buser",
+            client_secret="secret",
+            cert="/var/certs/cert.pem",
+            base_url=SANTANDER_URL,
+            workspace_id=workspace_id,
+            workspace_cache=workspace_cache,
+        )
+    )
+
+
+def workspace_calls(responses) -> int:
+    return sum(call.request.url == WORKSPACES_URL for call in responses.calls)
+
+
+@pytest.fixture
+def api(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(responses.GET, WORKSPACES_URL, json=workspace_response_mock)
+    responses.add(responses.GET, ORDERS_URL, json={"ok": True})
+    return responses
+
+
+def test_workspace_cache_requires_every_method():
+    class NoInvalidateCache(WorkspaceCache):
+        def get(self, key):
+            return None
+
+        def set(self, key, workspace_id):
+            pass
+
+    with pytest.raises(TypeError, match="invalidate"):
+        NoInvalidateCache()
+
+
+def test_memory_cache_expires_after_ttl():
+    cache = MemoryWorkspaceCache(ttl=60)
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        cache.set("key", "workspace")
+        assert cache.get("key") == "workspace"
+        assert cache.get("other") is None
+        frozen.tick(61)
+        assert cache.get("key") is None
+
+
+def test_file_cache_roundtrip_and_expiration(tmp_path):
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        cache = FileWorkspaceCache(tmp_path / "workspaces", ttl=60)
+        assert cache.get("key") is None
+        cache.set("key", "workspace")
+        assert FileWorkspaceCache(tmp_path / "workspaces").get("key") == "workspace"
+        (path,) = (tmp_path / "workspaces").iterdir()
+        assert "key" not in path.name
+        assert os.stat(path).st_mode & 0o777 == 0o600
+        frozen.tick(61)
+        assert cache.get("key") is None
+
+    cache.set("key", "workspace")
+    cache.invalidate("key")
+    assert cache.get("key") is None
+
+
+def test_constructor_makes_no_request(responses):
+    new_client()
+    assert len(responses.calls) == 0
+
+
+def test_workspace_is_discovered_on_first_use(api):
+    client = new_client()
+    for _ in range(3):
+        assert client.get(ORDERS_ENDPOINT) == {"ok": True}
+    assert client.workspace_id == TEST_WORKSPACE_ID
+    assert workspace_calls(api) == 1
+    assert client.config.workspace_id == ""
+
+
+def test_concurrent_first_use_discovers_once(api):
+    client = new_client()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: client.get(ORDERS_ENDPOINT), range(16)))
+    assert results == [{"ok": True}] * 16
+    assert workspace_calls(api) == 1
+
+
+def test_clients_share_cache_until_ttl(api):
+    cache = MemoryWorkspaceCache(ttl=300)
+    with freeze_time("2025-02-13 10:00:00") as frozen:
+        new_client(cache).get(ORDERS_ENDPOINT)
+        new_client(cache).get(ORDERS_ENDPOINT)
+        assert workspace_calls(api) == 1
+
+        frozen.tick(301)
+        new_client(cache).get(ORDERS_ENDPOINT)
+        assert workspace_calls(api) == 2
+
+
+def test_clients_share_the_default_cache(api, default_workspace_cache):
+    new_client().get(ORDERS_ENDPOINT)
+    new_client().get(ORDERS_ENDPOINT)
+    assert workspace_calls(api) == 1
+    assert new_client().config.workspace_cache is default_workspace_cache
+
+
+def test_file_cache_is_keyed_by_client(api, tmp_path):
+    new_client(FileWorkspaceCache(tmp_path)).get(ORDERS_ENDPOINT)
+    new_client(FileWorkspaceCache(tmp_path)).get(ORDERS_ENDPOINT)
+    assert workspace_calls(api) == 1
+
+    other = new_client(FileWorkspaceCache(tmp_path))
+    other.config.client_id = "other"
+    other.workspace_id
+    assert workspace_calls(api) == 2
+
+
+def test_configured_workspace_skips_discovery(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(responses.GET, ORDERS_URL, json={"ok": True})
+    client = new_client(workspace_id=TEST_WORKSPACE_ID)
+    client.get(ORDERS_ENDPOINT)
+    assert workspace_calls(responses) == 0
+
+
+def test_account_without_workspace(responses):
+    responses.add(
+        responses.POST,
+        re.compile(r".*v2/token$"),
+        json={"access_token": "TOKEN", "expires_in": 3600},
+    )
+    responses.add(responses.GET, WORKSPACES_URL, json={"_content": []})
+    client = new_client()
+    with pytest.raises(SantanderClientError, match="Conta sem configuração"):
+        client.get(ORDERS_ENDPOINT)
+    assert client.config.workspace_cache.get(client.config.workspace_cache_key) is None